@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""캘린더 UI 용 집계 출력 (aggregates.json)
+
+프런트엔드가 렌더링할 때마다 예약 목록을 훑지 않도록 날짜별, 지역구별, 예식장별 슬롯
+상태 수와 가장 빠른 예약 가능일을 미리 계산해 둔다. 슬롯별 수는 slots 순서의 배열이다.
+
+    {"format": "aggregates-v1", "lastCrawledAt": "...", "slots": ["L", "D"],
+     "days": {"2026-11-14": {"confirmed": [3, 1], "available": [2, 4]}},
+     "districts": {"마포구": {"facilities": 6, "confirmed": [...], "available": [...],
+                              "firstAvailable": "2026-10-18", "days": {...}}},
+     "facilities": {"4187": {"confirmed": [...], "available": [...], "firstAvailable": "2026-10-18",
+                             "firstAvailableBySlot": {"L": "2026-10-18", "D": "2026-10-25"}}}}
+
+days 에는 예약 정보가 있는 날짜만 들어가고, firstAvailable 은 크롤링한 날 이후 기준이다.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from availability import AVAILABLE, CONFIRMED, AvailabilityMatrix
+
+AGGREGATES_FORMAT = "aggregates-v1"
+
+
+def _day_counts(matrix: AvailabilityMatrix) -> Dict[str, Dict[str, List[int]]]:
+    """날짜별 슬롯 상태 수 (행렬의 (날짜, 슬롯) 열마다 bytes.count)"""
+    width = len(matrix.slots)
+    days = {}
+    for day in range(matrix.days):
+        confirmed = [0] * width
+        available = [0] * width
+        for slot in range(width):
+            column = matrix.column(day, slot)
+            confirmed[slot] = column.count(CONFIRMED)
+            available[slot] = column.count(AVAILABLE)
+        if any(confirmed) or any(available):
+            days[matrix.date_of(day).isoformat()] = {'confirmed': confirmed, 'available': available}
+    return days
+
+
+def _first_available(matrix: AvailabilityMatrix, cells, first_day: int, slot: Optional[int] = None) -> Optional[str]:
+    """행 묶음(cells)에서 first_day 이후 가장 빠른 예약 가능일"""
+    width = len(matrix.slots)
+    best = None
+    for offset in range(0, len(cells), matrix.stride):
+        row = cells[offset:offset + matrix.stride]
+        if slot is None:
+            pos = row.find(AVAILABLE, first_day * width)
+            day = pos // width if pos >= 0 else -1
+        else:
+            day = row[slot::width].find(AVAILABLE, first_day)
+        if day >= 0 and (best is None or day < best):
+            best = day
+    return matrix.date_of(best).isoformat() if best is not None else None
+
+
+def _slot_totals(matrix: AvailabilityMatrix, cells, code: int) -> List[int]:
+    width = len(matrix.slots)
+    return [cells[slot::width].count(code) for slot in range(width)]
+
+
+def build_aggregates(facilities: List[Dict], matrix: AvailabilityMatrix, crawled_at: str) -> Dict:
+    """예식장 목록과 예약 정보 상태 행렬로 집계 생성
+
+    matrix 는 facilities 의 예식장을 모두 축에 넣어 만든 행렬이어야 한다
+    (AvailabilityMatrix.collect(reservations, facilities=[...])).
+    """
+    today = datetime.fromisoformat(crawled_at).date()
+    first_day = max((today - matrix.start).days, 0)
+
+    facility_summaries = {}
+    for row, number in enumerate(matrix.facilities):
+        cells = matrix.cells[row * matrix.stride:(row + 1) * matrix.stride]
+        facility_summaries[number] = {
+            'confirmed': _slot_totals(matrix, cells, CONFIRMED),
+            'available': _slot_totals(matrix, cells, AVAILABLE),
+            'firstAvailable': _first_available(matrix, cells, first_day),
+            'firstAvailableBySlot': {
+                slot: _first_available(matrix, cells, first_day, i) for i, slot in enumerate(matrix.slots)
+            },
+        }
+
+    districts: Dict[str, List[str]] = {}
+    for facility in facilities:
+        districts.setdefault(facility.get('district', ''), []).append(facility['facility_number'])
+    district_summaries = {}
+    for district, numbers in districts.items():
+        sub = matrix.subset(numbers)
+        district_summaries[district] = {
+            'facilities': len(numbers),
+            'confirmed': _slot_totals(sub, sub.cells, CONFIRMED),
+            'available': _slot_totals(sub, sub.cells, AVAILABLE),
+            'firstAvailable': _first_available(sub, sub.cells, first_day),
+            'days': _day_counts(sub),
+        }
+
+    return {
+        'format': AGGREGATES_FORMAT,
+        'lastCrawledAt': crawled_at,
+        'slots': matrix.slots,
+        'days': _day_counts(matrix),
+        'districts': district_summaries,
+        'facilities': facility_summaries,
+    }
+
+
+def write_aggregates(path: str, facilities: List[Dict], matrix: AvailabilityMatrix, crawled_at: str) -> Dict:
+    """집계를 임시 파일에 쓴 뒤 교체"""
+    aggregates = build_aggregates(facilities, matrix, crawled_at)
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(target.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(aggregates, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, target)
+    return aggregates
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+import browser_tuning
+from crawl_scheduler import YearMonth
+from facility_cache import merge_listing_pages
+from fetchers import (FACILITIES_SELECTOR, MAX_LISTING_PAGES, FetchResult, contains_expected, extract_wpnonce,
+                      listing_page_count)
+from html_archive import REPLAY_NONCE
+from stream_writer import NdjsonReservations
+
+logger = logging.getLogger(__name__)
+
+# 순서를 맞추느라 잡아 두는 예식장 결과 수 상한 (워커당)
+REORDER_WINDOW_PER_WORKER = 2
+
+
+class AsyncCrawlEngine:
+    """playwright.async_api 기반 동시 크롤링 엔진
+
+    페이지 풀(여러 컨텍스트에 분산)과 전역/호스트별 동시성 제한을 사용한다.
+    크롤러에 HTTP 페처가 설정되어 있으면 스레드에서 HTTP 로 먼저 가져오고,
+    폴백이 필요할 때만 페이지 풀을 띄운다. 파싱과 저장은 WeddingHallCrawler 의
+    메서드를 그대로 재사용하므로 결과는 동기 크롤러와 동일한 순서로 만들어진다.
+    """
+
+    def __init__(self, crawler, concurrency: int = 8, per_host_concurrency: int = 4,
+                 contexts: int = 2):
+        self.crawler = crawler
+        self.concurrency = max(1, concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.contexts_count = max(1, min(contexts, self.concurrency))
+        # 동기 경로와 같은 요청 속도 조절기를 공유
+        self.throttle = crawler.throttle
+        self.metrics = crawler.metrics
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self.contexts: List[BrowserContext] = []
+        self._page_pool: Optional[asyncio.Queue] = None
+        self._page_contexts: Dict[int, BrowserContext] = {}
+        self._page_request_counts: Dict[int, int] = {}
+        self._memory_probe: Optional[browser_tuning.RendererMemoryProbe] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._global_semaphore: Optional[asyncio.Semaphore] = None
+        # 파싱 워커 풀을 쓸 때 파싱을 기다리는 HTML 수 제한 (페치 전에 자리를 잡음)
+        self._parse_slots: Optional[asyncio.Semaphore] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    async def start(self):
+        """브라우저, 컨텍스트, 페이지 풀 생성 (이미 실행 중이면 무시)"""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.browser:
+                return
+            self.playwright = await async_playwright().start()
+            await self._start_pool()
+
+    async def _start_pool(self):
+        self.browser = await self.playwright.chromium.launch(headless=True)
+        for _ in range(self.contexts_count):
+            context = await self.browser.new_context(
+                user_agent=self.crawler.user_agent,
+                viewport={'width': 1920, 'height': 1080}
+            )
+            if self.crawler.lean_browser:
+                await browser_tuning.install_route_blocking_async(context, self.metrics)
+            self.contexts.append(context)
+
+        self._page_pool = asyncio.Queue()
+        for i in range(self.concurrency):
+            context = self.contexts[i % len(self.contexts)]
+            page = await context.new_page()
+            self._register_page(page, context)
+            self._page_pool.put_nowait(page)
+        session = None
+        if self.crawler.page_memory_limit > 0:
+            try:
+                session = await self.browser.new_browser_cdp_session()
+            except Exception as e:
+                logger.warning(f"브라우저 CDP 세션을 열 수 없습니다: {e}")
+        self._memory_probe = browser_tuning.RendererMemoryProbe(session)
+        logger.info(f"페이지 풀 생성 완료: 컨텍스트 {len(self.contexts)}개, 페이지 {self.concurrency}개")
+
+    async def close(self):
+        """브라우저 종료"""
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+            self._memory_probe = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    def _register_page(self, page: Page, context: BrowserContext):
+        self._page_contexts[id(page)] = context
+        self._page_request_counts[id(page)] = 0
+
+    async def _recycle_page(self, page: Page, reason: str = 'error') -> Page:
+        """페이지 객체 재생성 (메모리 누수 방지, 같은 컨텍스트 재사용)"""
+        context = self._page_contexts.pop(id(page))
+        self._page_request_counts.pop(id(page), None)
+        try:
+            await page.close()
+        except Exception:
+            pass
+        new_page = await context.new_page()
+        self._register_page(new_page, context)
+        self.metrics.inc('page_recycles', engine='async', reason=reason)
+        logger.debug("페이지 새로고침 완료")
+        return new_page
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return self._host_semaphores[host]
+
+    async def fetch_page(self, url: str, selector: str = None, retries: int = 3, expect: str = None) -> Optional[BeautifulSoup]:
+        """페이지를 가져와서 BeautifulSoup 객체로 반환"""
+        result = await self.fetch_html(url, selector=selector, retries=retries, expect=expect)
+        if not result or result.html is None:
+            return None
+        return BeautifulSoup(result.html, 'lxml')
+
+    async def fetch_html(self, url: str, selector: str = None, retries: int = 3, expect: str = None,
+                         headers: Optional[Dict[str, str]] = None) -> Optional[FetchResult]:
+        """페이지 HTML 원문을 FetchResult 로 반환 (HTTP 페처 우선, 필요 시 페이지 풀 폴백)"""
+        if self.crawler.replaying:
+            return self.crawler.archive.replay(url)
+
+        http_fetcher = self.crawler.http_fetcher
+        if http_fetcher:
+            if self._global_semaphore is None:
+                self._global_semaphore = asyncio.Semaphore(self.concurrency)
+            check = expect or selector
+            async with self._host_semaphore(url), self._global_semaphore:
+                result = await asyncio.to_thread(http_fetcher.fetch, url, retries, headers)
+                if not result:
+                    return None
+                if result.not_modified:
+                    return result
+                self.crawler.archive_page(url, result.html, 'http')
+                if not check or contains_expected(result.html, check):
+                    return result
+
+            logger.info(f"HTTP 응답에서 '{check}'를 찾을 수 없어 Playwright로 재시도: {url}")
+            self.crawler.fallback_count += 1
+            self.metrics.inc('fallbacks')
+
+        with self.metrics.span('fetch', source='browser'):
+            content = await self.fetch_html_browser(url, selector, retries)
+        if content is None:
+            return None
+        return FetchResult(url, content, from_browser=True)
+
+    async def fetch_html_browser(self, url: str, selector: str = None, retries: int = 3) -> Optional[str]:
+        """페이지 풀에서 페이지를 빌려 가져온 뒤 HTML 원문으로 반환"""
+        await self.start()
+        async with self._host_semaphore(url):
+            page = await self._page_pool.get()
+            try:
+                # 렌더러 메모리는 풀 전체로 재므로 페이지 수만큼의 한도를 넘으면 가장 많이 이동한 페이지부터
+                # 재생성 (잴 수 없으면 페이지마다 일정 횟수 이동할 때마다)
+                counts = self._page_request_counts
+                counts[id(page)] += 1
+                memory = await self._memory_probe.read_async()
+                if memory is not None:
+                    self.metrics.set('renderer_memory_bytes', memory, engine='async')
+                reason = browser_tuning.recycle_reason(
+                    counts[id(page)], self.crawler.page_recycle_every,
+                    memory, self.crawler.page_memory_limit * 1024 * 1024 * self.concurrency)
+                if reason == 'memory' and counts[id(page)] < max(counts.values()):
+                    reason = None
+                if reason:
+                    page = await self._recycle_page(page, reason=reason)
+
+                for attempt in range(retries):
+                    await self.throttle.acquire_async()
+                    started = time.monotonic()
+                    try:
+                        with self.metrics.span('navigation', engine='async'):
+                            response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                        self.throttle.record(time.monotonic() - started, response.status if response else None)
+                        self.metrics.inc('requests', source='browser',
+                                         status=response.status if response else 'unknown')
+
+                        if selector:
+                            try:
+                                await page.wait_for_selector(selector, timeout=10000)
+                            except Exception:
+                                logger.info(f"셀렉터를 찾을 수 없음: {selector}")
+                                return None
+                        else:
+                            await page.wait_for_selector('body', timeout=10000)
+
+                        with self.metrics.span('content', engine='async'):
+                            content = await page.content()
+                        self.metrics.inc('bytes_downloaded', len(content.encode('utf-8')), source='browser')
+                        self.crawler.archive_page(url, content, 'browser')
+                        return content
+                    except Exception as e:
+                        self.throttle.record_failure('timeout' if 'Timeout' in type(e).__name__ else 'error')
+                        logger.warning(f"페이지 요청 실패 (시도 {attempt + 1}/{retries}): {url}, 에러: {e}")
+                        if "'dict' object" in str(e) or "Target closed" in str(e):
+                            logger.info("페이지 객체 손상 감지, 새로고침 시도...")
+                            page = await self._recycle_page(page)
+                        if attempt < retries - 1:
+                            self.metrics.inc('retries', source='browser')
+                            await asyncio.sleep(self.throttle.backoff(attempt))
+                        else:
+                            logger.error(f"페이지 요청 최종 실패: {url}")
+                            return None
+            finally:
+                self._page_pool.put_nowait(page)
+
+    async def get_all_facilities(self) -> List[Dict]:
+        """예식장 목록 (캐시가 갱신 주기 안이면 캐시, 아니면 목록 페이지에서 새로 가져오기)"""
+        cached = self.crawler.facility_cache.get()
+        if cached is not None:
+            return cached
+        facilities, complete = await self.discover_facilities()
+        return self.crawler.store_facilities(facilities, complete)
+
+    async def discover_facilities(self) -> Tuple[List[Dict], bool]:
+        """1페이지의 페이지네이션 링크로 페이지 수를 알아내서 나머지 페이지 동시 크롤링
+
+        링크가 없으면 페이지네이션 종료 조건 때문에 한 페이지씩 순차로 가져온다.
+        """
+        url = self.crawler.facilities_page_url(1)
+        logger.info(f"페이지 1 크롤링 중... ({url})")
+        result = await self.fetch_html(url, selector=FACILITIES_SELECTOR)
+        if not result:
+            logger.info("페이지 1에 데이터가 없습니다")
+            return [], False
+        first = self.crawler.parse_facilities_html(result.html)
+        logger.info(f"페이지 1: {len(first)}개 발견")
+
+        page_count = listing_page_count(result.html)
+        if page_count is None:
+            return await self.discover_facilities_sequential(first), True
+        page_count = min(page_count, MAX_LISTING_PAGES)
+        pages = list(range(2, page_count + 1))
+        logger.info(f"목록 페이지 {page_count}개, 나머지 {len(pages)}개 페이지 동시 크롤링")
+
+        results = await asyncio.gather(*[
+            self.fetch_html(self.crawler.facilities_page_url(page), selector=FACILITIES_SELECTOR)
+            for page in pages
+        ])
+        listings = [first]
+        for page, result in zip(pages, results):
+            if not result:
+                logger.warning(f"페이지 {page}를 가져오지 못했습니다")
+                continue
+            facilities = self.crawler.parse_facilities_html(result.html)
+            logger.info(f"페이지 {page}: {len(facilities)}개 발견")
+            listings.append(facilities)
+        return merge_listing_pages(listings), all(results)
+
+    async def discover_facilities_sequential(self, first: List[Dict]) -> List[Dict]:
+        """페이지 수를 모를 때 2페이지부터 순서대로 가져오기 (새 예식장이 없는 페이지에서 종료)"""
+        all_facilities = merge_listing_pages([first])
+        seen_facility_numbers = {f['facility_number'] for f in all_facilities}
+
+        for page in range(2, MAX_LISTING_PAGES + 1):
+            url = self.crawler.facilities_page_url(page)
+            logger.info(f"페이지 {page} 크롤링 중... ({url})")
+
+            result = await self.fetch_html(url, selector=FACILITIES_SELECTOR)
+            if not result:
+                logger.info(f"페이지 {page}에 데이터가 없어 페이지네이션 종료")
+                break
+
+            facilities = self.crawler.parse_facilities_html(result.html)
+            if not facilities:
+                logger.info(f"페이지 {page}에서 데이터가 없습니다")
+                continue
+
+            new_count = 0
+            for facility in facilities:
+                if facility['facility_number'] not in seen_facility_numbers:
+                    seen_facility_numbers.add(facility['facility_number'])
+                    all_facilities.append(facility)
+                    new_count += 1
+
+            logger.info(f"페이지 {page}: {new_count}개 발견")
+            if new_count == 0:
+                logger.info("더 이상 새로운 데이터가 없어 페이지네이션 종료")
+                break
+
+        return all_facilities
+
+    async def get_wpnonce(self, facility_number: str, refresh: bool = False) -> Optional[str]:
+        """_wpnonce 값 반환 (캐시에 유효한 값이 없거나 refresh 면 예식장 페이지에서 추출)"""
+        if self.crawler.replaying:
+            return REPLAY_NONCE
+        nonce_cache = self.crawler.wpnonce_cache
+        if not refresh:
+            cached = nonce_cache.get(facility_number)
+            if cached:
+                self.metrics.inc('wpnonce', result='cache')
+                return cached
+
+        with self.metrics.span('wpnonce'):
+            nonce = await self.fetch_wpnonce(facility_number)
+        self.metrics.inc('wpnonce', result='refresh' if refresh else 'fetch')
+        if nonce:
+            nonce_cache.put(facility_number, nonce, refresh=refresh)
+        return nonce
+
+    async def fetch_wpnonce(self, facility_number: str) -> Optional[str]:
+        """예식장 페이지 HTML 원문에서 _wpnonce 값 추출"""
+        url = f"{self.crawler.base_url}/facilities/{facility_number}"
+        result = await self.fetch_html(url)
+        if not result:
+            return None
+
+        nonce = extract_wpnonce(result.html)
+        if not nonce and self.crawler.http_fetcher:
+            logger.info(f"HTTP 응답에서 _wpnonce를 찾을 수 없어 Playwright로 재시도: {url}")
+            self.crawler.fallback_count += 1
+            self.metrics.inc('fallbacks')
+            nonce = extract_wpnonce(await self.fetch_html_browser(url))
+        return nonce
+
+    async def fetch_reservations_for_month(self, facility_number: str, year: int, month: int,
+                                           wpnonce: str) -> Optional[List[Dict]]:
+        """특정 예식장의 특정 월 예약 정보 가져오기 (워커 풀이 있으면 파싱은 이벤트 루프 밖에서 진행, 실패하면 None)"""
+        parse_pool = self.crawler.parse_pool
+        if not parse_pool:
+            return await self._fetch_and_parse(facility_number, year, month, wpnonce)
+        if self._parse_slots is None:
+            self._parse_slots = asyncio.Semaphore(parse_pool.max_pending)
+        async with self._parse_slots:
+            return await self._fetch_and_parse(facility_number, year, month, wpnonce)
+
+    async def _fetch_and_parse(self, facility_number: str, year: int, month: int,
+                               wpnonce: str) -> Optional[List[Dict]]:
+        url = self.crawler.calendar_url(facility_number, year, month, wpnonce)
+        fetch_cache = self.crawler.fetch_cache
+        headers = fetch_cache.conditional_headers(facility_number, year, month) if fetch_cache else None
+        result = await self.fetch_html(url, expect='tbody', headers=headers)
+        if not result:
+            return None
+        return await asyncio.wrap_future(self.crawler.submit_reservations(result, facility_number, year, month))
+
+    async def _crawl_month(self, facility_number: str, year: int, month: int, wpnonce: str) -> Optional[List[Dict]]:
+        """한 달 크롤링 (가져오지 못하면 None, 빈 달은 빈 목록)"""
+        try:
+            reservations = await self.fetch_reservations_for_month(facility_number, year, month, wpnonce)
+            self.crawler.checkpoint_month(facility_number, year, month, reservations)
+            return reservations
+        except Exception as e:
+            logger.error(f"예식장 {facility_number}, {year}-{month} 크롤링 실패: {e}")
+            return None
+
+    async def _crawl_facility(self, facility_number: str, months: List[YearMonth]) -> List[Dict]:
+        # 체크포인트에서 완료된 달은 이어받고 나머지만 가져옴
+        results, pending = self.crawler.split_resumed(facility_number, months)
+        if pending:
+            logger.info(f"예식장 {facility_number} 크롤링 중... ({len(pending)}개월)")
+            await self._crawl_facility_months(facility_number, pending, results)
+        return self.crawler.scheduler.assemble(facility_number, results)
+
+    async def _crawl_facility_months(self, facility_number: str, months: List[YearMonth],
+                                     results: Dict[YearMonth, Optional[List[Dict]]]):
+        wpnonce = await self.get_wpnonce(facility_number)
+        if not wpnonce:
+            logger.warning(f"예식장 {facility_number}: wpnonce를 가져올 수 없습니다")
+            return
+
+        if not self.crawler.wpnonce_cache.is_verified(facility_number):
+            # 이전 실행에서 가져온 nonce 는 첫 달로 먼저 확인하고, 실패하면 한 번만 새로 조회
+            first, months = months[0], months[1:]
+            results[first] = await self._crawl_month(facility_number, *first, wpnonce)
+            if self.crawler.needs_wpnonce_refresh(facility_number, results[first]):
+                logger.info(f"예식장 {facility_number}: 캐시된 wpnonce로 캘린더를 가져오지 못해 새로 조회합니다")
+                wpnonce = await self.get_wpnonce(facility_number, refresh=True)
+                if not wpnonce:
+                    logger.warning(f"예식장 {facility_number}: wpnonce를 가져올 수 없습니다")
+                    return
+                results[first] = await self._crawl_month(facility_number, *first, wpnonce)
+
+        fetched = await asyncio.gather(*[
+            self._crawl_month(facility_number, year, month, wpnonce)
+            for year, month in months
+        ])
+        results.update(zip(months, fetched))
+
+    async def crawl_reservations(self, facility_numbers: List[str]) -> NdjsonReservations:
+        """모든 예식장의 예약 정보 동시 크롤링 (스풀에는 끝난 순서와 관계없이 예식장 → 월 순으로 씀)"""
+        plan = self.crawler.plan_crawl(facility_numbers)
+        logger.info(f"예약 정보 크롤링 시작: {len(facility_numbers)}개 예식장 "
+                    f"(동시성 {self.concurrency}, 호스트당 {self.per_host_concurrency})")
+
+        # 먼저 끝난 예식장은 앞 순서의 예식장이 끝날 때까지만 잡아 두고, 앞 순서 예식장이 오래 걸려도
+        # 잡아 두는 예식장이 window 개를 넘지 않도록 그만큼 앞선 워커는 기다림
+        finished: Dict[int, List[Dict]] = {}
+        next_index = 0
+        window = self.concurrency * REORDER_WINDOW_PER_WORKER
+        advanced = asyncio.Condition()
+
+        # 예식장마다 코루틴을 만들지 않고 --concurrency 개 워커가 목록 순서대로 하나씩 가져감
+        # (코루틴은 next() 사이에 양보하지 않으므로 이터레이터를 그대로 공유해도 됨)
+        pending = iter(enumerate(facility_numbers))
+
+        async def worker():
+            nonlocal next_index
+            for index, facility_number in pending:
+                # next_index 를 가진 워커는 항상 통과하므로 서로 기다리다 멈추지 않음
+                async with advanced:
+                    await advanced.wait_for(lambda: index < next_index + window)
+                finished[index] = await self._crawl_facility(facility_number, plan[facility_number])
+                if next_index not in finished:
+                    continue
+                while next_index in finished:
+                    self.crawler.stream_reservations(finished.pop(next_index))
+                    next_index += 1
+                async with advanced:
+                    advanced.notify_all()
+
+        await asyncio.gather(*[worker() for _ in range(min(self.concurrency, len(facility_numbers)))])
+        reservations = self.crawler.spool.finish()
+
+        logger.info(f"예약 정보 크롤링 완료: 총 {len(reservations)}건")
+        return reservations
+
+    async def run(self):
+        """크롤링 실행"""
+        logger.info("예식장 목록 크롤링 시작 (async 엔진)")
+
+        # HTTP 페처는 폴백이 필요할 때만 브라우저를 실행 (재생 모드는 브라우저 없음)
+        if not self.crawler.http_fetcher and not self.crawler.replaying:
+            await self.start()
+
+        try:
+            with self.metrics.span('phase', phase='get_all_facilities'):
+                facilities = await self.get_all_facilities()
+            logger.info(f"총 {len(facilities)}개 예식장 발견")
+
+            if facilities:
+                self.crawler.print_facilities(facilities)
+
+                logger.info("\n예약 정보 크롤링 시작")
+                facility_numbers = self.crawler.select_facilities(facilities)
+                with self.metrics.span('phase', phase='crawl_reservations'):
+                    reservations = await self.crawl_reservations(facility_numbers)
+
+                with self.metrics.span('phase', phase='save_outputs'):
+                    self.crawler.save_results(facilities, facility_numbers, reservations)
+                self.crawler.complete_checkpoint()
+            else:
+                logger.warning("파싱된 데이터가 없습니다")
+
+            if self.crawler.http_fetcher:
+                logger.info(f"Playwright 폴백 횟수: {self.crawler.fallback_count}")
+
+        except Exception as e:
+            logger.error(f"크롤링 중 에러 발생: {e}")
+            raise
+        finally:
+            self.crawler.save_state()
+            await self.close()
+            if self.crawler.http_fetcher:
+                self.crawler.http_fetcher.close()
+            self.crawler.close_pipeline()
+            self.crawler.export_metrics()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""예식장 × 날짜 × 슬롯 상태 행렬
+
+data.json 의 reservations 는 슬롯마다 facility_number, 날짜 문자열, time_slot, status 를
+반복하는 dict 다. AvailabilityMatrix 는 예식장, 날짜, 슬롯을 정수 인덱스로 바꾸고 상태를
+1바이트 코드로 담은 bytearray 하나로 표현한다.
+
+    cells[(facility * days + day) * len(slots) + slot] = 상태 코드
+
+날짜 축은 첫 날짜부터 마지막 날짜까지 빠짐없이 이어지고, 예약 정보가 없는 칸은 NONE 이다.
+같은 슬롯이 여러 번 나오면 confirmed 가 우선한다 (changelog.index_reservations 와 같음).
+행/열 비교와 개수 세기는 bytes 연산으로 처리하므로 dict 를 하나씩 도는 것보다 훨씬 빠르다.
+"""
+
+from datetime import date, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from month_shards import BASE_SLOTS, slot_order
+
+NONE = 0
+CONFIRMED = 1
+AVAILABLE = 2
+
+STATUSES = {CONFIRMED: 'confirmed', AVAILABLE: 'available'}
+STATUS_CODES = {status: code for code, status in STATUSES.items()}
+
+SlotKey = Tuple[str, str, str]
+
+
+def _axes(reservations: List[Dict], facilities: Optional[List[str]], start: Optional[date], end: Optional[date],
+          slots: Optional[List[str]]) -> Tuple[List[str], date, date, List[str]]:
+    """예약 정보와 주어진 축을 모두 포함하는 (예식장, 첫 날짜, 마지막 날짜, 슬롯) 축"""
+    numbers = dict.fromkeys(facilities or [])
+    slot_names = set(slots or BASE_SLOTS)
+    first = last = None
+    for r in reservations:
+        numbers.setdefault(r['facility_number'])
+        slot_names.add(r['time_slot'])
+        # ISO 날짜 문자열은 문자열 비교와 날짜 비교 순서가 같음
+        day = r['reservation_date']
+        if first is None or day < first:
+            first = day
+        if last is None or day > last:
+            last = day
+
+    if first is not None:
+        start = min(start, date.fromisoformat(first)) if start else date.fromisoformat(first)
+        end = max(end, date.fromisoformat(last)) if end else date.fromisoformat(last)
+    start = start or end or date.today()
+    end = end or start
+    return list(numbers), start, end, sorted(slot_names, key=slot_order)
+
+
+def _batches(items: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class AvailabilityMatrix:
+    """facility × day × slot 상태 코드 행렬"""
+
+    def __init__(self, facilities: List[str], start: date, days: int, slots: List[str],
+                 cells: Optional[bytearray] = None):
+        self.facilities = list(facilities)
+        self.facility_index = {number: i for i, number in enumerate(self.facilities)}
+        self.start = start
+        self.days = days
+        self.slots = list(slots)
+        self.slot_index = {slot: i for i, slot in enumerate(self.slots)}
+        # 예식장 하나가 차지하는 칸 수
+        self.stride = days * len(self.slots)
+        self.cells = cells if cells is not None else bytearray(len(self.facilities) * self.stride)
+
+    @classmethod
+    def from_reservations(cls, reservations: List[Dict], facilities: Optional[List[str]] = None,
+                          start: Optional[date] = None, end: Optional[date] = None,
+                          slots: Optional[List[str]] = None) -> "AvailabilityMatrix":
+        """data.json reservations 로 행렬 생성 (축을 주지 않으면 예약 정보에서 정함)
+
+        facilities, start/end, slots 를 주면 그 범위를 포함하도록 축을 넓힌다. 다른 행렬과
+        축을 맞출 때 사용한다.
+        """
+        numbers, start, end, slot_names = _axes(reservations, facilities, start, end, slots)
+        matrix = cls(numbers, start, (end - start).days + 1, slot_names)
+        matrix.update(reservations)
+        return matrix
+
+    @classmethod
+    def collect(cls, reservations: Iterable[Dict], facilities: Optional[List[str]] = None,
+                batch_size: int = 4096) -> "AvailabilityMatrix":
+        """예약 정보를 batch_size 건씩 읽으며 행렬 생성 (from_reservations 와 같은 결과)
+
+        이터러블을 한 번만 순회하고 전체 목록을 만들지 않으므로 NDJSON 스풀이나 이전 data.json
+        (stream_writer.SnapshotReader) 을 그대로 넘길 수 있다. 조각마다 축 밖의 날짜나 슬롯이
+        나오면 축을 넓히고, 새 예식장은 행을 덧붙인다.
+        """
+        matrix = None
+        for batch in _batches(reservations, batch_size):
+            if matrix is None:
+                matrix = cls.from_reservations(batch, facilities=facilities)
+                continue
+            end = matrix.date_of(matrix.days - 1)
+            numbers, start, new_end, slots = _axes(batch, matrix.facilities, matrix.start, end, matrix.slots)
+            if start != matrix.start or new_end != end or slots != matrix.slots:
+                matrix = matrix.reshaped(matrix.facilities, start, new_end, slots)
+            matrix.add_facilities(numbers[len(matrix.facilities):])
+            matrix.update(batch)
+        return matrix if matrix is not None else cls.from_reservations([], facilities=facilities)
+
+    def add_facilities(self, facilities: Iterable[str]):
+        """없는 예식장을 빈 행으로 덧붙임"""
+        added = 0
+        for number in facilities:
+            if number not in self.facility_index:
+                self.facility_index[number] = len(self.facilities)
+                self.facilities.append(number)
+                added += 1
+        self.cells.extend(bytes(added * self.stride))
+
+    def update(self, reservations: List[Dict]):
+        """예약 정보를 행렬에 기록 (축 밖의 예식장/날짜/슬롯은 KeyError/IndexError)"""
+        cells = self.cells
+        stride = self.stride
+        width = len(self.slots)
+        start = self.start.toordinal()
+        day_cache: Dict[str, int] = {}
+        for r in reservations:
+            day_str = r['reservation_date']
+            day = day_cache.get(day_str)
+            if day is None:
+                day = day_cache[day_str] = date.fromisoformat(day_str).toordinal() - start
+                if not 0 <= day < self.days:
+                    raise IndexError(f"행렬 범위 밖의 날짜: {day_str}")
+            pos = self.facility_index[r['facility_number']] * stride + day * width + self.slot_index[r['time_slot']]
+            code = STATUS_CODES[r['status']]
+            # 같은 슬롯이 중복되면 confirmed(1) 우선
+            if cells[pos] == NONE or code < cells[pos]:
+                cells[pos] = code
+
+    def date_of(self, day: int) -> date:
+        return self.start + timedelta(days=day)
+
+    def day_of(self, value: str) -> int:
+        """'YYYY-MM-DD' 의 날짜 인덱스 (범위 밖이면 -1)"""
+        day = date.fromisoformat(value).toordinal() - self.start.toordinal()
+        return day if 0 <= day < self.days else -1
+
+    def _key(self, pos: int) -> SlotKey:
+        facility, rest = divmod(pos, self.stride)
+        day, slot = divmod(rest, len(self.slots))
+        return self.facilities[facility], self.date_of(day).isoformat(), self.slots[slot]
+
+    def __iter__(self) -> Iterator[Tuple[SlotKey, int]]:
+        """비어 있지 않은 칸의 ((facility_number, 날짜, 슬롯), 상태 코드) (예식장 → 날짜 → 슬롯 순)"""
+        cells = self.cells
+        for facility, number in enumerate(self.facilities):
+            offset = facility * self.stride
+            row = cells[offset:offset + self.stride]
+            if row.count(NONE) == self.stride:
+                continue
+            width = len(self.slots)
+            for i, code in enumerate(row):
+                if code:
+                    day, slot = divmod(i, width)
+                    yield (number, self.date_of(day).isoformat(), self.slots[slot]), code
+
+    def to_reservations(self) -> List[Dict]:
+        """data.json reservations 형식으로 변환 (예식장 → 날짜 → 슬롯 순)"""
+        return [
+            {'facility_number': number, 'reservation_date': day, 'time_slot': slot, 'status': STATUSES[code]}
+            for (number, day, slot), code in self
+        ]
+
+    def __len__(self) -> int:
+        """비어 있지 않은 칸 수"""
+        return len(self.cells) - self.cells.count(NONE)
+
+    def status(self, facility_number: str, value: str, slot: str) -> Optional[str]:
+        facility = self.facility_index.get(facility_number)
+        day = self.day_of(value)
+        if facility is None or day < 0 or slot not in self.slot_index:
+            return None
+        code = self.cells[facility * self.stride + day * len(self.slots) + self.slot_index[slot]]
+        return STATUSES.get(code)
+
+    def column(self, day: int, slot: int) -> bytearray:
+        """(날짜, 슬롯) 하나의 예식장별 상태 코드"""
+        return self.cells[day * len(self.slots) + slot::self.stride]
+
+    def facilities_with(self, value: str, code: int = AVAILABLE, slot: Optional[str] = None) -> List[str]:
+        """해당 날짜(와 슬롯)에 code 상태인 슬롯이 있는 예식장"""
+        day = self.day_of(value)
+        if day < 0 or (slot is not None and slot not in self.slot_index):
+            return []
+        slots = [self.slot_index[slot]] if slot is not None else range(len(self.slots))
+        found = set()
+        for s in slots:
+            column = self.column(day, s)
+            i = column.find(code)
+            while i >= 0:
+                found.add(i)
+                i = column.find(code, i + 1)
+        return [self.facilities[i] for i in sorted(found)]
+
+    def count(self, code: int) -> int:
+        return self.cells.count(code)
+
+    def daily_counts(self, code: int = AVAILABLE) -> List[int]:
+        """날짜별 code 상태 슬롯 수"""
+        width = len(self.slots)
+        return [sum(self.column(day, s).count(code) for s in range(width)) for day in range(self.days)]
+
+    def subset(self, facilities: List[str]) -> "AvailabilityMatrix":
+        """일부 예식장 행만 모은 사본 (날짜/슬롯 축은 그대로, 없는 예식장은 빈 행)"""
+        target = AvailabilityMatrix(facilities, self.start, self.days, self.slots)
+        for i, number in enumerate(target.facilities):
+            facility = self.facility_index.get(number)
+            if facility is not None:
+                offset = facility * self.stride
+                target.cells[i * self.stride:(i + 1) * self.stride] = self.cells[offset:offset + self.stride]
+        return target
+
+    def aligned(self, other: "AvailabilityMatrix") -> Tuple["AvailabilityMatrix", "AvailabilityMatrix"]:
+        """두 행렬을 같은 축(합집합)으로 맞춘 사본 (이미 같으면 그대로)"""
+        if (self.facilities == other.facilities and self.start == other.start
+                and self.days == other.days and self.slots == other.slots):
+            return self, other
+        facilities = self.facilities + [n for n in other.facilities if n not in self.facility_index]
+        start = min(self.start, other.start)
+        end = max(self.date_of(self.days - 1), other.date_of(other.days - 1))
+        slots = sorted(set(self.slots) | set(other.slots), key=slot_order)
+        return self.reshaped(facilities, start, end, slots), other.reshaped(facilities, start, end, slots)
+
+    def reshaped(self, facilities: List[str], start: date, end: date, slots: List[str]) -> "AvailabilityMatrix":
+        """더 넓은 축으로 옮긴 사본"""
+        target = AvailabilityMatrix(facilities, start, (end - start).days + 1, slots)
+        shift = (self.start - start).days
+        slot_map = [target.slot_index[slot] for slot in self.slots]
+        width = len(self.slots)
+        target_width = len(slots)
+        for facility, number in enumerate(self.facilities):
+            offset = facility * self.stride
+            row = self.cells[offset:offset + self.stride]
+            base = target.facility_index[number] * target.stride
+            if width == target_width and slot_map == list(range(width)):
+                # 슬롯 축이 같으면 한 행을 통째로 복사
+                begin = base + shift * width
+                target.cells[begin:begin + len(row)] = row
+                continue
+            for i, code in enumerate(row):
+                if code:
+                    day, slot = divmod(i, width)
+                    target.cells[base + (day + shift) * target_width + slot_map[slot]] = code
+        return target
+
+    def diff(self, previous: "AvailabilityMatrix") -> Dict[str, List[SlotKey]]:
+        """previous 대비 변경분 (changelog.diff_reservations 와 같은 형식과 의미)"""
+        after, before = self.aligned(previous)
+        opened: List[SlotKey] = []
+        confirmed: List[SlotKey] = []
+        disappeared: List[SlotKey] = []
+        if after.cells != before.cells:
+            stride = after.stride
+            for facility in range(len(after.facilities)):
+                offset = facility * stride
+                old = before.cells[offset:offset + stride]
+                new = after.cells[offset:offset + stride]
+                # 바뀐 예식장 행만 칸 단위로 비교
+                if old == new:
+                    continue
+                for i, (a, b) in enumerate(zip(old, new)):
+                    if a == b:
+                        continue
+                    key = after._key(offset + i)
+                    if b == NONE:
+                        disappeared.append(key)
+                    elif b == CONFIRMED:
+                        confirmed.append(key)
+                    else:
+                        opened.append(key)
+        return {
+            'opened': sorted(opened),
+            'confirmed': sorted(confirmed),
+            'disappeared': sorted(disappeared),
+        }
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""parse_calendar / parse_facilities 벤치마크 (bs4 엔진과 lxml 엔진 비교)"""
+
+import pytest
+
+import fake_site
+from conftest import HORIZON_YEARS
+
+PARSERS = ["bs4", "lxml"]
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def bench_parse_calendar_recorded(benchmark, crawler, report, recorded_tbody, parser):
+    """저장된 실제 캘린더 tbody (calendar_tbody.html)"""
+    crawler.parser = parser
+    html = f"<table>{recorded_tbody}</table>"
+
+    def run():
+        return crawler.parse_calendar_html(html, "4187", 2026, 4)
+
+    reservations = benchmark(run)
+    report(benchmark, run, pages=1, reservations=len(reservations))
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def bench_parse_calendar_archive(benchmark, crawler, report, archived_calendars, parser):
+    """크롤러 --archive 로 기록한 실제 캘린더 페이지 (BENCH_ARCHIVE 지정 시)"""
+    crawler.parser = parser
+
+    def run():
+        total = 0
+        for facility_number, year, month, html in archived_calendars:
+            total += len(crawler.parse_calendar_html(html, facility_number, year, month))
+        return total
+
+    reservations = benchmark.pedantic(run, rounds=5, iterations=1, warmup_rounds=1)
+    report(benchmark, run, pages=len(archived_calendars), reservations=reservations)
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def bench_parse_calendar_horizon(benchmark, crawler, report, parser):
+    """전체 페이지 크기의 합성 캘린더, 여러 해에 걸친 월별 페이지"""
+    crawler.parser = parser
+    facility = fake_site.synthetic_facilities(1)[0]
+    months = [(2026 + i // 12, i % 12 + 1) for i in range(12 * HORIZON_YEARS)]
+    pages = [(year, month, fake_site.render_calendar_page(facility, year, month, "nonce"))
+             for year, month in months]
+
+    def run():
+        total = 0
+        for year, month, html in pages:
+            total += len(crawler.parse_calendar_html(html, facility["facility_number"], year, month))
+        return total
+
+    reservations = benchmark.pedantic(run, rounds=5, iterations=1, warmup_rounds=1)
+    report(benchmark, run, pages=len(pages), reservations=reservations)
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def bench_parse_facilities_scaled(benchmark, crawler, report, scaled_facilities, parser):
+    """수백 개 예식장이 들어 있는 목록 페이지"""
+    crawler.parser = parser
+    html = fake_site.render_listing_page(scaled_facilities)
+
+    def run():
+        return crawler.parse_facilities_html(html)
+
+    facilities = benchmark(run)
+    assert len(facilities) == len(scaled_facilities)
+    report(benchmark, run, pages=1)
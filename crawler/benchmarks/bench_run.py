@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""run() 전체 벤치마크 (네트워크 없이 프로세스 안의 FakeSite 로 크롤링)"""
+
+import json
+
+import pytest
+
+import fake_site
+from conftest import RUN_FACILITIES
+from crawler import WeddingHallCrawler
+
+
+@pytest.mark.parametrize("parser", ["bs4", "lxml"])
+def bench_full_run(benchmark, tmp_path, report, parser):
+    site = fake_site.FakeSite(fake_site.synthetic_facilities(RUN_FACILITIES))
+    json_path = tmp_path / "data.json"
+    stats = {}
+
+    def new_crawler():
+        # 스케줄, nonce 캐시, 예식장 목록이 메모리에 남아 다음 라운드의 요청이 줄지 않도록 라운드마다 새로 만듦
+        crawler = WeddingHallCrawler(json_path=str(json_path), parser=parser)
+        crawler.http_fetcher = fake_site.FakeSiteFetcher(site)
+        return (crawler,), {}
+
+    def run(crawler):
+        crawler.run()
+        stats.setdefault("pages", set()).add(crawler.http_fetcher.requests)
+        stats["bytes"] = crawler.http_fetcher.bytes
+
+    benchmark.pedantic(run, setup=new_crawler, rounds=3, iterations=1)
+    # 라운드마다 같은 작업량이어야 pages/s 가 의미 있음
+    assert len(stats["pages"]) == 1
+
+    with open(json_path, encoding="utf-8") as f:
+        reservations = len(json.load(f)["reservations"])
+    assert reservations > 0
+    report(benchmark, lambda: run(*new_crawler()[0]), pages=stats["pages"].pop(), reservations=reservations)
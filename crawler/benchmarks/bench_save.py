@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""save_to_json 벤치마크 (수백 개 예식장 x 여러 해 분량의 예약 정보)"""
+
+import fake_site
+from conftest import HORIZON_YEARS
+
+
+def _scaled_reservations(facilities, years):
+    reservations = []
+    for facility in facilities:
+        for i in range(12 * years):
+            year, month = 2026 + i // 12, i % 12 + 1
+            for day, slots in fake_site.slot_states(facility["facility_number"], year, month).items():
+                for slot, status in slots:
+                    if status != "unavailable":
+                        reservations.append({
+                            "facility_number": facility["facility_number"],
+                            "reservation_date": f"{year}-{month:02d}-{day:02d}",
+                            "time_slot": slot,
+                            "status": status,
+                        })
+    return reservations
+
+
+def bench_save_to_json_scaled(benchmark, crawler, report, scaled_facilities):
+    reservations = _scaled_reservations(scaled_facilities, HORIZON_YEARS)
+
+    def run():
+        crawler.save_to_json(scaled_facilities, reservations)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    report(benchmark, run, reservations=len(reservations))
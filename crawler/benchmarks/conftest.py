@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""오프라인 벤치마크 공용 픽스처와 처리량/메모리 리포트
+
+처리량(pages/s, reservations/s)과 최대 메모리는 benchmark.extra_info 에 기록되고,
+세션이 끝나면 같은 기계에서 --bench-save-reference 로 저장해 둔 기준 결과와 비교한 표를 출력한다.
+처리량은 기계마다 크게 다르므로 기준 파일은 커밋하지 않고, 다른 기계나 다른 입력 규모에서
+기록된 기준과는 비교하지 않는다. --bench-fail-on-regression 을 주면 기준보다 나빠진 항목이
+있을 때 실패로 끝난다.
+
+    git stash && python -m pytest benchmarks --bench-save-reference && git stash pop
+    python -m pytest benchmarks --bench-fail-on-regression
+"""
+
+import json
+import logging
+import os
+import platform
+import re
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import pytest
+
+CRAWLER_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CRAWLER_DIR))
+
+from crawler import WeddingHallCrawler  # noqa: E402
+import fake_site  # noqa: E402
+
+DEFAULT_REFERENCE_PATH = Path(__file__).resolve().parent / ".reference.json"
+FIXTURE_TBODY = CRAWLER_DIR / "calendar_tbody.html"
+CALENDAR_KEY = re.compile(r'^/facilities/(\d+)\?to=(\d+)-(\d+)$')
+
+# 합성 입력 규모 (환경 변수로 조정 가능)
+SCALED_FACILITIES = int(os.environ.get("BENCH_FACILITIES", "300"))
+HORIZON_YEARS = int(os.environ.get("BENCH_HORIZON_YEARS", "3"))
+RUN_FACILITIES = int(os.environ.get("BENCH_RUN_FACILITIES", "20"))
+# 크롤러 --archive 로 기록한 아카이브 (지정하면 기록된 실제 캘린더 페이지로도 측정)
+ARCHIVE_DIR = os.environ.get("BENCH_ARCHIVE")
+
+_results: Dict[str, Dict] = {}
+_problems: List[str] = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("crawler-bench")
+    group.addoption("--bench-reference", default=str(DEFAULT_REFERENCE_PATH),
+                    help="같은 기계에서 기록한 기준 결과 파일 (기본 benchmarks/.reference.json, 커밋하지 않음)")
+    group.addoption("--bench-save-reference", action="store_true",
+                    help="이번 결과를 기준 결과 파일로 저장 (변경 전 트리에서 실행)")
+    group.addoption("--bench-fail-on-regression", action="store_true",
+                    help="기준 대비 처리량 감소/메모리 증가가 허용치를 넘으면 실패")
+    group.addoption("--bench-tolerance", type=float, default=0.25,
+                    help="허용 변화율 (기본 0.25 = 25%%)")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def quiet_logging():
+    # 크롤러 INFO 로그가 측정에 섞이지 않도록 억제
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+@pytest.fixture
+def crawler(tmp_path) -> WeddingHallCrawler:
+    return WeddingHallCrawler(json_path=str(tmp_path / "data.json"))
+
+
+@pytest.fixture(scope="session")
+def recorded_tbody() -> str:
+    return FIXTURE_TBODY.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def archived_calendars() -> List[Tuple[str, int, int, str]]:
+    """아카이브에 기록된 캘린더 페이지 (facility_number, year, month, html), URL 마다 가장 최근 기록"""
+    if not ARCHIVE_DIR:
+        pytest.skip("BENCH_ARCHIVE 가 지정되지 않았습니다")
+    from html_archive import HtmlArchive
+    archive = HtmlArchive(ARCHIVE_DIR, mode="replay")
+    pages = []
+    for url, entry in sorted(archive.entries.items()):
+        match = CALENDAR_KEY.match(url)
+        if match:
+            pages.append((match.group(1), int(match.group(2)), int(match.group(3)), archive.read(entry["sha256"])))
+    if not pages:
+        pytest.skip(f"아카이브에 캘린더 페이지가 없습니다: {ARCHIVE_DIR}")
+    return pages
+
+
+@pytest.fixture(scope="session")
+def scaled_facilities() -> List[Dict]:
+    return fake_site.synthetic_facilities(SCALED_FACILITIES)
+
+
+def peak_memory(fn: Callable) -> int:
+    """fn 을 한 번 실행하는 동안의 최대 할당 바이트 (tracemalloc)"""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def report(request):
+    """처리량과 최대 메모리를 기록하는 헬퍼: report(benchmark, fn, pages=, reservations=)"""
+    def _report(benchmark, fn: Callable, pages: int = 0, reservations: int = 0):
+        # --benchmark-disable 이면 한 번만 실행하고 통계가 없으므로 기록하지 않음
+        if benchmark.stats is None:
+            return
+        mean = benchmark.stats.stats.mean
+        entry = {
+            "pages_per_s": pages / mean if pages else None,
+            "reservations_per_s": reservations / mean if reservations else None,
+            "peak_mib": peak_memory(fn) / (1024 * 1024),
+        }
+        benchmark.extra_info.update(entry)
+        _results[request.node.name] = entry
+    return _report
+
+
+def _environment() -> Dict:
+    """기준 결과를 비교할 수 있는 조건 (기계와 합성 입력 규모가 같아야 함)"""
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "scale": [SCALED_FACILITIES, HORIZON_YEARS, RUN_FACILITIES],
+    }
+
+
+def _compare(name: str, current: Dict, reference: Dict, tolerance: float) -> List[str]:
+    problems = []
+    for key in ("pages_per_s", "reservations_per_s"):
+        if current.get(key) and reference.get(key) and current[key] < reference[key] * (1 - tolerance):
+            problems.append(f"{name}: {key} {current[key]:.1f} < 기준 {reference[key]:.1f}")
+    if reference.get("peak_mib") and current["peak_mib"] > reference["peak_mib"] * (1 + tolerance):
+        problems.append(f"{name}: peak_mib {current['peak_mib']:.2f} > 기준 {reference['peak_mib']:.2f}")
+    return problems
+
+
+def _fmt(value) -> str:
+    return f"{value:,.1f}" if value else "-"
+
+
+def _load_reference(config) -> Tuple[Dict, str]:
+    """(비교할 기준 결과, 비교하지 않는 이유) 반환"""
+    path = Path(config.getoption("--bench-reference"))
+    if not path.exists():
+        return {}, f"기준 결과가 없습니다 ({path}, 변경 전 트리에서 --bench-save-reference 로 저장)"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("environment") != _environment():
+        return {}, f"기준 결과가 다른 기계나 입력 규모에서 기록되어 비교하지 않습니다 ({path})"
+    return data.get("results", {}), ""
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _results:
+        return
+
+    config = session.config
+    reference, _ = _load_reference(config)
+    if config.getoption("--bench-save-reference"):
+        path = Path(config.getoption("--bench-reference"))
+        # 일부 벤치마크만 실행했으면 나머지 기준은 유지
+        results = dict(reference, **_results)
+        path.write_text(json.dumps({"environment": _environment(), "results": results}, indent=2, sort_keys=True)
+                        + "\n", encoding="utf-8")
+        return
+
+    tolerance = config.getoption("--bench-tolerance")
+    for name, entry in sorted(_results.items()):
+        _problems.extend(_compare(name, entry, reference.get(name, {}), tolerance))
+    if _problems and config.getoption("--bench-fail-on-regression"):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _results:
+        return
+
+    tr = terminalreporter
+    tr.section("crawler throughput")
+    if config.getoption("--bench-save-reference"):
+        # sessionfinish 에서 이번 결과를 저장했으므로 비교 대상이 없음
+        reference, note = {}, f"기준 결과 저장: {config.getoption('--bench-reference')}"
+    else:
+        reference, note = _load_reference(config)
+    tr.write_line(f"{'benchmark':<48} {'pages/s':>12} {'resv/s':>14} {'peak MiB':>10}  vs reference")
+    for name, entry in sorted(_results.items()):
+        base = reference.get(name, {})
+        delta = ""
+        if base.get("pages_per_s") and entry["pages_per_s"]:
+            delta = f"{(entry['pages_per_s'] / base['pages_per_s'] - 1) * 100:+.0f}% pages/s"
+        elif base.get("reservations_per_s") and entry["reservations_per_s"]:
+            delta = f"{(entry['reservations_per_s'] / base['reservations_per_s'] - 1) * 100:+.0f}% resv/s"
+        tr.write_line(f"{name:<48} {_fmt(entry['pages_per_s']):>12} {_fmt(entry['reservations_per_s']):>14} "
+                      f"{entry['peak_mib']:>10.2f}  {delta}")
+
+    for problem in _problems:
+        tr.write_line(f"REGRESSION {problem}", red=True)
+    if note:
+        tr.write_line(note)
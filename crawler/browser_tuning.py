@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Playwright 경량 모드 (리소스 차단)와 페이지 재생성 기준
+
+경량 모드는 context.route 로 파서가 보지 않는 리소스(이미지, 폰트, 스타일시트 등)와
+알려진 분석/광고 호스트로 가는 요청을 중단시킨다. 브라우저 경로는 스크립트로 렌더링되는
+내용을 가져오기 위한 폴백이므로 문서, 스크립트, XHR/fetch 는 그대로 둔다.
+
+페이지는 렌더러 프로세스 메모리가 한도를 넘으면 새로 만든다. 렌더러 pid 는 브라우저 CDP 세션의
+SystemInfo.getProcessInfo 로 얻고 RSS 는 psutil(있으면) 또는 /proc 에서 읽는다. 메모리를 잴 수
+없으면(CDP 나 RSS 를 읽을 수 없는 환경) 이동 횟수로 재생성한다.
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+try:
+    import psutil
+except ImportError:  # psutil 이 없으면 /proc 에서 읽음 (Linux)
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+BLOCKED_RESOURCE_TYPES = frozenset({
+    'image', 'media', 'font', 'stylesheet', 'texttrack', 'manifest', 'eventsource', 'websocket', 'ping',
+})
+
+ANALYTICS_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'doubleclick.net',
+    'facebook.net',
+    'connect.facebook.com',
+    'wcs.naver.net',
+    'wcs.naver.com',
+    'analytics.naver.com',
+    'hotjar.com',
+    'clarity.ms',
+)
+
+# 페이지당 렌더러 메모리 한도 (MB, 0 이면 이동 횟수로만 재생성)
+# JS 힙(performance.memory)은 이동할 때마다 새 문서로 초기화되어 누적되는 메모리를 보여주지 못하므로
+# 페이지 밖에서 렌더러 프로세스의 RSS 를 잰다.
+PAGE_MEMORY_LIMIT_MB = 512
+
+# 메모리를 잴 수 없을 때 쓰는 재생성 주기 (페이지당 이동 횟수, 0 이면 오류가 났을 때만 재생성)
+# 50 은 기존 크롤러가 쓰던 값이다.
+PAGE_RECYCLE_NAVIGATIONS = 50
+
+def is_analytics_host(url: str) -> bool:
+    host = urlparse(url).hostname or ''
+    return any(host == blocked or host.endswith('.' + blocked) for blocked in ANALYTICS_HOSTS)
+
+
+def process_rss(pid: int) -> Optional[int]:
+    """프로세스 RSS (바이트), 읽을 수 없으면 None"""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return None
+    try:
+        with open(f'/proc/{pid}/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def renderer_pids(process_info: Dict) -> List[int]:
+    """SystemInfo.getProcessInfo 결과에서 렌더러 프로세스 pid"""
+    return [p['id'] for p in process_info.get('processInfo', []) if p.get('type') == 'renderer']
+
+
+def renderer_memory(process_info: Dict) -> Optional[int]:
+    """렌더러 프로세스 RSS 합 (바이트), 하나도 읽을 수 없으면 None"""
+    sizes = [rss for rss in map(process_rss, renderer_pids(process_info)) if rss is not None]
+    return sum(sizes) if sizes else None
+
+
+def recycle_reason(navigations: int, every: int, memory: Optional[int], limit: int) -> Optional[str]:
+    """페이지를 새로 만들어야 하면 이유('memory' / 'navigations'), 아니면 None
+
+    memory 는 렌더러 메모리(바이트), limit 은 한도(바이트)다. 메모리를 잴 수 있고 한도가 있으면
+    메모리로만 판단하고, 아니면 이동 횟수가 every 에 도달했는지로 판단한다 (every 가 0 이면 하지 않음).
+    """
+    if memory is not None and limit > 0:
+        return 'memory' if memory > limit else None
+    if every > 0 and navigations >= every:
+        return 'navigations'
+    return None
+
+
+class RendererMemoryProbe:
+    """브라우저 CDP 세션으로 렌더러 프로세스 메모리를 재는 도구 (동기/async 세션 모두)
+
+    session 이 None 이거나 한 번이라도 잴 수 없으면 이후에는 None 을 돌려주므로 호출하는 쪽은
+    이동 횟수로 재생성한다.
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    def _measure(self, process_info: Optional[Dict]) -> Optional[int]:
+        memory = renderer_memory(process_info) if process_info is not None else None
+        if memory is None:
+            logger.warning("렌더러 메모리를 잴 수 없어 이동 횟수로 페이지를 재생성합니다")
+            self.session = None
+        return memory
+
+    def read(self) -> Optional[int]:
+        """동기 CDPSession 으로 렌더러 메모리(바이트) 측정"""
+        if self.session is None:
+            return None
+        try:
+            process_info = self.session.send('SystemInfo.getProcessInfo')
+        except Exception as e:
+            logger.warning(f"SystemInfo.getProcessInfo 실패: {e}")
+            process_info = None
+        return self._measure(process_info)
+
+    async def read_async(self) -> Optional[int]:
+        """async CDPSession 으로 렌더러 메모리(바이트) 측정"""
+        if self.session is None:
+            return None
+        try:
+            process_info = await self.session.send('SystemInfo.getProcessInfo')
+        except Exception as e:
+            logger.warning(f"SystemInfo.getProcessInfo 실패: {e}")
+            process_info = None
+        return self._measure(process_info)
+
+
+def should_block(resource_type: str, url: str) -> bool:
+    """경량 모드에서 중단할 요청인지 여부"""
+    return resource_type in BLOCKED_RESOURCE_TYPES or is_analytics_host(url)
+
+
+def install_route_blocking(context, metrics):
+    """동기 BrowserContext 에 리소스 차단 라우트 등록 (이후 만드는 페이지에도 적용)"""
+    def handle(route):
+        request = route.request
+        if should_block(request.resource_type, request.url):
+            metrics.inc('blocked_requests', resource_type=request.resource_type)
+            route.abort()
+        else:
+            route.continue_()
+
+    context.route("**/*", handle)
+
+
+async def install_route_blocking_async(context, metrics):
+    """async BrowserContext 에 리소스 차단 라우트 등록"""
+    async def handle(route):
+        request = route.request
+        if should_block(request.resource_type, request.url):
+            metrics.inc('blocked_requests', resource_type=request.resource_type)
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", handle)
+
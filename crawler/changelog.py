@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from availability import AvailabilityMatrix
+from stream_writer import SnapshotReader
+
+logger = logging.getLogger(__name__)
+
+ReservationKey = Tuple[str, str, str]
+
+
+def reservation_key(reservation: Dict) -> ReservationKey:
+    """(facility_number, reservation_date, time_slot) 키"""
+    return (reservation['facility_number'], reservation['reservation_date'], reservation['time_slot'])
+
+
+def index_reservations(reservations: List[Dict]) -> Dict[ReservationKey, str]:
+    """예약 목록을 키 → 상태 dict 로 변환 (같은 키가 여러 번 나오면 confirmed 우선)"""
+    index = {}
+    for r in reservations:
+        key = reservation_key(r)
+        if index.get(key) != 'confirmed':
+            index[key] = r['status']
+    return index
+
+
+def diff_reservations(previous: List[Dict], current: List[Dict]) -> Dict[str, List[ReservationKey]]:
+    """이전 스냅샷과 새 예약 목록 비교
+
+    opened: 새로 예약 가능해진 슬롯 (새 슬롯이거나 confirmed → available)
+    confirmed: 새로 예약 확정된 슬롯 (새 슬롯이거나 available → confirmed)
+    disappeared: 이전에는 있었지만 이번에는 없는 슬롯
+
+    두 목록을 같은 축의 상태 행렬로 바꿔서 바뀐 예식장 행만 칸 단위로 비교한다.
+    """
+    after = AvailabilityMatrix.from_reservations(current)
+    before = AvailabilityMatrix.from_reservations(previous, facilities=after.facilities,
+                                                  start=after.start, end=after.date_of(after.days - 1),
+                                                  slots=after.slots)
+    return after.diff(before)
+
+
+def is_empty(delta: Dict[str, List[ReservationKey]]) -> bool:
+    return not any(delta.values())
+
+
+def load_snapshot(path: Path) -> Optional[Dict]:
+    """이전 data.json 스냅샷 읽기 (없거나 읽을 수 없으면 None)"""
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"이전 스냅샷을 읽을 수 없습니다: {e}")
+        return None
+
+
+def load_snapshot_matrix(path: Path) -> Optional[Tuple[Dict, AvailabilityMatrix]]:
+    """이전 data.json 을 한 건씩 읽어 (reservations 외의 키, 상태 행렬) 반환 (없거나 읽을 수 없으면 None)
+
+    load_snapshot 과 달리 예약 목록을 메모리에 만들지 않는다.
+    """
+    if not path.exists():
+        return None
+    reader = SnapshotReader(path)
+    try:
+        matrix = AvailabilityMatrix.collect(reader)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"이전 스냅샷을 읽을 수 없습니다: {e}")
+        return None
+    return reader.header, matrix
+
+
+def write_delta(path: Path, delta: Dict[str, List[ReservationKey]],
+                previous_crawled_at: Optional[str], crawled_at: str):
+    """변경분 파일을 임시 파일 + 교체 방식으로 저장"""
+    data = {
+        'from': previous_crawled_at,
+        'to': crawled_at,
+        'counts': {kind: len(keys) for kind, keys in delta.items()},
+    }
+    data.update({kind: [list(key) for key in keys] for kind, keys in delta.items()})
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+UnitKey = Tuple[str, int, int]
+
+
+class CheckpointJournal:
+    """(facility_number, year, month) 단위 완료 기록 (append-only JSON Lines)
+
+    달 하나를 가져올 때마다 한 줄씩 추가하고 바로 flush 한다. resume 이면 기존 기록을
+    읽어서 완료된 달은 다시 가져오지 않고 저장된 예약 정보를 그대로 쓴다. 저장까지
+    성공하면 discard() 로 파일을 지우므로, 파일이 남아 있다는 것은 이전 실행이 중간에
+    실패했다는 뜻이다. max_age_hours 보다 오래된 기록은 다시 가져온다.
+    """
+
+    def __init__(self, path: str, resume: bool = False, max_age_hours: float = 3):
+        self.path = Path(path)
+        self.max_age = max_age_hours * 3600
+        self.completed: Dict[UnitKey, List[Dict]] = {}
+        self.resumed = 0
+        if resume:
+            self.load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # resume 가 아니면 새 실행으로 보고 이전 기록을 버림
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+
+    def load(self):
+        """기존 기록 읽기 (중간에 끊긴 마지막 줄과 오래된 기록은 무시)"""
+        if not self.path.exists():
+            return
+        now = time.time()
+        stale = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    key = (record['f'], record['y'], record['m'])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if now - record.get('t', 0) > self.max_age:
+                    stale += 1
+                    continue
+                self.completed[key] = record['r']
+        logger.info(f"체크포인트 로드: 완료된 달 {len(self.completed)}건"
+                    + (f", 오래된 기록 {stale}건 무시" if stale else "") + f" ({self.path})")
+
+    def get(self, facility_number: str, year: int, month: int) -> Optional[List[Dict]]:
+        """완료된 달이면 저장된 예약 정보, 아니면 None (한 번 이어받은 달은 메모리에서 뺌)"""
+        reservations = self.completed.pop((facility_number, year, month), None)
+        if reservations is not None:
+            self.resumed += 1
+        return reservations
+
+    def record(self, facility_number: str, year: int, month: int, reservations: List[Dict]):
+        """가져온 달 하나를 기록 (이번 실행에서 다시 묻지 않으므로 파일에만 씀)"""
+        line = json.dumps({'f': facility_number, 'y': year, 'm': month, 't': time.time(), 'r': reservations},
+                          ensure_ascii=False, separators=(',', ':'))
+        self._file.write(line + '\n')
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def discard(self):
+        """저장까지 끝난 실행의 기록 삭제"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""신선도 기반 (예식장, 월) 크롤링 스케줄
+
+오늘 날짜부터 horizon_months 개월을 크롤링 범위로 잡고, 각 (예식장, 월)에 갱신 주기를
+정한다. 가까운 달은 매 실행, 그 다음 달들은 6시간, 먼 달은 24시간마다 다시 가져오고,
+지난 결과에 예약 가능한 주말 슬롯이 있는 달은 한 단계 더 자주 가져온다. 실행마다 주기가
+지난 달만 가져오고, 나머지는 지난번 결과를 그대로 출력에 쓴다.
+
+요청 예산(budget)을 주면 갱신할 달이 예산보다 많을 때 주기 대비 오래된 달부터 예산만큼만
+가져오고, 밀린 달은 다음 실행에서 가져온다. 지난 결과가 없는 달은 출력에서 빠지지 않도록
+예산과 관계없이 가져온다.
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+YearMonth = Tuple[int, int]
+
+HOUR = 3600
+
+# 이번 달부터 몇 개월까지가 각 주기에 해당하는지와 그 주기 (초), 마지막 단계는 나머지 전부
+REFRESH_TIERS = ((3, 0), (6, 6 * HOUR), (None, 24 * HOUR))
+
+# 정시 실행 시각이 조금 밀려도 주기를 한 번 건너뛰지 않도록 주는 여유
+DUE_SLACK = 10 * 60
+
+# 매 실행 가져오는 달의 우선순위 계산에 쓰는 실행 간격 (워크플로우는 매시간 실행)
+RUN_INTERVAL = HOUR
+
+
+def rolling_horizon(today: date, months: int) -> List[YearMonth]:
+    """이번 달부터 months 개월의 (연, 월) 목록"""
+    index = today.year * 12 + today.month - 1
+    return [(i // 12, i % 12 + 1) for i in range(index, index + months)]
+
+
+def open_weekend_slots(reservations: List[Dict]) -> int:
+    """예약 가능한 토/일요일 슬롯 수"""
+    count = 0
+    for r in reservations:
+        if r.get('status') != 'available':
+            continue
+        try:
+            if date.fromisoformat(r['reservation_date']).weekday() >= 5:
+                count += 1
+        except (KeyError, TypeError, ValueError):
+            continue
+    return count
+
+
+def refresh_interval(offset: int, weekend_open: bool) -> float:
+    """이번 달로부터 offset 개월 뒤인 달의 갱신 주기 (초)"""
+    tier = next(i for i, (limit, _) in enumerate(REFRESH_TIERS) if limit is None or offset < limit)
+    if weekend_open:
+        tier = max(tier - 1, 0)
+    return REFRESH_TIERS[tier][1]
+
+
+class CrawlScheduler:
+    """(facility_number, year, month) 단위 갱신 스케줄과 지난 결과
+
+    path 를 주면 달마다 마지막으로 가져온 시각과 예약 정보를 JSON 파일에 저장해서
+    다음 실행에서 주기가 지나지 않은 달은 다시 가져오지 않는다. 주지 않으면 기록을 남기지
+    않아(예약 정보를 메모리에 쌓지 않음) 매 실행 범위 안의 모든 달을 가져온다. retain 이면
+    파일 없이도 메모리에 기록을 남겨 같은 인스턴스로 다시 크롤링할 때(데몬 사이클) 주기를 적용한다.
+    """
+
+    def __init__(self, path: Optional[str] = None, horizon_months: int = 12, budget: int = 0,
+                 today: Optional[date] = None, retain: bool = False):
+        self.path = Path(path) if path else None
+        self.retain = retain
+        self.horizon_months = horizon_months
+        self.horizon = rolling_horizon(today or date.today(), horizon_months)
+        # 실행당 최대 캘린더 요청 수 (0 이면 제한 없음)
+        self.budget = budget
+        self.entries: Dict[str, Dict] = {}
+        self.due = 0
+        self.deferred = 0
+        self.fresh = 0
+        self.load()
+
+    def roll(self, today: date):
+        """크롤링 범위를 today 기준으로 옮김 (상주 실행에서 날짜가 바뀐 경우)"""
+        horizon = rolling_horizon(today, self.horizon_months)
+        if horizon != self.horizon:
+            self.horizon = horizon
+            months = {f"{year}-{month:02d}" for year, month in horizon}
+            self.entries = {key: entry for key, entry in self.entries.items() if key.rsplit(':', 1)[1] in months}
+
+    @staticmethod
+    def key(facility_number: str, year: int, month: int) -> str:
+        return f"{facility_number}:{year}-{month:02d}"
+
+    def load(self):
+        """스케줄 파일 읽기 (없거나 손상되었으면 모든 달을 가져옴)"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+            logger.info(f"크롤링 스케줄 로드: {len(self.entries)}건 ({self.path})")
+        except (OSError, ValueError) as e:
+            logger.warning(f"크롤링 스케줄을 읽을 수 없어 모든 달을 가져옵니다: {e}")
+            self.entries = {}
+
+    def save(self):
+        """스케줄 파일 저장 (범위를 벗어난 지난 달 제외, 임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        months = {f"{year}-{month:02d}" for year, month in self.horizon}
+        entries = {key: entry for key, entry in self.entries.items() if key.rsplit(':', 1)[1] in months}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entries': entries}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _priority(entry: Dict, offset: int, now: float) -> Optional[float]:
+        """갱신할 달이면 우선순위 (클수록 먼저), 아직 주기가 지나지 않았으면 None"""
+        interval = refresh_interval(offset, entry.get('weekend', 0) > 0)
+        age = now - entry['crawled_at']
+        if age < interval - DUE_SLACK:
+            return None
+        return age / max(interval, RUN_INTERVAL)
+
+    def plan(self, facility_numbers: List[str]) -> Dict[str, List[YearMonth]]:
+        """이번 실행에서 가져올 달 (예식장별, 달 순서)"""
+        now = time.time()
+        missing = []
+        candidates = []
+        self.fresh = 0
+        for order, facility_number in enumerate(facility_numbers):
+            for offset, (year, month) in enumerate(self.horizon):
+                item = (order, offset, facility_number, (year, month))
+                entry = self.entries.get(self.key(facility_number, year, month))
+                if not entry:
+                    missing.append(item)
+                    continue
+                priority = self._priority(entry, offset, now)
+                if priority is None:
+                    self.fresh += 1
+                else:
+                    candidates.append((-priority,) + item)
+
+        candidates.sort()
+        self.deferred = 0
+        if self.budget:
+            allowed = max(self.budget - len(missing), 0)
+            self.deferred = max(len(candidates) - allowed, 0)
+            candidates = candidates[:allowed]
+        selected = missing + [c[1:] for c in candidates]
+        self.due = len(selected)
+
+        plan: Dict[str, List[YearMonth]] = {facility_number: [] for facility_number in facility_numbers}
+        for _, _, facility_number, year_month in sorted(selected):
+            plan[facility_number].append(year_month)
+        logger.info(self.summary())
+        return plan
+
+    def previous(self, facility_number: str, year: int, month: int) -> List[Dict]:
+        """지난번에 가져온 예약 정보 (없으면 빈 목록)"""
+        entry = self.entries.get(self.key(facility_number, year, month))
+        return entry['reservations'] if entry else []
+
+    def record(self, facility_number: str, year: int, month: int, reservations: List[Dict]):
+        """가져온 달 기록 (파일도 retain 도 없으면 다시 쓸 일이 없으므로 남기지 않음)"""
+        if not self.path and not self.retain:
+            return
+        self.entries[self.key(facility_number, year, month)] = {
+            'crawled_at': time.time(),
+            'weekend': open_weekend_slots(reservations),
+            'reservations': reservations,
+        }
+
+    def assemble(self, facility_number: str, fetched: Dict[YearMonth, Optional[List[Dict]]]) -> List[Dict]:
+        """이번에 가져온 달과 지난 결과를 합쳐 범위 전체의 예약 정보를 달 순서로 반환
+
+        가져오지 못한 달(None 또는 fetched 에 없음)은 지난 결과를 쓰고 다음 실행에서 다시 가져온다.
+        캘린더는 있지만 예약 정보가 없는 달(빈 목록)은 그대로 기록해서 사라진 슬롯을 남기지 않는다.
+        """
+        reservations = []
+        for year, month in self.horizon:
+            month_reservations = fetched.get((year, month))
+            if month_reservations is not None:
+                self.record(facility_number, year, month, month_reservations)
+            else:
+                month_reservations = self.previous(facility_number, year, month)
+            reservations.extend(month_reservations)
+        return reservations
+
+    def summary(self) -> str:
+        first, last = self.horizon[0], self.horizon[-1]
+        budget = f", 예산 {self.budget}건" if self.budget else ""
+        return (f"크롤링 스케줄: {first[0]}-{first[1]:02d} ~ {last[0]}-{last[1]:02d}, "
+                f"가져올 달 {self.due}건, 예산 초과로 미룬 달 {self.deferred}건, 최신 {self.fresh}건{budget}")
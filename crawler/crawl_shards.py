@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""예식장 단위 크롤링 분할과 부분 결과 병합
+
+--shard-index/--shard-count 로 실행하면 facility_number 의 안정 해시로 정해진 조각의
+예식장만 크롤링하고, 전체 예식장 목록과 함께 부분 결과 파일을 쓴다. 프로세스나
+GitHub Actions matrix job 마다 조각 하나씩 실행한 뒤 merge_partials.py 로 합친다.
+
+    python crawler.py --shard-index 0 --shard-count 4 --partial-dir partials
+    ...
+    python merge_partials.py partials/*.json
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from stream_writer import dump_compact
+
+PARTIAL_FORMAT = "facility-shard-v1"
+
+
+class MergeError(Exception):
+    """부분 결과가 빠졌거나 서로 맞지 않아 병합할 수 없음"""
+
+
+def shard_of(facility_number: str, shard_count: int) -> int:
+    """facility_number 가 속한 조각 번호 (프로세스/실행과 무관하게 항상 같음)"""
+    digest = hashlib.sha1(facility_number.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % shard_count
+
+
+def select_shard(facilities: List[Dict], shard_index: int, shard_count: int) -> List[Dict]:
+    """목록 순서를 유지한 채 해당 조각의 예식장만 선택"""
+    return [f for f in facilities if shard_of(f['facility_number'], shard_count) == shard_index]
+
+
+def partial_path(partial_dir: str, shard_index: int, shard_count: int) -> Path:
+    return Path(partial_dir) / f"part-{shard_index:03d}-of-{shard_count:03d}.json"
+
+
+def write_partial(path: Path, shard_index: int, shard_count: int, crawled_at: str,
+                  facilities: List[Dict], crawled: List[str], reservations: Iterable[Dict]) -> int:
+    """부분 결과 저장 (facilities 는 전체 목록, crawled 는 이 조각에서 크롤링한 예식장), 예약 건수 반환
+
+    reservations 는 한 건씩 읽으며 쓰므로 NDJSON 스풀을 그대로 넘길 수 있다.
+    """
+    data = {
+        'format': PARTIAL_FORMAT,
+        'shardIndex': shard_index,
+        'shardCount': shard_count,
+        'crawledAt': crawled_at,
+        'facilities': facilities,
+        'crawledFacilities': crawled,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        count = dump_compact(f, data, 'reservations', reservations)
+    os.replace(tmp_path, path)
+    return count
+
+
+def load_partials(paths: List[str]) -> List[Dict]:
+    partials = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') != PARTIAL_FORMAT:
+            raise MergeError(f"부분 결과 파일이 아닙니다: {path}")
+        partials.append(data)
+    return partials
+
+
+def merge_partials(partials: List[Dict]) -> Tuple[List[Dict], List[Dict], str]:
+    """부분 결과를 합쳐 (facilities, reservations, crawled_at) 반환
+
+    모든 조각이 정확히 한 번씩 있어야 하고, 전체 목록의 각 예식장은 자기 조각에서
+    크롤링되었어야 한다. 결과 순서는 파일 순서와 무관하게 목록 순서 → 각 예식장의
+    크롤링 순서로 정해지므로 단일 프로세스 실행과 같다.
+    """
+    if not partials:
+        raise MergeError("병합할 부분 결과가 없습니다")
+
+    counts = {p['shardCount'] for p in partials}
+    if len(counts) != 1:
+        raise MergeError(f"shardCount 가 서로 다릅니다: {sorted(counts)}")
+    shard_count = counts.pop()
+
+    by_index: Dict[int, Dict] = {}
+    for p in partials:
+        if p['shardIndex'] in by_index:
+            raise MergeError(f"조각 {p['shardIndex']} 이 두 번 이상 있습니다")
+        by_index[p['shardIndex']] = p
+    missing_shards = sorted(set(range(shard_count)) - by_index.keys())
+    if missing_shards:
+        raise MergeError(f"빠진 조각: {missing_shards} (전체 {shard_count}개)")
+    ordered = [by_index[i] for i in range(shard_count)]
+
+    # 조각마다 목록을 따로 가져왔으므로 합집합을 조각 번호 순서대로 이어 붙임
+    facilities: List[Dict] = []
+    seen = set()
+    for p in ordered:
+        for facility in p['facilities']:
+            if facility['facility_number'] not in seen:
+                seen.add(facility['facility_number'])
+                facilities.append(facility)
+
+    problems = []
+    for facility in facilities:
+        number = facility['facility_number']
+        owner = by_index[shard_of(number, shard_count)]
+        if number not in owner['crawledFacilities']:
+            problems.append(f"예식장 {number}: 조각 {owner['shardIndex']} 에서 크롤링되지 않았습니다")
+    if problems:
+        raise MergeError("\n".join(problems))
+
+    grouped: Dict[str, List[Dict]] = {}
+    for p in ordered:
+        for r in p['reservations']:
+            grouped.setdefault(r['facility_number'], []).append(r)
+    reservations = [r for facility in facilities for r in grouped.get(facility['facility_number'], [])]
+
+    crawled_at = max(p['crawledAt'] for p in ordered)
+    return facilities, reservations, crawled_at
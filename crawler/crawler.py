@@ -3,14 +3,40 @@
 
 from playwright.sync_api import sync_playwright, Page
 from bs4 import BeautifulSoup
-import json
+import argparse
+import asyncio
 import logging
+import os
 import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple, Union
 from pathlib import Path
 
+from aggregates import write_aggregates
+from async_engine import AsyncCrawlEngine
+from availability import AvailabilityMatrix
+import browser_tuning
+import changelog
+from checkpoint import CheckpointJournal
+from crawl_scheduler import CrawlScheduler, YearMonth
+import crawl_shards
+from daemon import CrawlDaemon
+import fast_parser
+from facility_cache import FacilityCache, merge_listing_pages
+from fetch_cache import FetchCache, tbody_digest
+from fetchers import (FACILITIES_SELECTOR, FetchResult, HttpFetcher, contains_expected, extract_wpnonce,
+                      MAX_LISTING_PAGES, listing_page_count)
+from html_archive import REPLAY_NONCE, HtmlArchive
+from metrics import Metrics
+from month_shards import write_month_shards
+from nonce_cache import NonceCache
+from parse_pool import ParsePool, completed
+from sqlite_store import SQLiteStore
+from stream_writer import NdjsonReservations, NdjsonWriter, dump_snapshot
+from throttle import AdaptiveThrottle
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -25,17 +51,141 @@ logger = logging.getLogger(__name__)
 class WeddingHallCrawler:
     """서울시 공공예식장 크롤러"""
 
-    def __init__(self, json_path: str = "../frontend/public/data.json"):
+    def __init__(self, json_path: str = "../frontend/public/data.json", engine: str = "sync",
+                 concurrency: int = 8, per_host_concurrency: int = 4, fetcher: str = "playwright",
+                 fetch_cache_path: Optional[str] = None, parser: str = "bs4",
+                 base_url: str = "https://wedding.seoulwomen.or.kr", output: str = "json",
+                 shard_dir: str = "../frontend/public/data", delta_path: Optional[str] = None,
+                 db_path: Optional[str] = None, wpnonce_cache_path: Optional[str] = None,
+                 wpnonce_ttl_hours: float = 12, rate: float = 1.0, max_rate: float = 8.0,
+                 metrics_json_path: Optional[str] = None, metrics_prom_path: Optional[str] = None,
+                 lean_browser: bool = False, page_recycle_every: int = browser_tuning.PAGE_RECYCLE_NAVIGATIONS,
+                 page_memory_limit: int = browser_tuning.PAGE_MEMORY_LIMIT_MB,
+                 shard_index: int = 0, shard_count: int = 1, partial_dir: str = "partials",
+                 checkpoint_path: Optional[str] = None, resume: bool = False, resume_max_age_hours: float = 3,
+                 schedule_path: Optional[str] = None, horizon_months: int = 12, request_budget: int = 0,
+                 parse_workers: int = 0, parse_executor: str = "thread", ndjson_path: Optional[str] = None,
+                 aggregates_path: Optional[str] = None, archive_dir: Optional[str] = None,
+                 archive_mode: str = "record", archive_as_of: Optional[str] = None,
+                 facility_cache_path: Optional[str] = None, facilities_refresh_hours: float = 24):
         self.json_path = Path(json_path)
-        self.base_url = "https://wedding.seoulwomen.or.kr"
+        # 로컬 스텁 서버(fake_site.py) 등을 가리키도록 변경 가능
+        self.base_url = base_url.rstrip('/')
+        # 출력 형식: json(단일 data.json) / sharded(manifest + 월별 샤드) / both
+        self.output = output
+        self.shard_dir = shard_dir
+        # 지정하면 이전 스냅샷과의 변경분을 저장하고, 변경이 없으면 출력 파일을 다시 쓰지 않음
+        self.delta_path = Path(delta_path) if delta_path else None
+        # 지정하면 캘린더 UI 용 날짜/지역구/예식장별 집계(aggregates.json)도 함께 저장
+        self.aggregates_path = aggregates_path
+        # 지정하면 출력 형식과 별개로 SQLite DB 에도 저장 (상태 변경 이력 포함)
+        self.db_path = db_path
+        # 예식장 분할 크롤링: shard_count > 1 이면 이 조각의 예식장만 크롤링하고 부분 결과만 저장
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.partial_dir = partial_dir
         self.facilities_url = f"{self.base_url}/facilities"
+        self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        # 크롤링 엔진: sync(단일 페이지 순차) / async(페이지 풀 동시 실행)
+        self.engine = engine
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency
+        # 페처: playwright(브라우저) / http(HTTP 우선, 셀렉터·tbody 누락 시 Playwright 폴백)
+        self.fetcher = fetcher
+        # 모든 페치 경로(HTTP, 브라우저, async 페이지 풀)가 공유하는 요청 속도 조절기
+        self.throttle = AdaptiveThrottle(rate=rate, max_rate=max_rate)
+        # 단계별/요청별 계측 (실행이 끝나면 JSON 리포트와 Prometheus textfile 로 내보냄)
+        self.metrics = Metrics()
+        self.metrics_json_path = metrics_json_path
+        self.metrics_prom_path = metrics_prom_path
+        self.http_fetcher: Optional[HttpFetcher] = None
+        if fetcher == "http":
+            self.http_fetcher = HttpFetcher(self.user_agent, pool_size=max(concurrency, 10),
+                                            throttle=self.throttle, metrics=self.metrics)
+        self.fallback_count = 0
+        # 변경되지 않은 달의 파싱을 건너뛰기 위한 페치 캐시 (경로 지정 시에만 사용)
+        self.fetch_cache = FetchCache(fetch_cache_path) if fetch_cache_path else None
+        # 예식장별 _wpnonce 캐시 (경로를 지정하면 실행 간에도 TTL 동안 재사용)
+        self.wpnonce_cache = NonceCache(wpnonce_cache_path, ttl_hours=wpnonce_ttl_hours)
+        # 예식장 목록 캐시 (갱신 주기 동안 목록 페이지를 다시 가져오지 않고, 가격/수용 인원 등 변경 이력 기록)
+        self.facility_cache = FacilityCache(facility_cache_path, refresh_hours=facilities_refresh_hours)
+        # 페치한 HTML 원문 아카이브 (record: 가져온 페이지 저장, replay: 네트워크/브라우저 없이 기록에서 재생)
+        self.archive = HtmlArchive(archive_dir, mode=archive_mode, as_of=archive_as_of) if archive_dir else None
+        # (예식장, 연, 월) 단위 체크포인트 (resume 이면 이전 실행에서 완료된 달은 건너뜀)
+        self.checkpoint = (CheckpointJournal(checkpoint_path, resume=resume, max_age_hours=resume_max_age_hours)
+                           if checkpoint_path else None)
+        # 오늘부터 horizon_months 개월 범위의 (예식장, 월) 갱신 스케줄 (경로를 지정하면 주기가 지나지 않은 달은 건너뜀)
+        # 재생 모드는 기록한 날짜 기준으로 범위를 정함
+        self.scheduler = CrawlScheduler(schedule_path, horizon_months=horizon_months, budget=request_budget,
+                                        today=self.archive.replay_date() if self.replaying else None)
+        # 파서 엔진: bs4(BeautifulSoup 전체 문서) / lxml(필요한 조각만 XPath 로 탐색)
+        self.parser = parser
+        # 캘린더 파싱 워커 풀 (0 이면 페치한 스레드/이벤트 루프에서 바로 파싱)
+        self.parse_pool = (ParsePool(parser, workers=parse_workers, executor=parse_executor, metrics=self.metrics)
+                           if parse_workers > 0 else None)
+        # 예식장 하나를 끝낼 때마다 예약 정보를 이어 쓰는 NDJSON 스풀 (저장 단계는 여기서 다시 읽음)
+        # ndjson_path 를 주면 저장이 끝난 뒤 그 경로로 남기고, 주지 않으면 임시 파일로 쓰고 지움
+        self.spool = NdjsonWriter(ndjson_path)
+        # 경량 브라우저 모드: 이미지/폰트/스타일시트와 분석 호스트 요청 차단
+        self.lean_browser = lean_browser
+        # 렌더러 메모리가 페이지당 page_memory_limit(MB)를 넘으면 페이지 재생성 (같은 컨텍스트 재사용)
+        # 메모리를 잴 수 없으면 page_recycle_every 번 이동할 때마다 재생성 (0 이면 오류 시에만)
+        self.page_memory_limit = page_memory_limit
+        self.page_recycle_every = page_recycle_every
+        self.playwright = None
         self.page: Optional[Page] = None
         self.context = None
         self.browser = None
+        self.memory_probe: Optional[browser_tuning.RendererMemoryProbe] = None
         self.request_count = 0
 
-    def refresh_page(self):
-        """페이지 객체 재생성 (메모리 누수 방지)"""
+    def start_browser(self):
+        """Chromium 브라우저 실행 (이미 실행 중이면 무시)"""
+        if self.browser:
+            return
+        self.playwright = sync_playwright().start()
+        # Chromium 브라우저 실행 (headless 모드)
+        self.browser = self.playwright.chromium.launch(headless=True)
+        self.context = self.browser.new_context(
+            user_agent=self.user_agent,
+            viewport={'width': 1920, 'height': 1080}
+        )
+        if self.lean_browser:
+            browser_tuning.install_route_blocking(self.context, self.metrics)
+        self.page = self.context.new_page()
+        self.request_count = 0
+        session = None
+        if self.page_memory_limit > 0:
+            try:
+                session = self.browser.new_browser_cdp_session()
+            except Exception as e:
+                logger.warning(f"브라우저 CDP 세션을 열 수 없습니다: {e}")
+        self.memory_probe = browser_tuning.RendererMemoryProbe(session)
+
+    def close(self):
+        """브라우저와 HTTP 세션 종료"""
+        if self.browser:
+            self.browser.close()
+            self.browser = None
+            self.context = None
+            self.page = None
+            self.memory_probe = None
+        if self.playwright:
+            self.playwright.stop()
+            self.playwright = None
+        if self.http_fetcher:
+            self.http_fetcher.close()
+        self.close_pipeline()
+
+    def close_pipeline(self):
+        """파싱 워커 풀 종료, 커밋하지 않은 NDJSON 임시 파일 삭제"""
+        if self.parse_pool:
+            self.parse_pool.close()
+            self.parse_pool = None
+        self.spool.abort()
+
+    def refresh_page(self, reason: str = 'error'):
+        """페이지 객체 재생성 (메모리 누수 방지, 컨텍스트는 재사용)"""
         if self.page:
             try:
                 self.page.close()
@@ -43,18 +193,71 @@ class WeddingHallCrawler:
                 pass
         self.page = self.context.new_page()
         self.request_count = 0
+        self.metrics.inc('page_recycles', engine='sync', reason=reason)
         logger.info("페이지 새로고침 완료")
 
-    def fetch_page(self, url: str, selector: str = None, retries: int = 3) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str, selector: str = None, retries: int = 3, expect: str = None) -> Optional[BeautifulSoup]:
         """페이지를 가져와서 BeautifulSoup 객체로 반환"""
-        # 50회 요청마다 페이지 새로고침 (메모리 누수 방지)
+        result = self.fetch_html(url, selector=selector, retries=retries, expect=expect)
+        if not result or result.html is None:
+            return None
+        return BeautifulSoup(result.html, 'lxml')
+
+    def fetch_html(self, url: str, selector: str = None, retries: int = 3, expect: str = None,
+                   headers: Optional[Dict[str, str]] = None) -> Optional[FetchResult]:
+        """페이지 HTML 원문을 가져와서 FetchResult 로 반환
+
+        HTTP 페처를 사용하면 먼저 HTTP 로 가져오고(headers 로 조건부 요청 가능),
+        응답에 expect(기본값은 selector) 요소가 없을 때만 Playwright 로 다시 가져온다.
+        아카이브 재생 모드면 기록된 원문을 돌려준다.
+        """
+        if self.replaying:
+            return self.archive.replay(url)
+
+        if self.http_fetcher:
+            result = self.http_fetcher.fetch(url, retries=retries, headers=headers)
+            if not result:
+                return None
+            if result.not_modified:
+                return result
+            self.archive_page(url, result.html, 'http')
+
+            check = expect or selector
+            if not check or contains_expected(result.html, check):
+                return result
+
+            logger.info(f"HTTP 응답에서 '{check}'를 찾을 수 없어 Playwright로 재시도: {url}")
+            self.fallback_count += 1
+            self.metrics.inc('fallbacks')
+
+        with self.metrics.span('fetch', source='browser'):
+            content = self.fetch_html_browser(url, selector, retries)
+        if content is None:
+            return None
+        return FetchResult(url, content, from_browser=True)
+
+    def fetch_html_browser(self, url: str, selector: str = None, retries: int = 3) -> Optional[str]:
+        """Playwright 로 페이지를 가져와서 HTML 원문으로 반환"""
+        self.start_browser()
+
+        # 렌더러 메모리가 한도를 넘으면 (잴 수 없으면 일정 횟수 이동할 때마다) 페이지 재생성
         self.request_count += 1
-        if self.request_count >= 50:
-            self.refresh_page()
+        memory = self.memory_probe.read()
+        if memory is not None:
+            self.metrics.set('renderer_memory_bytes', memory, engine='sync')
+        reason = browser_tuning.recycle_reason(self.request_count, self.page_recycle_every,
+                                               memory, self.page_memory_limit * 1024 * 1024)
+        if reason:
+            self.refresh_page(reason=reason)
 
         for attempt in range(retries):
+            self.throttle.acquire()
+            started = time.monotonic()
             try:
-                self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                with self.metrics.span('navigation', engine='sync'):
+                    response = self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                self.throttle.record(time.monotonic() - started, response.status if response else None)
+                self.metrics.inc('requests', source='browser', status=response.status if response else 'unknown')
 
                 # 특정 셀렉터가 지정되면 그것만 기다림 (빠른 실패)
                 if selector:
@@ -67,17 +270,21 @@ class WeddingHallCrawler:
                     # 기본: body만 기다림
                     self.page.wait_for_selector('body', timeout=10000)
 
-                content = self.page.content()
-                time.sleep(1)
-                return BeautifulSoup(content, 'lxml')
+                with self.metrics.span('content', engine='sync'):
+                    content = self.page.content()
+                self.metrics.inc('bytes_downloaded', len(content.encode('utf-8')), source='browser')
+                self.archive_page(url, content, 'browser')
+                return content
             except Exception as e:
+                self.throttle.record_failure('timeout' if 'Timeout' in type(e).__name__ else 'error')
                 logger.warning(f"페이지 요청 실패 (시도 {attempt + 1}/{retries}): {url}, 에러: {e}")
                 # 페이지 객체 손상 시 새로고침
                 if "'dict' object" in str(e) or "Target closed" in str(e):
                     logger.info("페이지 객체 손상 감지, 새로고침 시도...")
                     self.refresh_page()
                 if attempt < retries - 1:
-                    time.sleep(3)
+                    self.metrics.inc('retries', source='browser')
+                    time.sleep(self.throttle.backoff(attempt))
                 else:
                     logger.error(f"페이지 요청 최종 실패: {url}")
                     return None
@@ -152,27 +359,98 @@ class WeddingHallCrawler:
 
         return facilities
 
+    def facilities_page_url(self, page: int) -> str:
+        """예식장 목록 페이지 URL (페이지 1은 /facilities, 나머지는 /facilities/page/N)"""
+        if page == 1:
+            return self.facilities_url
+        return f"{self.facilities_url}/page/{page}"
+
+    def calendar_url(self, facility_number: str, year: int, month: int, wpnonce: str) -> str:
+        """특정 예식장의 월별 캘린더 URL"""
+        return f"{self.base_url}/facilities/{facility_number}?to={year}-{month}&_wpnonce={wpnonce}"
+
+    def parse_facilities_html(self, html: str) -> List[Dict]:
+        """선택한 파서 엔진으로 예식장 목록 HTML 파싱"""
+        with self.metrics.span('parse', kind='facilities', parser=self.parser):
+            if self.parser == "lxml":
+                return fast_parser.parse_facilities_html(html, self.base_url)
+            return self.parse_facilities(BeautifulSoup(html, 'lxml'))
+
+    def parse_calendar_html(self, html: str, facility_number: str, year: int, month: int) -> List[Dict]:
+        """선택한 파서 엔진으로 캘린더 HTML 파싱"""
+        with self.metrics.span('parse', kind='calendar', parser=self.parser):
+            if self.parser == "lxml":
+                return fast_parser.parse_calendar_html(html, facility_number, year, month)
+            return self.parse_calendar(BeautifulSoup(html, 'lxml'), facility_number, year, month)
+
     def get_all_facilities(self) -> List[Dict]:
-        """모든 페이지에서 예식장 목록 가져오기"""
-        all_facilities = []
-        seen_facility_numbers = set()
-
-        # 1~10페이지만 조회
-        for page in range(1, 11):
-            # 페이지 1은 /facilities, 나머지는 /facilities/page/N
-            if page == 1:
-                url = self.facilities_url
+        """예식장 목록 (캐시가 갱신 주기 안이면 캐시, 아니면 목록 페이지에서 새로 가져오기)"""
+        cached = self.facility_cache.get()
+        if cached is not None:
+            return cached
+        return self.store_facilities(*self.discover_facilities())
+
+    def store_facilities(self, facilities: List[Dict], complete: bool = True) -> List[Dict]:
+        """새로 가져온 목록을 캐시에 반영하고 변경 사항 기록 (가져오지 못했으면 캐시된 목록 반환)"""
+        for change in self.facility_cache.update(facilities, complete=complete):
+            self.metrics.inc('facility_changes', change=change['change'])
+            if change['change'] == 'changed':
+                logger.info(f"예식장 {change['facility_number']} {change['field']} 변경: "
+                            f"{change['old']} → {change['new']}")
             else:
-                url = f"{self.facilities_url}/page/{page}"
+                action = '추가' if change['change'] == 'added' else '삭제'
+                logger.info(f"예식장 {change['facility_number']} ({change['facility_name']}) {action}")
+        return list(self.facility_cache.facilities) if self.facility_cache.facilities else facilities
+
+    def discover_facilities(self) -> Tuple[List[Dict], bool]:
+        """목록 페이지에서 예식장 목록 가져오기 (목록과 빠진 페이지 없이 가져왔는지 반환)
+
+        1페이지의 페이지네이션 링크로 전체 페이지 수를 알아내면 나머지 페이지를 동시에 가져오고,
+        링크가 없으면 새 예식장이 나오지 않을 때까지 한 페이지씩 가져온다.
+        """
+        url = self.facilities_page_url(1)
+        logger.info(f"페이지 1 크롤링 중... ({url})")
+        result = self.fetch_html(url, selector=FACILITIES_SELECTOR)
+        if not result:
+            logger.info("페이지 1에 데이터가 없습니다")
+            return [], False
+        first = self.parse_facilities_html(result.html)
+        logger.info(f"페이지 1: {len(first)}개 발견")
+
+        page_count = listing_page_count(result.html)
+        if page_count is None:
+            return self.discover_facilities_sequential(first), True
+        page_count = min(page_count, MAX_LISTING_PAGES)
+        pages = list(range(2, page_count + 1))
+        logger.info(f"목록 페이지 {page_count}개, 나머지 {len(pages)}개 페이지 가져오는 중")
+
+        htmls = self.fetch_listing_pages(pages)
+        listings = [first]
+        for page, html in zip(pages, htmls):
+            if html is None:
+                logger.warning(f"페이지 {page}를 가져오지 못했습니다")
+                continue
+            facilities = self.parse_facilities_html(html)
+            logger.info(f"페이지 {page}: {len(facilities)}개 발견")
+            listings.append(facilities)
+        return merge_listing_pages(listings), all(html is not None for html in htmls)
+
+    def discover_facilities_sequential(self, first: List[Dict]) -> List[Dict]:
+        """페이지 수를 모를 때 2페이지부터 순서대로 가져오기 (새 예식장이 없는 페이지에서 종료)"""
+        all_facilities = merge_listing_pages([first])
+        seen_facility_numbers = {f['facility_number'] for f in all_facilities}
+
+        for page in range(2, MAX_LISTING_PAGES + 1):
+            url = self.facilities_page_url(page)
             logger.info(f"페이지 {page} 크롤링 중... ({url})")
 
             # 예식장 목록 컨테이너가 있는지 확인하며 로드
-            soup = self.fetch_page(url, selector='ul.archive_list-container.facilities')
-            if not soup:
+            result = self.fetch_html(url, selector=FACILITIES_SELECTOR)
+            if not result:
                 logger.info(f"페이지 {page}에 데이터가 없어 페이지네이션 종료")
                 break
 
-            facilities = self.parse_facilities(soup)
+            facilities = self.parse_facilities_html(result.html)
             if not facilities:
                 logger.info(f"페이지 {page}에서 데이터가 없습니다")
                 continue
@@ -195,29 +473,226 @@ class WeddingHallCrawler:
 
         return all_facilities
 
-    def save_to_json(self, facilities: List[Dict], reservations: List[Dict]):
-        """예식장 및 예약 정보를 JSON 파일로 저장"""
+    def fetch_listing_pages(self, pages: List[int]) -> List[Optional[str]]:
+        """목록 페이지 원문을 페이지 순서대로 반환 (가져오지 못한 페이지는 None)
+
+        HTTP 페처면 스레드로 동시에 가져오고, 목록 컨테이너가 없는 응답과 브라우저 페처는
+        이 스레드에서 fetch_html 로 가져온다 (sync Playwright 는 만든 스레드에서만 사용 가능).
+        """
+        urls = [self.facilities_page_url(page) for page in pages]
+        results: List[Optional[FetchResult]] = [None] * len(urls)
+        if self.http_fetcher and not self.replaying and urls:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(urls))) as executor:
+                results = list(executor.map(self.fetch_listing_http, urls))
+            retry = [i for i, result in enumerate(results)
+                     if result and not contains_expected(result.html, FACILITIES_SELECTOR)]
+        else:
+            retry = range(len(urls))
+        for i in retry:
+            results[i] = self.fetch_html(urls[i], selector=FACILITIES_SELECTOR)
+        return [result.html if result else None for result in results]
+
+    def fetch_listing_http(self, url: str) -> Optional[FetchResult]:
+        """HTTP 로만 목록 페이지 가져오기 (워커 스레드에서 실행, 404 또는 최종 실패 시 None)"""
+        result = self.http_fetcher.fetch(url)
+        if not result or result.html is None:
+            return None
+        self.archive_page(url, result.html, 'http')
+        return result
+
+    def select_facilities(self, facilities: List[Dict]) -> List[str]:
+        """이번 실행에서 크롤링할 예식장 번호 (분할 크롤링이면 이 조각의 예식장만)"""
+        if self.shard_count > 1:
+            selected = crawl_shards.select_shard(facilities, self.shard_index, self.shard_count)
+            logger.info(f"조각 {self.shard_index}/{self.shard_count}: 예식장 {len(selected)}/{len(facilities)}개 크롤링")
+            facilities = selected
+        return [f['facility_number'] for f in facilities]
+
+    def save_results(self, facilities: List[Dict], facility_numbers: List[str], reservations: Iterable[Dict]):
+        """분할 크롤링이면 부분 결과로, 아니면 설정한 출력 형식으로 저장한 뒤 NDJSON 스풀 커밋
+
+        reservations 는 crawl_reservations 가 돌려준 스풀(NdjsonReservations)이나 목록이다.
+        """
+        if self.shard_count <= 1:
+            self.save_outputs(facilities, reservations)
+        else:
+            path = crawl_shards.partial_path(self.partial_dir, self.shard_index, self.shard_count)
+            count = crawl_shards.write_partial(path, self.shard_index, self.shard_count, datetime.now().isoformat(),
+                                               facilities, facility_numbers, reservations)
+            logger.info(f"부분 결과 저장: 예식장 {len(facility_numbers)}건, 예약 {count}건 ({path})")
+        self.spool.commit()
+        if self.spool.path:
+            logger.info(f"NDJSON 저장 완료: 예약 {self.spool.count}건 ({self.spool.path})")
+
+    def plan_crawl(self, facility_numbers: List[str]) -> Dict[str, List[YearMonth]]:
+        """이번 실행에서 가져올 (예식장, 월) 목록"""
+        plan = self.scheduler.plan(facility_numbers)
+        self.metrics.set('scheduled_months', self.scheduler.due, state='due')
+        self.metrics.set('scheduled_months', self.scheduler.deferred, state='deferred')
+        self.metrics.set('scheduled_months', self.scheduler.fresh, state='fresh')
+        return plan
+
+    def stream_reservations(self, reservations: List[Dict]):
+        """예식장 하나의 예약 정보를 NDJSON 스풀에 바로 씀 (예식장 순서대로 호출)"""
+        self.spool.write(reservations)
+
+    def split_resumed(self, facility_number: str, months: List[YearMonth]) -> Tuple[Dict[YearMonth, List[Dict]], List[YearMonth]]:
+        """체크포인트에 완료된 달의 예약 정보와 아직 가져와야 하는 달로 나눔"""
+        resumed: Dict[YearMonth, List[Dict]] = {}
+        pending: List[YearMonth] = []
+        for year, month in months:
+            reservations = self.checkpoint.get(facility_number, year, month) if self.checkpoint else None
+            if reservations is None:
+                pending.append((year, month))
+            else:
+                resumed[(year, month)] = reservations
+        if resumed and not pending:
+            logger.info(f"예식장 {facility_number}: 체크포인트에서 이어받음")
+        return resumed, pending
+
+    @property
+    def replaying(self) -> bool:
+        """HTML 아카이브 재생 모드 여부"""
+        return bool(self.archive and self.archive.replaying)
+
+    def archive_page(self, url: str, html: Optional[str], source: str):
+        """기록 모드면 페치한 원문을 아카이브에 저장"""
+        if self.archive and not self.archive.replaying:
+            self.archive.record(url, html, source)
+
+    def checkpoint_month(self, facility_number: str, year: int, month: int, reservations: Optional[List[Dict]]):
+        """가져온 달을 체크포인트에 기록 (None 은 가져오지 못한 달이므로 기록하지 않음, 빈 달은 기록)"""
+        if self.checkpoint and reservations is not None:
+            self.checkpoint.record(facility_number, year, month, reservations)
+
+    def complete_checkpoint(self):
+        """저장까지 끝났으므로 체크포인트 삭제"""
+        if self.checkpoint:
+            if self.checkpoint.resumed:
+                logger.info(f"체크포인트에서 이어받은 달: {self.checkpoint.resumed}건")
+            self.metrics.set('checkpoint_resumed_months', self.checkpoint.resumed)
+            self.checkpoint.discard()
+
+    def save_outputs(self, facilities: List[Dict], reservations: Iterable[Dict], crawled_at: Optional[str] = None):
+        """설정한 출력 형식(json / sharded / both)으로 저장
+
+        reservations 는 목록으로 만들지 않는다. data.json 은 한 건씩 읽으며 쓰고, DB, 변경분,
+        월별 샤드, 집계는 reservations 를 한 번 읽어 만든 상태 행렬에서 만든다. 이전 스냅샷도
+        data.json 을 한 건씩 읽어 행렬로 만든다.
+        """
+        crawled_at = crawled_at or datetime.now().isoformat()
+        self.metrics.set('facilities', len(facilities))
+        self.metrics.set('reservations', len(reservations))
+        matrix = None
+        if self.db_path or self.delta_path or self.aggregates_path or self.output in ("sharded", "both"):
+            with self.metrics.span('save', output='matrix'):
+                matrix = AvailabilityMatrix.collect(reservations,
+                                                    facilities=[f['facility_number'] for f in facilities])
+        if self.db_path:
+            with self.metrics.span('save', output='db'):
+                self.save_to_db(facilities, matrix, crawled_at)
+        if self.delta_path:
+            with self.metrics.span('save', output='delta'):
+                changed = self.write_changes(facilities, matrix, crawled_at)
+            if not changed:
+                logger.info("이전 스냅샷과 달라진 내용이 없어 저장을 생략합니다")
+                if self.aggregates_path and not Path(self.aggregates_path).exists():
+                    # 집계 출력을 처음 켠 경우에는 변경이 없어도 한 번 생성
+                    self.save_aggregates(facilities, matrix, crawled_at)
+                return
+
+        if self.output in ("json", "both"):
+            with self.metrics.span('save', output='json'):
+                self.save_to_json(facilities, reservations, crawled_at)
+        if self.output in ("sharded", "both"):
+            with self.metrics.span('save', output='sharded'):
+                self.save_sharded(facilities, matrix, crawled_at)
+        if self.aggregates_path:
+            with self.metrics.span('save', output='aggregates'):
+                self.save_aggregates(facilities, matrix, crawled_at)
+
+    def save_aggregates(self, facilities: List[Dict], matrix: AvailabilityMatrix, crawled_at: str):
+        """날짜/지역구/예식장별 집계 저장"""
+        try:
+            aggregates = write_aggregates(self.aggregates_path, facilities, matrix, crawled_at)
+            logger.info(f"집계 저장 완료: 날짜 {len(aggregates['days'])}일, 지역구 {len(aggregates['districts'])}곳")
+            logger.info(f"저장 경로: {Path(self.aggregates_path).absolute()}")
+        except Exception as e:
+            logger.error(f"집계 저장 실패: {e}")
+            raise
+
+    def write_changes(self, facilities: List[Dict], matrix: AvailabilityMatrix, crawled_at: str) -> bool:
+        """이전 스냅샷(data.json)과 비교해 변경분 파일 저장, 달라진 내용이 있으면 True"""
+        previous = changelog.load_snapshot_matrix(self.json_path)
+        if previous is None:
+            logger.info("이전 스냅샷이 없어 전체를 새로 저장합니다")
+            return True
+
+        header, before = previous
+        delta = matrix.diff(before)
+        facilities_changed = header.get('facilities') != facilities
+        if changelog.is_empty(delta) and not facilities_changed:
+            return False
+
+        changelog.write_delta(self.delta_path, delta, header.get('lastCrawledAt'), crawled_at)
+        logger.info(f"변경분 저장: 예약가능 {len(delta['opened'])}건, 예약확정 {len(delta['confirmed'])}건, "
+                    f"사라짐 {len(delta['disappeared'])}건"
+                    + (", 예식장 목록 변경" if facilities_changed else "")
+                    + f" ({self.delta_path})")
+        return True
+
+    def save_sharded(self, facilities: List[Dict], matrix: AvailabilityMatrix, crawled_at: Optional[str] = None):
+        """manifest.json 과 월별 샤드로 저장"""
+        try:
+            manifest_path = write_month_shards(self.shard_dir, facilities, matrix,
+                                               crawled_at or datetime.now().isoformat())
+            logger.info(f"월별 샤드 저장 완료: 예식장 {len(facilities)}건, 슬롯 {len(matrix)}건")
+            logger.info(f"저장 경로: {manifest_path.absolute()}")
+        except Exception as e:
+            logger.error(f"월별 샤드 저장 실패: {e}")
+            raise
+
+    def save_to_db(self, facilities: List[Dict], reservations: Union[Iterable[Dict], AvailabilityMatrix],
+                   crawled_at: Optional[str] = None):
+        """예식장 및 예약 정보(이터러블 또는 상태 행렬)를 SQLite DB 에 한 트랜잭션으로 저장 (크롤링 범위에서 사라진 슬롯은 삭제)"""
+        first, last = self.scheduler.horizon[0], self.scheduler.horizon[-1]
+        date_range = (f"{first[0]}-{first[1]:02d}-01", f"{last[0]}-{last[1]:02d}-31")
+        store = SQLiteStore(self.db_path)
+        try:
+            changed = store.save_run(facilities, reservations, crawled_at, date_range=date_range)
+            logger.info(f"DB 저장 완료: 예식장 {len(facilities)}건, 예약 {len(reservations)}건, 상태 변경 {changed}건")
+            logger.info(f"저장 경로: {Path(self.db_path).absolute()}")
+        except Exception as e:
+            logger.error(f"DB 저장 실패: {e}")
+            raise
+        finally:
+            store.close()
+
+    def save_reservations_to_db(self, reservations: List[Dict]):
+        """예약 정보만 SQLite DB 에 저장"""
+        self.save_to_db([], reservations)
+
+    def save_to_json(self, facilities: List[Dict], reservations: Iterable[Dict], crawled_at: Optional[str] = None):
+        """예식장 및 예약 정보를 JSON 파일로 저장 (예약 정보는 한 건씩 인코딩해서 씀)"""
         try:
             # 부모 디렉토리가 없으면 생성
             self.json_path.parent.mkdir(parents=True, exist_ok=True)
 
-            data = {
-                "lastCrawledAt": datetime.now().isoformat(),
-                "facilities": facilities,
-                "reservations": reservations
-            }
-
-            with open(self.json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 임시 파일에 쓴 뒤 교체 (중간에 실패해도 이전 스냅샷 유지)
+            tmp_path = self.json_path.with_name(self.json_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                count = dump_snapshot(f, crawled_at or datetime.now().isoformat(), facilities, reservations)
+            os.replace(tmp_path, self.json_path)
 
-            logger.info(f"JSON 저장 완료: 예식장 {len(facilities)}건, 예약 {len(reservations)}건")
+            logger.info(f"JSON 저장 완료: 예식장 {len(facilities)}건, 예약 {count}건")
             logger.info(f"저장 경로: {self.json_path.absolute()}")
 
         except Exception as e:
             logger.error(f"JSON 저장 실패: {e}")
             raise
 
-    def parse_calendar(self, soup: BeautifulSoup, facility_number: str, year: int, month: int) -> List[Dict]:
+    @staticmethod
+    def parse_calendar(soup: BeautifulSoup, facility_number: str, year: int, month: int) -> List[Dict]:
         """캘린더에서 예약 정보 파싱"""
         reservations = []
 
@@ -288,105 +763,427 @@ class WeddingHallCrawler:
 
         return reservations
 
-    def get_wpnonce(self, facility_number: str) -> Optional[str]:
-        """예식장 페이지에서 _wpnonce 값 추출"""
+    def get_wpnonce(self, facility_number: str, refresh: bool = False) -> Optional[str]:
+        """_wpnonce 값 반환 (캐시에 유효한 값이 없거나 refresh 면 예식장 페이지에서 추출)"""
+        if self.replaying:
+            return REPLAY_NONCE
+        if not refresh:
+            cached = self.wpnonce_cache.get(facility_number)
+            if cached:
+                self.metrics.inc('wpnonce', result='cache')
+                return cached
+
+        with self.metrics.span('wpnonce'):
+            nonce = self.fetch_wpnonce(facility_number)
+        self.metrics.inc('wpnonce', result='refresh' if refresh else 'fetch')
+        if nonce:
+            self.wpnonce_cache.put(facility_number, nonce, refresh=refresh)
+        return nonce
+
+    def fetch_wpnonce(self, facility_number: str) -> Optional[str]:
+        """예식장 페이지 HTML 원문에서 _wpnonce 값 추출"""
         url = f"{self.base_url}/facilities/{facility_number}"
-        soup = self.fetch_page(url)
-        if not soup:
+        result = self.fetch_html(url)
+        if not result:
             return None
 
-        # _wpnonce 값 찾기
-        nonce_match = re.search(r'_wpnonce=([a-z0-9]+)', str(soup))
-        if nonce_match:
-            return nonce_match.group(1)
-        return None
+        nonce = extract_wpnonce(result.html)
+        if not nonce and self.http_fetcher:
+            # HTTP 응답에 nonce 가 없으면 스크립트 렌더링 결과에서 다시 찾음
+            logger.info(f"HTTP 응답에서 _wpnonce를 찾을 수 없어 Playwright로 재시도: {url}")
+            self.fallback_count += 1
+            self.metrics.inc('fallbacks')
+            nonce = extract_wpnonce(self.fetch_html_browser(url))
+        return nonce
+
+    def needs_wpnonce_refresh(self, facility_number: str, reservations: Optional[List[Dict]]) -> bool:
+        """이번 실행에서 확인되지 않은 캐시 nonce 로 캘린더를 가져오지 못했는지 여부
+
+        캘린더를 가져오지 못한 경우(None: 4xx 등 오류 응답, tbody 없음, 요청 실패)만 nonce 문제로 보고,
+        캘린더는 있지만 예약 정보가 없는 달(빈 목록)은 nonce 가 유효한 것으로 확인한다.
+        """
+        if reservations is not None:
+            self.wpnonce_cache.confirm(facility_number)
+            return False
+        return not self.wpnonce_cache.is_verified(facility_number)
+
+    def fetch_reservations_for_month(self, facility_number: str, year: int, month: int,
+                                     wpnonce: Optional[str] = None) -> List[Dict]:
+        """특정 예식장의 특정 월 예약 정보 가져오기 (wpnonce 를 주지 않으면 새로 조회, 실패하면 빈 목록)"""
+        if wpnonce is None:
+            wpnonce = self.get_wpnonce(facility_number)
+            if not wpnonce:
+                return []
+        return self.submit_reservations_for_month(facility_number, year, month, wpnonce).result() or []
 
-    def fetch_reservations_for_month(self, facility_number: str, year: int, month: int, wpnonce: str) -> List[Dict]:
-        """특정 예식장의 특정 월 예약 정보 가져오기"""
-        url = f"{self.base_url}/facilities/{facility_number}?to={year}-{month}&_wpnonce={wpnonce}"
+    def submit_reservations_for_month(self, facility_number: str, year: int, month: int, wpnonce: str) -> Future:
+        """특정 월 캘린더를 가져와서 예약 정보로 변환하는 Future (파싱은 워커 풀에서 진행될 수 있음)
 
-        soup = self.fetch_page(url)
-        if not soup:
-            return []
+        가져오지 못한 달은 None, 캘린더는 있지만 예약 정보가 없는 달은 빈 목록이 결과가 된다.
+        """
+        url = self.calendar_url(facility_number, year, month, wpnonce)
+        headers = self.fetch_cache.conditional_headers(facility_number, year, month) if self.fetch_cache else None
 
-        return self.parse_calendar(soup, facility_number, year, month)
+        # 첫 번째 tbody(캘린더)가 없을 때만 브라우저 폴백
+        result = self.fetch_html(url, expect='tbody', headers=headers)
+        if not result:
+            return completed(None)
 
-    def crawl_reservations(self, facility_numbers: List[str], year: int = 2026) -> List[Dict]:
-        """모든 예식장의 예약 정보 크롤링"""
-        logger.info(f"예약 정보 크롤링 시작: {len(facility_numbers)}개 예식장, {year}년")
+        return self.submit_reservations(result, facility_number, year, month)
 
-        all_reservations = []
+    def submit_reservations(self, result: FetchResult, facility_number: str, year: int, month: int) -> Future:
+        """캘린더 페치 결과를 예약 정보로 변환 (페치 캐시 적중 시 파싱 생략, 워커 풀이 있으면 풀에서 파싱)"""
+        if not result.not_modified and not contains_expected(result.html, 'tbody'):
+            # 캘린더가 없는 응답은 빈 달이 아니라 실패 (지난 결과를 유지하고 다음 실행에서 다시 가져옴)
+            logger.warning(f"캘린더를 찾을 수 없습니다: {facility_number}, {year}-{month}")
+            return completed(None)
+        digest = None
+        if self.fetch_cache:
+            digest = tbody_digest(result.html)
+            cached = self.fetch_cache.lookup(facility_number, year, month, result, digest)
+            if cached is not None:
+                logger.debug(f"    {year}-{month} 변경 없음, 캐시 사용")
+                return completed(cached)
+            if result.not_modified:
+                logger.warning(f"캐시 항목 없이 304 응답을 받았습니다: {facility_number}, {year}-{month}")
+                return completed(None)
+
+        if self.parse_pool:
+            future = self.parse_pool.submit(result.html, facility_number, year, month)
+        else:
+            future = completed(self.parse_calendar_html(result.html, facility_number, year, month))
+
+        if self.fetch_cache:
+            # 파싱이 끝날 때까지 HTML 원문을 붙잡고 있지 않도록 검증자 헤더만 남김
+            validators = FetchResult(result.url, None, result.status, result.headers)
+
+            def store(future: Future):
+                if future.exception() is None:
+                    self.fetch_cache.store(facility_number, year, month, validators, digest, future.result())
+
+            future.add_done_callback(store)
+        return future
+
+    def crawl_reservations(self, facility_numbers: List[str]) -> NdjsonReservations:
+        """모든 예식장의 예약 정보 크롤링 (스케줄상 갱신할 달만 요청하고 나머지는 지난 결과 사용)
+
+        예식장 하나를 끝낼 때마다 NDJSON 스풀에 쓰고, 스풀을 다시 읽는 이터러블을 반환한다.
+        """
+        plan = self.plan_crawl(facility_numbers)
+        logger.info(f"예약 정보 크롤링 시작: {len(facility_numbers)}개 예식장")
 
         for facility_number in facility_numbers:
-            logger.info(f"예식장 {facility_number} 크롤링 중...")
+            fetched, pending = self.split_resumed(facility_number, plan[facility_number])
+            if pending:
+                logger.info(f"예식장 {facility_number} 크롤링 중... ({len(pending)}개월)")
+                self.crawl_facility_months(facility_number, pending, fetched)
+            self.stream_reservations(self.scheduler.assemble(facility_number, fetched))
+
+        reservations = self.spool.finish()
+        logger.info(f"예약 정보 크롤링 완료: 총 {len(reservations)}건")
+        return reservations
 
-            # wpnonce 가져오기
-            wpnonce = self.get_wpnonce(facility_number)
-            if not wpnonce:
-                logger.warning(f"예식장 {facility_number}: wpnonce를 가져올 수 없습니다")
-                continue
+    def crawl_facility_months(self, facility_number: str, months: List[YearMonth],
+                              fetched: Dict[YearMonth, List[Dict]]):
+        """예식장 하나의 여러 달을 순서대로 가져와서 fetched 에 추가 (가져오지 못한 달은 넣지 않음)
 
-            for month in range(1, 13):
-                logger.debug(f"  - {year}년 {month}월 크롤링...")
+        파싱 워커 풀이 있으면 이전 달을 파싱하는 동안 다음 달을 가져온다.
+        """
+        # wpnonce 가져오기
+        wpnonce = self.get_wpnonce(facility_number)
+        if not wpnonce:
+            logger.warning(f"예식장 {facility_number}: wpnonce를 가져올 수 없습니다")
+            return
 
-                try:
-                    reservations = self.fetch_reservations_for_month(facility_number, year, month, wpnonce)
-                    if reservations:
-                        all_reservations.extend(reservations)
-                        logger.debug(f"    {len(reservations)}건 발견")
-                except Exception as e:
-                    logger.error(f"예식장 {facility_number}, {year}-{month} 크롤링 실패: {e}")
-                    continue
+        parses = []
+        for year, month in months:
+            logger.debug(f"  - {year}년 {month}월 크롤링...")
 
-        logger.info(f"예약 정보 크롤링 완료: 총 {len(all_reservations)}건")
-        return all_reservations
+            try:
+                future = self.submit_reservations_for_month(facility_number, year, month, wpnonce)
+                # 캐시된 nonce 는 첫 결과로 확인될 때까지 파싱을 기다림
+                if not self.wpnonce_cache.is_verified(facility_number) and \
+                        self.needs_wpnonce_refresh(facility_number, future.result()):
+                    logger.info(f"예식장 {facility_number}: 캐시된 wpnonce로 캘린더를 가져오지 못해 새로 조회합니다")
+                    wpnonce = self.get_wpnonce(facility_number, refresh=True)
+                    if not wpnonce:
+                        logger.warning(f"예식장 {facility_number}: wpnonce를 가져올 수 없습니다")
+                        break
+                    future = self.submit_reservations_for_month(facility_number, year, month, wpnonce)
+                parses.append(((year, month), future))
+            except Exception as e:
+                logger.error(f"예식장 {facility_number}, {year}-{month} 크롤링 실패: {e}")
+                continue
+
+        for (year, month), future in parses:
+            try:
+                reservations = future.result()
+            except Exception as e:
+                logger.error(f"예식장 {facility_number}, {year}-{month} 파싱 실패: {e}")
+                continue
+            if reservations is not None:
+                fetched[(year, month)] = reservations
+                self.checkpoint_month(facility_number, year, month, reservations)
+                logger.debug(f"    {year}-{month} {len(reservations)}건 발견")
+
+    def save_state(self):
+        """실행 간에 유지되는 캐시 저장 및 요약 로그 출력"""
+        if self.fetch_cache:
+            self.fetch_cache.save()
+            logger.info(self.fetch_cache.summary())
+        self.wpnonce_cache.save()
+        logger.info(self.wpnonce_cache.summary())
+        self.facility_cache.save()
+        logger.info(self.facility_cache.summary())
+        self.scheduler.save()
+        if self.checkpoint:
+            self.checkpoint.close()
+        if self.archive:
+            self.archive.close()
+            logger.info(self.archive.summary())
+        logger.info(self.throttle.summary())
+
+    def export_metrics(self):
+        """실행 계측을 JSON 리포트 / Prometheus textfile 로 저장"""
+        if self.fetch_cache:
+            self.metrics.set_total('fetch_cache', self.fetch_cache.not_modified_hits, result='not_modified')
+            self.metrics.set_total('fetch_cache', self.fetch_cache.hash_hits, result='hash')
+            self.metrics.set_total('fetch_cache', self.fetch_cache.misses, result='miss')
+        self.metrics.set_total('facility_cache', self.facility_cache.hits, result='hit')
+        self.metrics.set_total('facility_cache', self.facility_cache.refreshes, result='refresh')
+        self.metrics.set_total('throttle_wait_seconds', self.throttle.stats['wait_seconds'])
+        self.metrics.set('throttle_rate', self.throttle.rate)
+        self.metrics.finish()
+        logger.info(self.metrics.summary())
+
+        try:
+            if self.metrics_json_path:
+                self.metrics.write_json(self.metrics_json_path)
+                logger.info(f"실행 리포트 저장: {self.metrics_json_path}")
+            if self.metrics_prom_path:
+                self.metrics.write_prometheus(self.metrics_prom_path)
+                logger.info(f"Prometheus 메트릭 저장: {self.metrics_prom_path}")
+        except OSError as e:
+            # 계측 저장 실패로 크롤링 결과를 버리지 않음
+            logger.error(f"계측 저장 실패: {e}")
+
+    def print_facilities(self, facilities: List[Dict]):
+        """발견한 예식장 목록 출력"""
+        for facility in facilities:
+            print(f"ID: {facility['facility_number']}, "
+                  f"지역: {facility['district']}, "
+                  f"이름: {facility['facility_name']}, "
+                  f"타입: {facility['location_type']}, "
+                  f"인원: {facility['capacity']}, "
+                  f"가격: {facility['price']}")
 
     def run(self):
         """크롤링 실행"""
+        if self.engine == "async":
+            engine = AsyncCrawlEngine(self, concurrency=self.concurrency,
+                                      per_host_concurrency=self.per_host_concurrency)
+            asyncio.run(engine.run())
+            return
+
         logger.info("예식장 목록 크롤링 시작")
 
-        with sync_playwright() as p:
-            # Chromium 브라우저 실행 (headless 모드)
-            self.browser = p.chromium.launch(headless=True)
-            self.context = self.browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080}
-            )
-            self.page = self.context.new_page()
+        # HTTP 페처는 폴백이 필요할 때만 브라우저를 실행 (재생 모드는 브라우저 없음)
+        if not self.http_fetcher and not self.replaying:
+            self.start_browser()
 
-            try:
-                # 모든 예식장 정보 가져오기
+        try:
+            # 모든 예식장 정보 가져오기
+            with self.metrics.span('phase', phase='get_all_facilities'):
                 facilities = self.get_all_facilities()
-                logger.info(f"총 {len(facilities)}개 예식장 발견")
-
-                if facilities:
-                    # 결과 출력
-                    for facility in facilities:
-                        print(f"ID: {facility['facility_number']}, "
-                              f"지역: {facility['district']}, "
-                              f"이름: {facility['facility_name']}, "
-                              f"타입: {facility['location_type']}, "
-                              f"인원: {facility['capacity']}, "
-                              f"가격: {facility['price']}")
-
-                    # 예약 정보 크롤링
-                    logger.info("\n예약 정보 크롤링 시작")
-                    facility_numbers = [f['facility_number'] for f in facilities]
+            logger.info(f"총 {len(facilities)}개 예식장 발견")
+
+            if facilities:
+                # 결과 출력
+                self.print_facilities(facilities)
+
+                # 예약 정보 크롤링
+                logger.info("\n예약 정보 크롤링 시작")
+                facility_numbers = self.select_facilities(facilities)
+                with self.metrics.span('phase', phase='crawl_reservations'):
                     reservations = self.crawl_reservations(facility_numbers)
 
-                    # JSON 파일로 저장
-                    self.save_to_json(facilities, reservations)
+                # JSON 파일 / 월별 샤드 (분할 크롤링이면 부분 결과)로 저장
+                with self.metrics.span('phase', phase='save_outputs'):
+                    self.save_results(facilities, facility_numbers, reservations)
+                self.complete_checkpoint()
 
-                else:
-                    logger.warning("파싱된 데이터가 없습니다")
+            else:
+                logger.warning("파싱된 데이터가 없습니다")
 
-            except Exception as e:
-                logger.error(f"크롤링 중 에러 발생: {e}")
-                raise
-            finally:
-                self.browser.close()
+            if self.http_fetcher:
+                logger.info(f"Playwright 폴백 횟수: {self.fallback_count}")
+
+        except Exception as e:
+            logger.error(f"크롤링 중 에러 발생: {e}")
+            raise
+        finally:
+            self.save_state()
+            self.close()
+            self.export_metrics()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="서울시 공공예식장 크롤러")
+    parser.add_argument("--json-path", default="../frontend/public/data.json", help="JSON 저장 경로")
+    parser.add_argument("--output", choices=["json", "sharded", "both"], default="json",
+                        help="출력 형식 (json: 단일 data.json, sharded: manifest + 월별 샤드, both: 둘 다)")
+    parser.add_argument("--shard-dir", default="../frontend/public/data", help="월별 샤드 출력 디렉토리")
+    parser.add_argument("--delta-path", default=None,
+                        help="이전 data.json 대비 변경분 파일 경로 (변경이 없으면 출력 파일을 다시 쓰지 않음)")
+    parser.add_argument("--aggregates-path", default=None,
+                        help="캘린더 UI 용 날짜/지역구/예식장별 집계 저장 경로 (예: ../frontend/public/aggregates.json)")
+    parser.add_argument("--db-path", default=None,
+                        help="SQLite DB 경로 (지정 시 출력 형식과 별개로 DB 에도 저장, 상태 변경 이력 누적)")
+    parser.add_argument("--base-url", default="https://wedding.seoulwomen.or.kr",
+                        help="크롤링 대상 사이트 주소 (예: 로컬 스텁 서버 http://127.0.0.1:8000)")
+    parser.add_argument("--engine", choices=["sync", "async"], default="sync",
+                        help="크롤링 엔진 (sync: 순차, async: 페이지 풀 동시 실행)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="async 엔진 전역 동시 요청 수 (HTTP 페처의 예식장 목록 페이지 동시 요청 수)")
+    parser.add_argument("--per-host-concurrency", type=int, default=4, help="async 엔진 호스트당 동시 요청 수")
+    parser.add_argument("--rate", type=float, default=1.0, help="시작 요청 속도 (초당 요청 수, 응답에 따라 자동 조절)")
+    parser.add_argument("--max-rate", type=float, default=8.0, help="최대 요청 속도 (초당 요청 수)")
+    parser.add_argument("--fetcher", choices=["playwright", "http"], default="playwright",
+                        help="페처 (playwright: 브라우저, http: HTTP 우선 + Playwright 폴백)")
+    parser.add_argument("--fetch-cache", default=None,
+                        help="캘린더 페치 캐시 파일 경로 (지정 시 변경 없는 달은 파싱 생략)")
+    parser.add_argument("--wpnonce-cache", default=None,
+                        help="_wpnonce 캐시 파일 경로 (지정 시 실행 간에 재사용, 캘린더 실패 시에만 재조회)")
+    parser.add_argument("--wpnonce-ttl", type=float, default=12, help="_wpnonce 캐시 유효 시간 (시간 단위)")
+    parser.add_argument("--metrics-json", default=None, help="실행 리포트(JSON) 저장 경로")
+    parser.add_argument("--metrics-prom", default=None,
+                        help="Prometheus textfile 저장 경로 (node_exporter textfile collector 용 .prom)")
+    parser.add_argument("--lean-browser", action="store_true",
+                        help="브라우저 경량 모드 (이미지/폰트/스타일시트, 분석 호스트 요청 차단)")
+    parser.add_argument("--page-memory-limit", type=int, default=browser_tuning.PAGE_MEMORY_LIMIT_MB,
+                        help="페이지당 렌더러 메모리 한도 (MB), 넘으면 브라우저 페이지 재생성 (0: 이동 횟수로만)")
+    parser.add_argument("--page-recycle-every", type=int, default=browser_tuning.PAGE_RECYCLE_NAVIGATIONS,
+                        help="렌더러 메모리를 잴 수 없을 때 브라우저 페이지를 이 횟수만큼 이동할 때마다 재생성 "
+                             "(0: 오류가 났을 때만)")
+    parser.add_argument("--parser", choices=["bs4", "lxml"], default="bs4",
+                        help="파서 엔진 (bs4: BeautifulSoup, lxml: 조각 추출 + XPath)")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="캘린더 파싱 워커 수 (0 이면 페치한 곳에서 바로 파싱)")
+    parser.add_argument("--parse-executor", choices=["thread", "process"], default="thread",
+                        help="파싱 워커 종류 (thread: 네트워크 대기와 겹침, process: CPU 파싱도 병렬)")
+    parser.add_argument("--ndjson-path", default=None,
+                        help="예약 정보를 예식장마다 바로 이어 쓰는 NDJSON 출력 경로")
+    parser.add_argument("--schedule-state", default=None,
+                        help="(예식장, 월) 갱신 스케줄 파일 경로 (지정하면 주기가 지나지 않은 달은 지난 결과 사용)")
+    parser.add_argument("--horizon-months", type=int, default=12,
+                        help="이번 달부터 크롤링할 개월 수")
+    parser.add_argument("--request-budget", type=int, default=0,
+                        help="실행당 최대 캘린더 요청 수 (0 이면 제한 없음, 지난 결과가 없는 달은 예산과 관계없이 가져옴)")
+    parser.add_argument("--archive", default=None,
+                        help="HTML 원문 아카이브 디렉토리 (지정하면 가져온 페이지를 내용 주소 방식으로 압축 저장)")
+    parser.add_argument("--replay", action="store_true",
+                        help="네트워크/브라우저 없이 --archive 에 기록된 원문을 다시 파싱")
+    parser.add_argument("--replay-as-of", default=None,
+                        help="이 시각(ISO 형식)까지의 기록만 재생 (기본값: URL 마다 가장 최근 기록)")
+    parser.add_argument("--checkpoint", default=None,
+                        help="체크포인트 파일 경로 (달마다 결과를 기록, 저장까지 끝나면 삭제)")
+    parser.add_argument("--resume", action="store_true",
+                        help="체크포인트에 남은 이전 실행 결과를 이어받아 완료된 달은 건너뜀")
+    parser.add_argument("--resume-max-age", type=float, default=3,
+                        help="이어받을 체크포인트 기록의 최대 나이 (시간 단위)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="상주 실행 (브라우저/세션/캐시를 유지한 채 --daemon-interval 마다 크롤링, 달라졌을 때만 저장)")
+    parser.add_argument("--daemon-interval", type=float, default=10, help="데몬 크롤링 사이클 간격 (분 단위)")
+    parser.add_argument("--facility-cache", default=None,
+                        help="예식장 목록 캐시 파일 경로 (지정 시 실행 간에 재사용, 가격/수용 인원 등 변경 이력 기록)")
+    parser.add_argument("--facilities-refresh", type=float, default=24,
+                        help="예식장 목록을 다시 가져오는 주기 (시간 단위, 그 전에는 캐시된 목록 사용)")
+    parser.add_argument("--status-host", default="127.0.0.1", help="데몬 상태 엔드포인트 주소")
+    parser.add_argument("--status-port", type=int, default=8765,
+                        help="데몬 상태 엔드포인트 포트 (/status, /metrics, 0 이면 사용 안 함)")
+    parser.add_argument("--shard-index", type=int, default=0, help="분할 크롤링 조각 번호 (0부터)")
+    parser.add_argument("--shard-count", type=int, default=1,
+                        help="분할 크롤링 조각 수 (2 이상이면 부분 결과만 저장, merge_partials.py 로 병합)")
+    parser.add_argument("--partial-dir", default="partials", help="분할 크롤링 부분 결과 디렉토리")
+    args = parser.parse_args()
+    if args.parse_workers < 0:
+        parser.error("--parse-workers 는 0 이상이어야 합니다")
+    if args.horizon_months < 1:
+        parser.error("--horizon-months 는 1 이상이어야 합니다")
+    if args.request_budget < 0:
+        parser.error("--request-budget 은 0 이상이어야 합니다")
+    if args.replay and not args.archive:
+        parser.error("--replay 는 --archive 와 함께 사용해야 합니다")
+    if args.replay_as_of and not args.replay:
+        parser.error("--replay-as-of 는 --replay 와 함께 사용해야 합니다")
+    if args.replay and (args.fetch_cache or args.schedule_state):
+        # 캐시나 스케줄이 있으면 기록된 원문을 다시 파싱하지 않고 지난 결과를 재사용함
+        parser.error("--replay 는 --fetch-cache/--schedule-state 와 함께 사용할 수 없습니다")
+    if args.daemon and (args.checkpoint or args.replay or args.shard_count > 1):
+        # 데몬은 진행 상황을 메모리에 유지하고 실패한 달은 다음 사이클에서 다시 가져옴
+        parser.error("--daemon 은 --checkpoint/--replay/--shard-count 와 함께 사용할 수 없습니다")
+    if args.facilities_refresh < 0:
+        parser.error("--facilities-refresh 는 0 이상이어야 합니다")
+    if args.daemon_interval <= 0:
+        parser.error("--daemon-interval 은 0 보다 커야 합니다")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume 은 --checkpoint 와 함께 사용해야 합니다")
+    if args.shard_count < 1 or not 0 <= args.shard_index < args.shard_count:
+        parser.error("--shard-index 는 0 이상 --shard-count 미만이어야 합니다")
+    if args.shard_count > 1 and (args.delta_path or args.db_path or args.aggregates_path):
+        # 부분 결과에는 전체 예약 정보가 없으므로 병합 단계에서 지정
+        parser.error("분할 크롤링에서는 --delta-path/--db-path/--aggregates-path 를 merge_partials.py 에 지정해야 합니다")
+    if args.delta_path and args.output == "sharded":
+        # 변경분은 data.json 을 이전 스냅샷으로 사용하므로 단일 파일 출력이 필요
+        parser.error("--delta-path 는 --output json 또는 both 와 함께 사용해야 합니다")
+    return args
 
 
 if __name__ == "__main__":
-    crawler = WeddingHallCrawler()
-    crawler.run()
+    args = parse_args()
+    crawler = WeddingHallCrawler(
+        json_path=args.json_path,
+        base_url=args.base_url,
+        output=args.output,
+        shard_dir=args.shard_dir,
+        delta_path=args.delta_path,
+        aggregates_path=args.aggregates_path,
+        archive_dir=args.archive,
+        archive_mode="replay" if args.replay else "record",
+        archive_as_of=args.replay_as_of,
+        db_path=args.db_path,
+        engine=args.engine,
+        concurrency=args.concurrency,
+        per_host_concurrency=args.per_host_concurrency,
+        fetcher=args.fetcher,
+        rate=args.rate,
+        max_rate=args.max_rate,
+        fetch_cache_path=args.fetch_cache,
+        wpnonce_cache_path=args.wpnonce_cache,
+        wpnonce_ttl_hours=args.wpnonce_ttl,
+        parser=args.parser,
+        metrics_json_path=args.metrics_json,
+        metrics_prom_path=args.metrics_prom,
+        lean_browser=args.lean_browser,
+        page_recycle_every=args.page_recycle_every,
+        page_memory_limit=args.page_memory_limit,
+        shard_index=args.shard_index,
+        shard_count=args.shard_count,
+        partial_dir=args.partial_dir,
+        checkpoint_path=args.checkpoint,
+        resume=args.resume,
+        resume_max_age_hours=args.resume_max_age,
+        schedule_path=args.schedule_state,
+        horizon_months=args.horizon_months,
+        request_budget=args.request_budget,
+        parse_workers=args.parse_workers,
+        parse_executor=args.parse_executor,
+        ndjson_path=args.ndjson_path,
+        facility_cache_path=args.facility_cache,
+        facilities_refresh_hours=args.facilities_refresh,
+    )
+    if args.daemon:
+        CrawlDaemon(crawler, interval_minutes=args.daemon_interval,
+                    status_host=args.status_host, status_port=args.status_port or None).run()
+    else:
+        crawler.run()
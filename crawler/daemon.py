@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""상주 크롤링 데몬
+
+    python crawler.py --daemon --fetcher http --daemon-interval 10 --status-port 8765
+    curl http://127.0.0.1:8765/status
+
+프로세스 하나가 브라우저/HTTP 세션, wpnonce 캐시, 예식장 목록, 갱신 스케줄과 지난 결과,
+마지막으로 저장한 스냅샷을 메모리에 둔 채 일정 간격으로 크롤링 사이클을 반복한다.
+사이클마다 스케줄상 갱신할 달만 가져오고, 결과가 마지막 스냅샷과 같으면 출력 파일을 쓰지 않는다.
+상태는 로컬 HTTP 엔드포인트(/status JSON, /metrics Prometheus 텍스트)로 확인한다.
+"""
+
+import asyncio
+import json
+import logging
+import signal
+import threading
+import time
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import changelog
+from async_engine import AsyncCrawlEngine
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlDaemon:
+    """WeddingHallCrawler 를 상주시키며 crawl 사이클을 반복 실행"""
+
+    def __init__(self, crawler, interval_minutes: float = 10,
+                 status_host: str = "127.0.0.1", status_port: Optional[int] = 8765):
+        self.crawler = crawler
+        self.interval = interval_minutes * 60
+        self.metrics = crawler.metrics
+        # 파일 없이도 사이클 사이에 달마다 지난 결과를 유지해서 갱신 주기를 적용
+        crawler.scheduler.retain = True
+        # async 엔진은 이벤트 루프 하나를 계속 써서 페이지 풀과 세마포어를 사이클 간에 유지
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.engine: Optional[AsyncCrawlEngine] = None
+        if crawler.engine == "async":
+            self.loop = asyncio.new_event_loop()
+            self.engine = AsyncCrawlEngine(crawler, concurrency=crawler.concurrency,
+                                           per_host_concurrency=crawler.per_host_concurrency)
+        self.facilities: List[Dict] = []
+        # 마지막으로 저장한(또는 시작 시 읽은) 스냅샷
+        self.last_facilities: Optional[List[Dict]] = None
+        self.last_reservations: Optional[List[Dict]] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._status: Dict = {
+            'state': 'starting',
+            'engine': crawler.engine,
+            'startedAt': datetime.now().isoformat(),
+            'cycles': 0,
+            'failures': 0,
+            'lastCycleStartedAt': None,
+            'lastCycleSeconds': None,
+            'lastSuccessAt': None,
+            'lastChangedAt': None,
+            'lastError': None,
+            'nextCycleAt': None,
+            'facilities': 0,
+            'reservations': 0,
+        }
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+        if status_port is not None:
+            self.httpd = ThreadingHTTPServer((status_host, status_port), self._handler_class())
+            self.httpd.daemon_threads = True
+
+    @property
+    def status_url(self) -> Optional[str]:
+        if not self.httpd:
+            return None
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def status(self) -> Dict:
+        with self._lock:
+            status = dict(self._status)
+        status['facilitiesFetchedAt'] = self.crawler.facility_cache.fetched_at
+        status['throttleRate'] = round(self.crawler.throttle.rate, 3)
+        return status
+
+    def _update(self, **values):
+        with self._lock:
+            self._status.update(values)
+
+    def _handler_class(self):
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                if path in ('/', '/status'):
+                    body = json.dumps(daemon.status(), ensure_ascii=False, indent=2)
+                    self._send(200, body, 'application/json; charset=utf-8')
+                elif path == '/metrics':
+                    self._send(200, daemon.metrics.prometheus(), 'text/plain; version=0.0.4')
+                else:
+                    self._send(404, 'Not Found', 'text/plain')
+
+            def _send(self, status: int, body: str, content_type: str):
+                payload = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+    def get_all_facilities(self) -> List[Dict]:
+        if self.engine:
+            return self.loop.run_until_complete(self.engine.get_all_facilities())
+        return self.crawler.get_all_facilities()
+
+    def crawl_reservations(self, facility_numbers: List[str]) -> List[Dict]:
+        if self.engine:
+            return self.loop.run_until_complete(self.engine.crawl_reservations(facility_numbers))
+        return self.crawler.crawl_reservations(facility_numbers)
+
+    def load_snapshot(self):
+        """기존 data.json 을 마지막 스냅샷으로 사용 (같은 결과면 첫 사이클에서도 다시 쓰지 않음)"""
+        if self.crawler.output == "sharded" or self.crawler.shard_count > 1:
+            return
+        previous = changelog.load_snapshot(self.crawler.json_path)
+        if previous:
+            self.last_facilities = previous.get('facilities')
+            self.last_reservations = previous.get('reservations')
+
+    def refresh_facilities(self) -> bool:
+        """예식장 목록 (크롤러의 목록 캐시가 갱신 주기가 지났을 때만 다시 가져오고, 실패하면 이전 목록 유지)"""
+        with self.metrics.span('phase', phase='get_all_facilities'):
+            facilities = self.get_all_facilities()
+        if not facilities:
+            logger.warning("예식장 목록을 가져오지 못했습니다")
+            return False
+        self.facilities = facilities
+        self._update(facilities=len(facilities))
+        return True
+
+    def run_cycle(self):
+        """크롤링 사이클 한 번 (갱신할 달만 가져오고, 달라졌을 때만 저장)"""
+        crawler = self.crawler
+        started = time.time()
+        self._update(state='crawling', lastCycleStartedAt=datetime.fromtimestamp(started).isoformat())
+        # 날짜가 바뀌면 크롤링 범위도 옮기고, 사이트가 nonce 를 바꿨을 수 있으므로 다시 확인
+        crawler.scheduler.roll(date.today())
+        crawler.wpnonce_cache.start_run()
+        try:
+            with self.metrics.span('daemon_cycle'):
+                if not self.refresh_facilities():
+                    raise RuntimeError("예식장 목록이 없습니다")
+                facility_numbers = crawler.select_facilities(self.facilities)
+                with self.metrics.span('phase', phase='crawl_reservations'):
+                    # 다음 사이클과 비교할 스냅샷으로 남기므로 목록으로 읽음
+                    reservations = list(self.crawl_reservations(facility_numbers))
+
+                if self.facilities == self.last_facilities and reservations == self.last_reservations:
+                    logger.info("마지막 스냅샷과 달라진 내용이 없어 저장을 생략합니다")
+                    crawler.spool.abort()
+                else:
+                    with self.metrics.span('phase', phase='save_outputs'):
+                        crawler.save_results(self.facilities, facility_numbers, reservations)
+                    self.last_facilities = self.facilities
+                    self.last_reservations = reservations
+                    self._update(lastChangedAt=datetime.now().isoformat())
+                    self.metrics.inc('daemon_changes')
+            self.metrics.inc('daemon_cycles', result='ok')
+            self._update(lastSuccessAt=datetime.now().isoformat(), lastError=None, reservations=len(reservations))
+        except Exception as e:
+            # 사이클 하나가 실패해도 데몬은 계속 실행 (다음 사이클에서 다시 시도)
+            logger.error(f"크롤링 사이클 실패: {e}")
+            self.metrics.inc('daemon_cycles', result='error')
+            with self._lock:
+                self._status['failures'] += 1
+                self._status['lastError'] = f"{type(e).__name__}: {e}"
+        finally:
+            crawler.save_state()
+            crawler.export_metrics()
+            with self._lock:
+                self._status['cycles'] += 1
+                self._status['lastCycleSeconds'] = round(time.time() - started, 3)
+                self._status['state'] = 'idle'
+
+    def stop(self):
+        """진행 중인 사이클이 끝나면 종료"""
+        self._stop.set()
+
+    def _install_signal_handlers(self):
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        def handle(signum, frame):
+            if self._stop.is_set():
+                # 두 번째 신호는 사이클을 기다리지 않고 중단
+                raise KeyboardInterrupt
+            logger.info("종료 신호를 받았습니다. 진행 중인 사이클이 끝나면 종료합니다")
+            self.stop()
+
+        signal.signal(signal.SIGINT, handle)
+        signal.signal(signal.SIGTERM, handle)
+
+    def run(self, max_cycles: int = 0):
+        """stop() 이나 종료 신호까지 사이클 반복 (max_cycles > 0 이면 그 횟수만큼)"""
+        self._install_signal_handlers()
+        if self.httpd:
+            self._server_thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+            self._server_thread.start()
+            logger.info(f"상태 엔드포인트: {self.status_url}/status")
+        logger.info(f"크롤링 데몬 시작: {self.interval / 60:g}분 간격, "
+                    f"예식장 목록 {self.crawler.facility_cache.refresh.total_seconds() / 3600:g}시간마다 갱신")
+        self.load_snapshot()
+        cycles = 0
+        try:
+            while not self._stop.is_set():
+                started = time.time()
+                self.run_cycle()
+                cycles += 1
+                if max_cycles and cycles >= max_cycles:
+                    break
+                next_at = started + self.interval
+                self._update(nextCycleAt=datetime.fromtimestamp(next_at).isoformat())
+                self._stop.wait(max(next_at - time.time(), 0))
+        finally:
+            self._update(state='stopping', nextCycleAt=None)
+            self.close()
+
+    def close(self):
+        """브라우저/페이지 풀, HTTP 세션, 상태 엔드포인트 종료"""
+        if self.engine:
+            self.loop.run_until_complete(self.engine.close())
+            self.loop.close()
+        self.crawler.close()
+        if self.httpd:
+            if self._server_thread:
+                self.httpd.shutdown()
+            self.httpd.server_close()
+        logger.info("크롤링 데몬 종료")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 변경 이력으로 추적하는 예식장 필드
+TRACKED_FIELDS = ('district', 'facility_name', 'location_type', 'capacity', 'price', 'url')
+# 캐시 파일에 남기는 최근 변경 이력 수
+MAX_CHANGES = 1000
+
+
+def merge_listing_pages(pages: List[List[Dict]]) -> List[Dict]:
+    """페이지 순서대로 예식장 목록 합치기 (여러 페이지에 나온 예식장은 처음 나온 것만)"""
+    merged = []
+    seen = set()
+    for facilities in pages:
+        for facility in facilities:
+            if facility['facility_number'] not in seen:
+                seen.add(facility['facility_number'])
+                merged.append(facility)
+    return merged
+
+
+def diff_facilities(previous: List[Dict], current: List[Dict], detected_at: str) -> List[Dict]:
+    """두 예식장 목록의 변경 사항 (added / removed / changed, changed 는 필드마다 한 건)"""
+    before = {f['facility_number']: f for f in previous}
+    after = {f['facility_number']: f for f in current}
+    changes = []
+    for number, facility in after.items():
+        old = before.get(number)
+        if old is None:
+            changes.append({'detected_at': detected_at, 'facility_number': number, 'change': 'added',
+                            'facility_name': facility.get('facility_name')})
+            continue
+        for field in TRACKED_FIELDS:
+            if old.get(field) != facility.get(field):
+                changes.append({'detected_at': detected_at, 'facility_number': number, 'change': 'changed',
+                                'field': field, 'old': old.get(field), 'new': facility.get(field)})
+    for number, facility in before.items():
+        if number not in after:
+            changes.append({'detected_at': detected_at, 'facility_number': number, 'change': 'removed',
+                            'facility_name': facility.get('facility_name')})
+    return changes
+
+
+class FacilityCache:
+    """예식장 목록 캐시와 메타데이터 변경 이력
+
+    목록 페이지에서 가져온 예식장 목록을 refresh_hours 동안 재사용하고, 새로 가져올 때마다
+    이전 목록과 비교해서 추가/삭제된 예식장과 가격, 수용 인원 등 바뀐 필드를 기록한다.
+    path 를 주면 JSON 파일에 저장해서 실행 간에도 재사용하고, 주지 않으면 한 번의 실행
+    (데몬이면 프로세스) 안에서만 재사용한다.
+    """
+
+    def __init__(self, path: Optional[str] = None, refresh_hours: float = 24):
+        self.path = Path(path) if path else None
+        self.refresh = timedelta(hours=refresh_hours)
+        self.facilities: List[Dict] = []
+        self.fetched_at: Optional[str] = None
+        self.changes: List[Dict] = []
+        self.hits = 0
+        self.refreshes = 0
+        self.changed = 0
+        self.load()
+
+    def load(self):
+        """캐시 파일 읽기 (없거나 손상되었으면 빈 캐시로 시작)"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.facilities = data.get('facilities', [])
+            self.fetched_at = data.get('fetched_at')
+            self.changes = data.get('changes', [])
+            logger.info(f"예식장 목록 캐시 로드: {len(self.facilities)}개, {self.fetched_at} ({self.path})")
+        except (OSError, ValueError) as e:
+            logger.warning(f"예식장 목록 캐시를 읽을 수 없어 새로 시작합니다: {e}")
+            self.facilities, self.fetched_at, self.changes = [], None, []
+
+    def save(self):
+        """캐시 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path or not self.facilities:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'fetched_at': self.fetched_at, 'facilities': self.facilities,
+                       'changes': self.changes[-MAX_CHANGES:]}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def _fresh(self) -> bool:
+        try:
+            fetched_at = datetime.fromisoformat(self.fetched_at)
+        except (TypeError, ValueError):
+            return False
+        return datetime.now() - fetched_at < self.refresh
+
+    def get(self) -> Optional[List[Dict]]:
+        """갱신 주기가 지나지 않은 목록 반환, 없으면 None"""
+        if not self.facilities or not self._fresh():
+            return None
+        self.hits += 1
+        logger.info(f"캐시된 예식장 목록 사용: {len(self.facilities)}개 ({self.fetched_at} 기준)")
+        return list(self.facilities)
+
+    def update(self, facilities: List[Dict], complete: bool = True) -> List[Dict]:
+        """새로 가져온 목록 저장 후 이전 목록 대비 변경 사항 반환
+
+        목록을 가져오지 못했거나(빈 목록) 일부 페이지가 빠져서 complete 가 아니면 캐시를
+        바꾸지 않고 빈 변경 사항을 반환한다 (빠진 예식장을 삭제로 기록하지 않도록).
+        """
+        if not facilities or not complete:
+            if self.facilities:
+                logger.warning(f"예식장 목록을 모두 가져오지 못해 캐시된 목록을 사용합니다 ({self.fetched_at} 기준)")
+            return []
+        now = datetime.now().isoformat()
+        # 처음 가져온 목록은 비교 대상이 없으므로 변경으로 기록하지 않음
+        changes = diff_facilities(self.facilities, facilities, now) if self.facilities else []
+        self.facilities = list(facilities)
+        self.fetched_at = now
+        self.changes.extend(changes)
+        self.refreshes += 1
+        self.changed += len(changes)
+        return changes
+
+    def summary(self) -> str:
+        return (f"예식장 목록 캐시: 사용 {self.hits}회, 새로 가져옴 {self.refreshes}회, "
+                f"변경 {self.changed}건")
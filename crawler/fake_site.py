@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""wedding.seoulwomen.or.kr 사이트 대역 (네트워크 없이 크롤러를 실행/측정할 때 사용)
+
+사이트 대역은 이 모듈 하나에 모으고, 새 페이지나 동작도 여기에 추가한다.
+
+- FakeSite: 목록/상세/캘린더 페이지 생성 (URL → 상태 코드, HTML)
+- FakeSiteFetcher: FakeSite 를 프로세스 안에서 호출하는 페처 (벤치마크용)
+- StubServer: FakeSite 를 제공하는 로컬 HTTP 서버. 지연, 에러율, 속도 제한, 예식장 수를
+  조정할 수 있어서 크롤러의 동시성과 재시도 동작을 측정할 수 있다.
+
+    python fake_site.py --port 8000 --facilities 200 --latency 0.15 --error-rate 0.02
+    python crawler.py --fetcher http --base-url http://127.0.0.1:8000
+"""
+
+import argparse
+import calendar
+import gzip
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import formatdate
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from fetchers import FetchResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEED_PATH = Path(__file__).resolve().parent.parent / "frontend" / "public" / "data.json"
+
+PAGE_HEAD = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{title} - 서울시 공공예식장</title>
+<link rel="stylesheet" href="/wp-content/themes/wedding/style.css">
+<script src="/wp-includes/js/jquery/jquery.min.js"></script>
+</head>
+<body>
+<header class="flex items-center justify-between px-4 lg:px-10">
+<nav><ul class="flex gap-6">{nav}</ul></nav>
+</header>
+<main class="container mx-auto">
+"""
+
+PAGE_FOOT = """</main>
+<footer class="bg-grey100 py-10"><ul class="flex gap-4">{nav}</ul>
+<p class="body3 text-grey600">서울특별시 여성가족재단</p></footer>
+</body>
+</html>
+"""
+
+NAV_ITEMS = ''.join(f'<li><a href="/menu/{i}" class="body2 text-grey800">메뉴 {i}</a></li>' for i in range(12))
+
+TD_CLASS = "lg:w-[129px] py-2 px-1 border lg:p-4 border-grey400 h-[60px] lg:h-[120px]"
+CONFIRMED_DIV = ('<div class="inline-block bg-grey800 w-full text-center rounded text-white">'
+                 '예약확정<span class="text-xs">{slot}</span></div>')
+AVAILABLE_DIV = ('<div class="inline-block w-full text-center rounded border border-grey800 text-grey800">'
+                 '<a href="#reserve">{label} 예약가능</a></div>')
+UNAVAILABLE_DIV = ('<div class="inline-block w-full text-center rounded text-grey500" '
+                   'style="background: linear-gradient(0deg, #E9E5E5 0%, #E9E5E5 100%), #F5F3EC;">예약불가</div>')
+
+
+def _page(title: str, body: str) -> str:
+    return PAGE_HEAD.format(title=escape(title), nav=NAV_ITEMS) + body + PAGE_FOOT.format(nav=NAV_ITEMS)
+
+
+def load_seed_facilities(path: Optional[str] = None) -> List[Dict]:
+    """data.json 형식 파일에서 예식장 목록 읽기"""
+    with open(path or DEFAULT_SEED_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)['facilities']
+
+
+def synthetic_facilities(count: int, seed_facilities: Optional[List[Dict]] = None,
+                         base_url: str = "https://wedding.seoulwomen.or.kr") -> List[Dict]:
+    """시드 예식장을 복제해 count 개의 data.json 형식 예식장 목록 생성"""
+    seeds = seed_facilities or load_seed_facilities()
+    facilities = []
+    for i in range(count):
+        seed = seeds[i % len(seeds)]
+        # 시드를 한 바퀴 돌 때마다 새 번호 대역 사용
+        facility_number = seed['facility_number'] if i < len(seeds) else str(10000 * (i // len(seeds)) + int(seed['facility_number']))
+        facility = dict(seed)
+        facility['facility_number'] = facility_number
+        facility['url'] = f"{base_url}/facilities/{facility_number}"
+        facilities.append(facility)
+    return facilities
+
+
+def facility_nonce(facility_number: str, seed: int = 0) -> str:
+    """예식장별 고정 _wpnonce 값"""
+    return hashlib.md5(f"{facility_number}:{seed}".encode()).hexdigest()[:10]
+
+
+def slot_states(facility_number: str, year: int, month: int, seed: int = 0) -> Dict[int, List[Tuple[str, str]]]:
+    """날짜별 (시간대, 상태) 목록을 결정적으로 생성 (상태: confirmed/available/unavailable)"""
+    rng = random.Random(f"{facility_number}-{year}-{month}-{seed}")
+    days = calendar.monthrange(year, month)[1]
+    states = {}
+    for day in range(1, days + 1):
+        slots = []
+        for slot in ('L', 'D'):
+            roll = rng.random()
+            if roll < 0.35:
+                slots.append((slot, 'confirmed'))
+            elif roll < 0.6:
+                slots.append((slot, 'available'))
+            elif roll < 0.85:
+                slots.append((slot, 'unavailable'))
+        states[day] = slots
+    return states
+
+
+def render_calendar_tbody(facility_number: str, year: int, month: int, seed: int = 0) -> str:
+    """실제 사이트와 같은 구조의 캘린더 tbody 생성"""
+    states = slot_states(facility_number, year, month, seed)
+    rows = []
+    for week in calendar.Calendar(firstweekday=6).monthdayscalendar(year, month):
+        cells = []
+        for day in week:
+            if day == 0:
+                cells.append(f'<td class="{TD_CLASS}"></td>')
+                continue
+            divs = []
+            for slot, status in states[day]:
+                if status == 'confirmed':
+                    divs.append(CONFIRMED_DIV.format(slot=slot))
+                elif status == 'available':
+                    divs.append(AVAILABLE_DIV.format(label='오전' if slot == 'L' else '오후'))
+                else:
+                    divs.append(UNAVAILABLE_DIV)
+            cells.append(
+                f'<td class="{TD_CLASS}"><div class="flex flex-col justify-between h-full">'
+                f'<span class="inline-block text-grey600">{day}</span>'
+                f'<span class="flex flex-col gap-1 lg:gap-2 text-[10px] leading-4 lg:body3">{"".join(divs)}</span>'
+                f'</div></td>'
+            )
+        rows.append(f"<tr>{''.join(cells)}</tr>")
+    return f"<tbody>{''.join(rows)}</tbody>"
+
+
+def render_calendar_page(facility: Dict, year: int, month: int, wpnonce: str, seed: int = 0) -> str:
+    """예식장 상세 페이지 (nonce 가 포함된 월 이동 링크 + 캘린더)"""
+    number = facility['facility_number']
+    prev_year, prev_month = (year - 1, 12) if month == 1 else (year, month - 1)
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    head = ''.join(f'<th class="py-2 border border-grey400">{d}</th>' for d in '일월화수목금토')
+    body = (
+        f'<section class="facility-detail"><h1 class="h4">{escape(facility.get("facility_name", ""))}</h1>'
+        f'<div class="calendar-nav flex justify-between">'
+        f'<a href="/facilities/{number}?to={prev_year}-{prev_month}&_wpnonce={wpnonce}">이전달</a>'
+        f'<span class="h6">{year}.{month:02d}</span>'
+        f'<a href="/facilities/{number}?to={next_year}-{next_month}&_wpnonce={wpnonce}">다음달</a></div>'
+        f'<table class="w-full"><thead><tr>{head}</tr></thead>'
+        f'{render_calendar_tbody(number, year, month, seed)}</table></section>'
+    )
+    return _page(facility.get('facility_name', number), body)
+
+
+def render_pagination(page: int, page_count: int) -> str:
+    """WordPress 식 페이지네이션 (nav.pagination 의 a.page-numbers 링크)"""
+    links = []
+    for n in range(1, page_count + 1):
+        href = "/facilities" if n == 1 else f"/facilities/page/{n}"
+        if n == page:
+            links.append(f'<span aria-current="page" class="page-numbers current">{n}</span>')
+        else:
+            links.append(f'<a class="page-numbers" href="{href}">{n}</a>')
+    return f'<nav class="navigation pagination"><div class="nav-links">{"".join(links)}</div></nav>'
+
+
+def render_listing_page(facilities: List[Dict], page: int = 1, page_count: int = 1) -> str:
+    """예식장 목록 페이지 (ul.archive_list-container.facilities, 여러 페이지면 페이지네이션 포함)"""
+    items = []
+    for facility in facilities:
+        items.append(
+            f'<li class="archive_list-item"><a href="/facilities/{facility["facility_number"]}" class="block">'
+            f'<img src="/wp-content/uploads/{facility["facility_number"]}.jpg" alt="">'
+            f'<span class="inline-block lg:h8 text-grey600">{escape(facility["district"])}</span>'
+            f'<p class="mb-2 lg:h5 h6">{escape(facility["facility_name"])}</p>'
+            f'<div class="mb-4 Mh8 flex gap-2"><span>{escape(facility["location_type"])}</span>'
+            f'<span>{escape(facility["capacity"])}</span><span>{escape(facility["price"])}</span></div>'
+            f'</a></li>'
+        )
+    body = f'<ul class="archive_list-container facilities grid lg:grid-cols-3 gap-6">{"".join(items)}</ul>'
+    if page_count > 1:
+        body += render_pagination(page, page_count)
+    return _page("공공예식장 찾기", body)
+
+
+class FakeSite:
+    """wedding.seoulwomen.or.kr 의 URL 구조를 흉내 내는 결정적 가짜 사이트"""
+
+    def __init__(self, facilities: List[Dict], per_page: int = 9, seed: int = 0,
+                 today: Tuple[int, int] = (2026, 1)):
+        self.facilities = facilities
+        self.by_number = {f['facility_number']: f for f in facilities}
+        self.per_page = per_page
+        self.seed = seed
+        self.today = today
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.facilities) // self.per_page))
+
+    def render(self, path: str, query: Dict[str, str]) -> Tuple[int, str]:
+        """경로와 쿼리로 (상태 코드, HTML) 반환"""
+        parts = [p for p in path.split('/') if p]
+        if not parts or parts[0] != 'facilities':
+            return 404, _page("Not Found", "<p>페이지를 찾을 수 없습니다</p>")
+
+        if len(parts) == 1 or (len(parts) == 3 and parts[1] == 'page' and parts[2].isdigit()):
+            page = int(parts[2]) if len(parts) == 3 else 1
+            if page < 1 or page > self.page_count:
+                return 404, _page("Not Found", "<p>페이지를 찾을 수 없습니다</p>")
+            start = (page - 1) * self.per_page
+            return 200, render_listing_page(self.facilities[start:start + self.per_page], page, self.page_count)
+
+        if len(parts) == 2 and parts[1] in self.by_number:
+            facility = self.by_number[parts[1]]
+            nonce = facility_nonce(parts[1], self.seed)
+            year, month = self.today
+            if 'to' in query:
+                if query.get('_wpnonce') != nonce:
+                    return 403, _page("Forbidden", "<p>잘못된 요청입니다</p>")
+                try:
+                    year, month = (int(v) for v in query['to'].split('-'))
+                except ValueError:
+                    return 400, _page("Bad Request", "<p>잘못된 요청입니다</p>")
+            return 200, render_calendar_page(facility, year, month, nonce, self.seed)
+
+        return 404, _page("Not Found", "<p>페이지를 찾을 수 없습니다</p>")
+
+    def render_url(self, url: str) -> Tuple[int, str]:
+        parsed = urlparse(url)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        return self.render(parsed.path, query)
+
+
+class FakeSiteFetcher:
+    """HttpFetcher 대신 FakeSite 를 프로세스 안에서 호출하는 페처 (네트워크 없음)"""
+
+    def __init__(self, site: FakeSite):
+        self.site = site
+        self.requests = 0
+        self.bytes = 0
+
+    def get(self, url: str, retries: int = 3) -> Optional[str]:
+        result = self.fetch(url, retries=retries)
+        return result.html if result else None
+
+    def fetch(self, url: str, retries: int = 3, headers: Optional[Dict[str, str]] = None) -> Optional[FetchResult]:
+        self.requests += 1
+        status, html = self.site.render_url(url)
+        if status != 200:
+            return None
+        self.bytes += len(html.encode('utf-8'))
+        return FetchResult(url, html, status=status, headers={'Content-Type': 'text/html; charset=UTF-8'})
+
+    def close(self):
+        pass
+
+
+class StubConfig:
+    """스텁 서버 동작 설정"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 rate_limit: float = 0.0, burst: int = 10, random_seed: Optional[int] = None):
+        # 응답 지연(초)과 ±jitter(초)
+        self.latency = latency
+        self.jitter = jitter
+        # 500/503 을 돌려줄 확률
+        self.error_rate = error_rate
+        # 초당 허용 요청 수 (0 이면 제한 없음), 넘으면 429
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.rng = random.Random(random_seed)
+
+
+class StubServer:
+    """FakeSite 를 제공하는 스레드 HTTP 서버"""
+
+    def __init__(self, site: FakeSite, config: Optional[StubConfig] = None,
+                 host: str = "127.0.0.1", port: int = 0):
+        self.site = site
+        self.config = config or StubConfig()
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._tokens = float(self.config.burst)
+        self._last_refill = time.monotonic()
+        self._last_modified = formatdate(time.time(), usegmt=True)
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _take_token(self) -> bool:
+        if not self.config.rate_limit:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.config.burst, self._tokens + (now - self._last_refill) * self.config.rate_limit)
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def do_GET(self):
+                server._count('requests')
+                parsed = urlparse(self.path)
+
+                if parsed.path == '/__stats':
+                    self._send(200, json.dumps(dict(server.stats)), 'application/json')
+                    return
+
+                if not server._take_token():
+                    server._count('status_429')
+                    self._send(429, "Too Many Requests", 'text/plain', {'Retry-After': '1'})
+                    return
+
+                config = server.config
+                delay = config.latency + config.rng.uniform(-config.jitter, config.jitter)
+                if delay > 0:
+                    time.sleep(delay)
+
+                if config.error_rate and config.rng.random() < config.error_rate:
+                    status = config.rng.choice((500, 503))
+                    server._count(f'status_{status}')
+                    self._send(status, "Server Error", 'text/plain')
+                    return
+
+                query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                status, html = server.site.render(parsed.path, query)
+
+                etag = '"' + hashlib.md5(html.encode('utf-8')).hexdigest() + '"'
+                if status == 200 and self.headers.get('If-None-Match') == etag:
+                    server._count('status_304')
+                    self._send(304, None, None, {'ETag': etag, 'Last-Modified': server._last_modified})
+                    return
+
+                server._count(f'status_{status}')
+                headers = {'ETag': etag, 'Last-Modified': server._last_modified} if status == 200 else {}
+                self._send(status, html, 'text/html; charset=UTF-8', headers)
+
+            def _send(self, status: int, body: Optional[str], content_type: Optional[str], headers=None):
+                payload = body.encode('utf-8') if body is not None else b''
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                if content_type:
+                    self.send_header('Content-Type', content_type)
+                if payload and 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    payload = gzip.compress(payload, compresslevel=5)
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                if payload:
+                    self.wfile.write(payload)
+                    with server._lock:
+                        server.stats['bytes_sent'] += len(payload)
+
+        return Handler
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="공공예식장 사이트 대역 로컬 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--seed-file", default=None, help="data.json 형식 시드 파일 (기본: frontend/public/data.json)")
+    parser.add_argument("--facilities", type=int, default=None, help="제공할 예식장 수 (기본: 시드 파일의 예식장 수)")
+    parser.add_argument("--per-page", type=int, default=9, help="목록 페이지당 예식장 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연 편차 (±초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500/503 응답 확률 (0~1)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="초당 허용 요청 수 (0: 제한 없음, 초과 시 429)")
+    parser.add_argument("--burst", type=int, default=10, help="속도 제한 버스트 크기")
+    parser.add_argument("--seed", type=int, default=0, help="예약 상태 생성 시드")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    args = parse_args()
+
+    seeds = load_seed_facilities(args.seed_file)
+    facilities = synthetic_facilities(args.facilities or len(seeds), seeds)
+    site = FakeSite(facilities, per_page=args.per_page, seed=args.seed)
+    config = StubConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                        rate_limit=args.rate_limit, burst=args.burst)
+    server = StubServer(site, config, host=args.host, port=args.port)
+
+    logger.info(f"스텁 서버 시작: {server.base_url} (예식장 {len(facilities)}개, 목록 {site.page_count}페이지)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        logger.info(f"요청 통계: {dict(server.stats)}")
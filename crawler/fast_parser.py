@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+import re
+from typing import Dict, List
+
+import lxml.html
+from lxml import etree
+
+from fetchers import extract_facilities_container, extract_tbody
+
+logger = logging.getLogger(__name__)
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# parse_calendar 의 BeautifulSoup 조건과 같은 의미의 XPath
+CALENDAR_TDS = etree.XPath('.//td')
+DATE_SPAN = etree.XPath(f"(.//span[{_has_class('text-grey600')}])[1]")
+STATUS_SPAN = etree.XPath("(.//span[contains(@class, 'flex-col')])[1]")
+STATUS_DIVS = etree.XPath(".//div[contains(@class, 'inline-block') and contains(@class, 'text-center')]")
+
+# parse_facilities 의 CSS 셀렉터와 같은 의미의 XPath
+FACILITY_LINKS = etree.XPath('.//a[@href]')
+DISTRICT_SPAN = etree.XPath(f"(.//span[{_has_class('inline-block')} and {_has_class('lg:h8')}])[1]")
+NAME_P = etree.XPath(f"(.//p[{_has_class('mb-2')} and {_has_class('lg:h5')}])[1]")
+INFO_DIV = etree.XPath(f"(.//div[{_has_class('mb-4')} and {_has_class('Mh8')}])[1]")
+INFO_SPANS = etree.XPath('.//span')
+
+FACILITY_HREF_PATTERN = re.compile(r'/facilities/(\d+)')
+TIME_SLOTS = ('L', 'D')
+
+
+def _text(element) -> str:
+    """BeautifulSoup get_text(strip=True) 와 같은 결과"""
+    return ''.join(s.strip() for s in element.itertext() if s.strip())
+
+
+def _first(xpath, element):
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def parse_calendar_html(html: str, facility_number: str, year: int, month: int) -> List[Dict]:
+    """첫 번째 tbody 조각만 잘라 lxml 로 캘린더 예약 정보 파싱 (parse_calendar 와 동일한 결과)"""
+    reservations = []
+
+    tbody_html = extract_tbody(html) if html else None
+    if not tbody_html:
+        logger.warning(f"캘린더를 찾을 수 없습니다: {facility_number}, {year}-{month}")
+        return reservations
+
+    table = lxml.html.fragment_fromstring(f"<table>{tbody_html}</table>")
+    for td in CALENDAR_TDS(table):
+        date_span = _first(DATE_SPAN, td)
+        if date_span is None:
+            continue
+
+        day = _text(date_span)
+        if not day.isdigit():
+            continue
+        reservation_date = f"{year}-{month:02d}-{int(day):02d}"
+
+        status_span = _first(STATUS_SPAN, td)
+        if status_span is None:
+            continue
+
+        for idx, div in enumerate(STATUS_DIVS(status_span)):
+            text = _text(div)
+
+            time_slot = TIME_SLOTS[idx] if idx < len(TIME_SLOTS) else f'SLOT_{idx+1}'
+
+            status = None
+            if '예약확정' in text:
+                status = 'confirmed'
+            elif '오전' in text or '오후' in text:
+                status = 'available'
+
+            if '오전' in text:
+                time_slot = 'L'
+            elif '오후' in text:
+                time_slot = 'D'
+
+            if status:
+                reservations.append({
+                    'facility_number': facility_number,
+                    'reservation_date': reservation_date,
+                    'time_slot': time_slot,
+                    'status': status
+                })
+
+    return reservations
+
+
+def parse_facilities_html(html: str, base_url: str) -> List[Dict]:
+    """예식장 목록 컨테이너 조각만 잘라 lxml 로 파싱 (parse_facilities 와 동일한 결과)"""
+    facilities = []
+
+    container_html = extract_facilities_container(html) if html else None
+    if not container_html:
+        logger.warning("예식장 컨테이너를 찾을 수 없습니다")
+        return facilities
+
+    container = lxml.html.fragment_fromstring(container_html)
+    for link in FACILITY_LINKS(container):
+        href = link.get('href')
+        match = FACILITY_HREF_PATTERN.search(href)
+        if not match:
+            continue
+
+        full_url = href if href.startswith('http') else f"{base_url}{href}"
+
+        district = _first(DISTRICT_SPAN, link)
+        name = _first(NAME_P, link)
+        info_div = _first(INFO_DIV, link)
+
+        spans = INFO_SPANS(info_div) if info_div is not None else []
+        facilities.append({
+            'facility_number': match.group(1),
+            'district': _text(district) if district is not None else "",
+            'facility_name': _text(name) if name is not None else "",
+            'location_type': _text(spans[0]) if len(spans) >= 1 else "",
+            'capacity': _text(spans[1]) if len(spans) >= 2 else "",
+            'price': _text(spans[2]) if len(spans) >= 3 else "",
+            'url': full_url
+        })
+
+    return facilities
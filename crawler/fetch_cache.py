@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import logging
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from fetchers import FetchResult, extract_tbody
+
+logger = logging.getLogger(__name__)
+
+
+def tbody_digest(html: Optional[str]) -> Optional[str]:
+    """캘린더 tbody 조각의 SHA-256 해시 (tbody 가 없으면 None)"""
+    if not html:
+        return None
+    tbody = extract_tbody(html)
+    if tbody is None:
+        return None
+    return hashlib.sha256(tbody.encode('utf-8')).hexdigest()
+
+
+class FetchCache:
+    """(facility_number, year, month) 단위 캘린더 페치 캐시
+
+    ETag/Last-Modified 헤더와 캘린더 tbody 해시, 그리고 그때 파싱한 예약 정보를
+    JSON 파일에 저장한다. 304 응답이거나 tbody 해시가 같으면 parse_calendar 를
+    건너뛰고 저장된 예약 정보를 재사용한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict] = {}
+        self.not_modified_hits = 0
+        self.hash_hits = 0
+        self.misses = 0
+        self.load()
+
+    @staticmethod
+    def key(facility_number: str, year: int, month: int) -> str:
+        return f"{facility_number}:{year}-{month:02d}"
+
+    def load(self):
+        """캐시 파일 읽기 (없거나 손상되었으면 빈 캐시로 시작)"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+            logger.info(f"페치 캐시 로드: {len(self.entries)}건 ({self.path})")
+        except (OSError, ValueError) as e:
+            logger.warning(f"페치 캐시를 읽을 수 없어 새로 시작합니다: {e}")
+            self.entries = {}
+
+    def save(self, today: Optional[date] = None):
+        """캐시 파일 저장 (이번 달 이전의 지난 달 제외, 임시 파일에 쓴 뒤 교체)"""
+        today = today or date.today()
+        current = f"{today.year}-{today.month:02d}"
+        # 지난 달은 다시 요청하지 않으므로 파일과 메모리 (상주 실행) 에서 모두 제외
+        self.entries = {key: entry for key, entry in self.entries.items() if key.rsplit(':', 1)[1] >= current}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entries': self.entries}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def conditional_headers(self, facility_number: str, year: int, month: int) -> Optional[Dict[str, str]]:
+        """저장된 ETag/Last-Modified 로 조건부 요청 헤더 생성"""
+        entry = self.entries.get(self.key(facility_number, year, month))
+        if not entry:
+            return None
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers or None
+
+    def lookup(self, facility_number: str, year: int, month: int, result: FetchResult,
+               digest: Optional[str]) -> Optional[List[Dict]]:
+        """변경되지 않은 달이면 저장된 예약 정보 반환, 아니면 None (미스)"""
+        entry = self.entries.get(self.key(facility_number, year, month))
+        if entry:
+            if result.not_modified:
+                self.not_modified_hits += 1
+                return entry['reservations']
+            if digest and digest == entry.get('tbody_hash'):
+                self.hash_hits += 1
+                # 서버가 새 검증자를 보냈을 수 있으므로 헤더만 갱신
+                self._update_validators(entry, result)
+                return entry['reservations']
+        self.misses += 1
+        return None
+
+    def store(self, facility_number: str, year: int, month: int, result: FetchResult,
+              digest: Optional[str], reservations: List[Dict]):
+        """새로 파싱한 달의 검증자, 해시, 예약 정보 저장"""
+        if not digest:
+            return
+        entry = {
+            'tbody_hash': digest,
+            'reservations': reservations,
+            'fetched_at': datetime.now().isoformat(),
+        }
+        self._update_validators(entry, result)
+        self.entries[self.key(facility_number, year, month)] = entry
+
+    @staticmethod
+    def _update_validators(entry: Dict, result: FetchResult):
+        entry['etag'] = result.headers.get('ETag')
+        entry['last_modified'] = result.headers.get('Last-Modified')
+
+    def summary(self) -> str:
+        """적중/미스 비율 요약"""
+        hits = self.not_modified_hits + self.hash_hits
+        total = hits + self.misses
+        ratio = hits / total * 100 if total else 0.0
+        return (f"페치 캐시: 적중 {hits}건 (304 {self.not_modified_hits}, 해시 {self.hash_hits}), "
+                f"미스 {self.misses}건, 적중률 {ratio:.1f}%")
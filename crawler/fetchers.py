@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+import re
+import time
+from typing import Dict, Optional
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from metrics import Metrics
+from throttle import AdaptiveThrottle, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+TBODY_PATTERN = re.compile(r'<tbody[\s>].*?</tbody>', re.IGNORECASE | re.DOTALL)
+UL_START_PATTERN = re.compile(r'<ul\b[^>]*>', re.IGNORECASE)
+UL_TAG_PATTERN = re.compile(r'<(/?)ul\b', re.IGNORECASE)
+CLASS_ATTR_PATTERN = re.compile(r'\bclass\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+WPNONCE_PATTERN = re.compile(r'_wpnonce=([a-z0-9]+)')
+LISTING_PAGE_PATTERN = re.compile(r'/facilities/page/(\d+)')
+
+FACILITIES_SELECTOR = 'ul.archive_list-container.facilities'
+FACILITIES_CLASSES = {'archive_list-container', 'facilities'}
+# 예식장 목록은 1~10페이지만 조회
+MAX_LISTING_PAGES = 10
+
+
+class FetchResult:
+    """페치 결과 (HTML 원문과 응답 메타데이터)"""
+
+    def __init__(self, url: str, html: Optional[str], status: int = 200,
+                 headers: Optional[Dict[str, str]] = None, from_browser: bool = False):
+        self.url = url
+        self.html = html
+        self.status = status
+        self.headers = headers or {}
+        self.from_browser = from_browser
+
+    @property
+    def not_modified(self) -> bool:
+        """조건부 요청에 대해 304 Not Modified 응답을 받았는지 여부"""
+        return self.status == 304
+
+
+def extract_tbody(html: str) -> Optional[str]:
+    """HTML 원문에서 첫 번째 tbody 조각을 파싱 없이 잘라냄"""
+    match = TBODY_PATTERN.search(html)
+    return match.group(0) if match else None
+
+
+def extract_facilities_container(html: str) -> Optional[str]:
+    """HTML 원문에서 ul.archive_list-container.facilities 조각을 파싱 없이 잘라냄"""
+    for start in UL_START_PATTERN.finditer(html):
+        class_match = CLASS_ATTR_PATTERN.search(start.group(0))
+        if not class_match:
+            continue
+        classes = set((class_match.group(1) or class_match.group(2) or '').split())
+        if not FACILITIES_CLASSES <= classes:
+            continue
+
+        # 중첩된 ul 을 고려해 짝이 맞는 </ul> 까지 잘라냄
+        depth = 0
+        for tag in UL_TAG_PATTERN.finditer(html, start.start()):
+            depth += -1 if tag.group(1) else 1
+            if depth == 0:
+                end = html.find('>', tag.end())
+                return html[start.start():end + 1] if end != -1 else None
+        return None
+    return None
+
+
+def extract_wpnonce(html: Optional[str]) -> Optional[str]:
+    """HTML 원문에서 캘린더 링크의 _wpnonce 값 추출"""
+    if not html:
+        return None
+    match = WPNONCE_PATTERN.search(html)
+    return match.group(1) if match else None
+
+
+def listing_page_count(html: Optional[str]) -> Optional[int]:
+    """목록 페이지의 페이지네이션 링크(/facilities/page/N)에서 마지막 페이지 번호 추출 (링크가 없으면 None)"""
+    if not html:
+        return None
+    pages = [int(n) for n in LISTING_PAGE_PATTERN.findall(html)]
+    return max(pages) if pages else None
+
+
+def contains_expected(html: str, check: str) -> bool:
+    """HTML 원문에 check 셀렉터에 해당하는 요소가 있는지 확인"""
+    if check == 'tbody':
+        return extract_tbody(html) is not None
+    if check == FACILITIES_SELECTOR:
+        return extract_facilities_container(html) is not None
+    return BeautifulSoup(html, 'lxml').select_one(check) is not None
+
+
+class HttpFetcher:
+    """requests.Session 기반 HTTP 페처 (keep-alive 커넥션 풀, 세션 쿠키, gzip)"""
+
+    def __init__(self, user_agent: str, pool_size: int = 10, timeout: float = 10,
+                 throttle: Optional[AdaptiveThrottle] = None, metrics: Optional[Metrics] = None):
+        self.timeout = timeout
+        # 요청 속도 조절기와 계측 (크롤러의 다른 페치 경로와 공유)
+        self.throttle = throttle or AdaptiveThrottle()
+        self.metrics = metrics or Metrics()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Language': 'ko-KR,ko;q=0.9',
+            'Connection': 'keep-alive',
+        })
+
+    def get(self, url: str, retries: int = 3) -> Optional[str]:
+        """URL의 HTML 원문 반환 (429 외의 4xx 또는 최종 실패 시 None)"""
+        result = self.fetch(url, retries=retries)
+        return result.html if result else None
+
+    def fetch(self, url: str, retries: int = 3, headers: Optional[Dict[str, str]] = None) -> Optional[FetchResult]:
+        """URL을 가져와서 FetchResult 로 반환 (조건부 요청 헤더 지원, 429 외의 4xx 또는 최종 실패 시 None)"""
+        with self.metrics.span('fetch', source='http'):
+            return self._fetch(url, retries, headers)
+
+    def _fetch(self, url: str, retries: int, headers: Optional[Dict[str, str]]) -> Optional[FetchResult]:
+        for attempt in range(retries):
+            self.throttle.acquire()
+            started = time.monotonic()
+            retry_after = None
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                self.throttle.record(time.monotonic() - started, response.status_code)
+                self.metrics.inc('requests', source='http', status=response.status_code)
+                self.metrics.inc('bytes_downloaded', len(response.content), source='http')
+                if response.status_code == 404:
+                    logger.info(f"페이지 없음 (404): {url}")
+                    return None
+                if response.status_code == 304:
+                    return FetchResult(url, None, status=304, headers=dict(response.headers))
+                # 429 외의 4xx (400, 403 등) 는 다시 요청해도 같은 결과이므로 재시도하지 않음
+                if 400 <= response.status_code < 500 and response.status_code != 429:
+                    logger.warning(f"HTTP 요청 거부 ({response.status_code}), 재시도하지 않음: {url}")
+                    return None
+                if response.status_code in (429, 503):
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    if retry_after:
+                        self.throttle.pause(retry_after)
+                response.raise_for_status()
+
+                # charset 헤더가 없으면 requests 는 ISO-8859-1 로 디코딩하므로 UTF-8 지정
+                if 'charset' not in response.headers.get('Content-Type', '').lower():
+                    response.encoding = 'utf-8'
+                return FetchResult(url, response.text, status=response.status_code,
+                                   headers=dict(response.headers))
+            except requests.RequestException as e:
+                if isinstance(e, requests.Timeout):
+                    self.throttle.record_failure('timeout')
+                    self.metrics.inc('requests', source='http', status='timeout')
+                elif not isinstance(e, requests.HTTPError):
+                    self.throttle.record_failure('connection')
+                    self.metrics.inc('requests', source='http', status='error')
+                logger.warning(f"HTTP 요청 실패 (시도 {attempt + 1}/{retries}): {url}, 에러: {e}")
+                if attempt < retries - 1:
+                    self.metrics.inc('retries', source='http')
+                    time.sleep(self.throttle.backoff(attempt, retry_after))
+                else:
+                    logger.error(f"HTTP 요청 최종 실패: {url}")
+                    return None
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""페치한 HTML 원문 기록/재생 아카이브
+
+record 모드는 페치한 페이지 원문을 SHA-256 으로 주소를 매긴 압축 파일에 저장하고, 어떤 URL 을
+언제 가져왔는지 index.jsonl 에 한 줄씩 남긴다. 같은 내용은 실행이 달라도 한 번만 저장된다.
+
+    archive/
+      index.jsonl                      {"fetched_at": ..., "url": ..., "sha256": ..., "source": ...}
+      objects/3f/3fa1...e9.html.zst    (zstandard 가 없으면 .html.gz)
+
+replay 모드는 네트워크와 브라우저 없이 URL 마다 as_of 시점까지의 마지막 기록을 돌려준다.
+URL 은 호스트와 _wpnonce 를 뺀 경로/쿼리로 찾으므로 실행마다 달라지는 nonce 나 스텁 서버 주소와
+관계없이 재생된다.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from fetchers import FetchResult
+
+try:
+    import zstandard
+except ImportError:  # zstandard 가 없으면 gzip 으로 저장
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 재생 모드에서 _wpnonce 대신 쓰는 값 (캘린더 URL 을 찾을 때 nonce 는 무시됨)
+REPLAY_NONCE = "replay"
+
+
+def archive_key(url: str) -> str:
+    """URL 의 아카이브 키 (호스트와 _wpnonce 를 뺀 경로와 정렬한 쿼리)"""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != '_wpnonce')
+    path = parts.path.rstrip('/') or '/'
+    return f"{path}?{urlencode(query)}" if query else path
+
+
+class HtmlArchive:
+    """내용 주소 방식의 HTML 원문 아카이브 (mode: record / replay)"""
+
+    def __init__(self, root: str, mode: str = "record", as_of: Optional[str] = None):
+        self.root = Path(root)
+        self.objects = self.root / 'objects'
+        self.index_path = self.root / 'index.jsonl'
+        self.mode = mode
+        self.as_of = as_of
+        self.stored = 0
+        self.deduplicated = 0
+        self.replayed = 0
+        self.missing = 0
+        self._lock = threading.Lock()
+        self._index = None
+        # 재생 모드: 아카이브 키 → 마지막 기록
+        self.entries: Dict[str, Dict] = {}
+        if mode == "replay":
+            self.load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def load(self):
+        """index.jsonl 에서 URL 별로 as_of 시점까지의 마지막 기록을 읽음"""
+        if not self.index_path.exists():
+            raise FileNotFoundError(f"아카이브 인덱스가 없습니다: {self.index_path}")
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 기록 중 중단되어 잘린 마지막 줄
+                    continue
+                if self.as_of and entry['fetched_at'] > self.as_of:
+                    continue
+                previous = self.entries.get(entry['url'])
+                if previous is None or entry['fetched_at'] >= previous['fetched_at']:
+                    self.entries[entry['url']] = entry
+        logger.info(f"아카이브 로드: URL {len(self.entries)}개 ({self.root})")
+
+    def replay_date(self) -> date:
+        """재생하는 기록의 기준 날짜 (as_of, 없으면 가장 최근 기록 날짜)"""
+        latest = self.as_of or max((e['fetched_at'] for e in self.entries.values()), default=None)
+        return datetime.fromisoformat(latest).date() if latest else date.today()
+
+    def _object_path(self, digest: str, suffix: str) -> Path:
+        return self.objects / digest[:2] / f"{digest}.html{suffix}"
+
+    def record(self, url: str, html: Optional[str], source: str):
+        """페치한 원문 저장 (같은 내용이 이미 있으면 인덱스만 추가)"""
+        if html is None:
+            return
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if self._object_path(digest, '.zst').exists() or self._object_path(digest, '.gz').exists():
+                self.deduplicated += 1
+            else:
+                if zstandard is not None:
+                    path = self._object_path(digest, '.zst')
+                    blob = zstandard.ZstdCompressor(level=10).compress(data)
+                else:
+                    path = self._object_path(digest, '.gz')
+                    blob = gzip.compress(data, mtime=0)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(path.name + '.tmp')
+                with open(tmp_path, 'wb') as f:
+                    f.write(blob)
+                os.replace(tmp_path, path)
+                self.stored += 1
+
+            if self._index is None:
+                self.root.mkdir(parents=True, exist_ok=True)
+                self._index = open(self.index_path, 'a', encoding='utf-8')
+            entry = {'fetched_at': datetime.now().isoformat(), 'url': archive_key(url),
+                     'sha256': digest, 'source': source}
+            self._index.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._index.flush()
+
+    def read(self, digest: str) -> str:
+        """해시로 원문 읽기"""
+        path = self._object_path(digest, '.zst')
+        if path.exists():
+            if zstandard is None:
+                raise RuntimeError(f"zstandard 가 설치되어 있지 않아 읽을 수 없습니다: {path}")
+            with open(path, 'rb') as f:
+                return zstandard.ZstdDecompressor().decompress(f.read()).decode('utf-8')
+        with open(self._object_path(digest, '.gz'), 'rb') as f:
+            return gzip.decompress(f.read()).decode('utf-8')
+
+    def replay(self, url: str) -> Optional[FetchResult]:
+        """기록된 원문을 FetchResult 로 반환 (기록이 없으면 None)"""
+        entry = self.entries.get(archive_key(url))
+        if entry is None:
+            self.missing += 1
+            logger.debug(f"아카이브에 없는 URL: {url}")
+            return None
+        self.replayed += 1
+        return FetchResult(url, self.read(entry['sha256']), from_browser=entry['source'] == 'browser')
+
+    def close(self):
+        with self._lock:
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+
+    def summary(self) -> str:
+        if self.replaying:
+            return f"아카이브 재생: {self.replayed}건, 기록 없음 {self.missing}건"
+        return f"아카이브 기록: 새 원문 {self.stored}건, 중복 {self.deduplicated}건"
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""분할 크롤링 부분 결과 병합
+
+    python merge_partials.py partials/*.json --output both --delta-path ../frontend/public/changes.json
+
+빠진 조각이나 크롤링되지 않은 예식장이 있으면 아무것도 저장하지 않고 실패로 끝난다.
+저장은 WeddingHallCrawler.save_outputs 를 그대로 사용하므로 출력 형식, 변경분, 집계, DB 옵션은
+crawler.py 와 같다.
+"""
+
+import argparse
+import logging
+import sys
+
+import crawl_shards
+from crawler import WeddingHallCrawler
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="분할 크롤링 부분 결과 병합")
+    parser.add_argument("partials", nargs="+", help="부분 결과 파일 (part-XXX-of-YYY.json)")
+    parser.add_argument("--json-path", default="../frontend/public/data.json", help="JSON 저장 경로")
+    parser.add_argument("--output", choices=["json", "sharded", "both"], default="json",
+                        help="출력 형식 (json: 단일 data.json, sharded: manifest + 월별 샤드, both: 둘 다)")
+    parser.add_argument("--shard-dir", default="../frontend/public/data", help="월별 샤드 출력 디렉토리")
+    parser.add_argument("--delta-path", default=None,
+                        help="이전 data.json 대비 변경분 파일 경로 (변경이 없으면 출력 파일을 다시 쓰지 않음)")
+    parser.add_argument("--aggregates-path", default=None, help="날짜/지역구/예식장별 집계 저장 경로")
+    parser.add_argument("--db-path", default=None, help="SQLite DB 경로")
+    args = parser.parse_args()
+    if args.delta_path and args.output == "sharded":
+        parser.error("--delta-path 는 --output json 또는 both 와 함께 사용해야 합니다")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        facilities, reservations, crawled_at = crawl_shards.merge_partials(
+            crawl_shards.load_partials(args.partials))
+    except crawl_shards.MergeError as e:
+        logger.error(f"병합 실패:\n{e}")
+        return 1
+
+    logger.info(f"병합 완료: 조각 {len(args.partials)}개, 예식장 {len(facilities)}건, 예약 {len(reservations)}건")
+    crawler = WeddingHallCrawler(json_path=args.json_path, output=args.output, shard_dir=args.shard_dir,
+                                 delta_path=args.delta_path, aggregates_path=args.aggregates_path,
+                                 db_path=args.db_path)
+    crawler.save_outputs(facilities, reservations, crawled_at)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""실행 단위 계측 (구간 시간 히스토그램, 카운터, 게이지)
+
+크롤러 한 번 실행 동안 단계별/요청별 소요 시간과 다운로드 바이트, 재시도 횟수 등을
+모아서 JSON 실행 리포트와 Prometheus textfile(node_exporter textfile collector 형식)로
+내보낸다. 스레드(HTTP 페처)와 async 태스크에서 동시에 기록해도 안전하다.
+
+    with metrics.span('phase', phase='crawl_reservations'):
+        ...
+    metrics.inc('bytes_downloaded', len(body), source='http')
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PREFIX = "crawler_"
+
+# 지연 히스토그램 버킷 (초)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+HELP = {
+    'phase_seconds': "실행 단계별 소요 시간",
+    'fetch_seconds': "페이지 요청 소요 시간 (재시도 포함)",
+    'navigation_seconds': "브라우저 page.goto 소요 시간",
+    'content_seconds': "브라우저 page.content 소요 시간",
+    'parse_seconds': "HTML 파싱 소요 시간",
+    'wpnonce_seconds': "_wpnonce 조회 소요 시간",
+    'save_seconds': "출력 저장 소요 시간",
+    'requests': "응답 상태별 요청 수",
+    'bytes_downloaded': "다운로드한 HTML 바이트 수",
+    'retries': "재시도 횟수",
+    'fallbacks': "HTTP 응답이 불완전해 브라우저로 다시 가져온 횟수",
+    'wpnonce': "_wpnonce 캐시 사용/조회/재조회 횟수",
+    'page_recycles': "브라우저 페이지 재생성 횟수 (이유별)",
+    'renderer_memory_bytes': "마지막으로 잰 브라우저 렌더러 프로세스 RSS 합",
+    'blocked_requests': "경량 모드에서 차단한 브라우저 하위 요청 수",
+    'scheduled_months': "이번 실행의 (예식장, 월) 스케줄 (due: 가져옴, deferred: 예산 초과로 미룸, fresh: 주기 안 됨)",
+    'checkpoint_resumed_months': "체크포인트에서 이어받아 다시 가져오지 않은 (예식장, 월) 수",
+    'fetch_cache': "페치 캐시 적중/미스 횟수",
+    'facility_cache': "예식장 목록 캐시 사용/새로 가져온 횟수",
+    'facility_changes': "예식장 목록에서 감지한 변경 수 (added/removed/changed)",
+    'throttle_wait_seconds': "속도 조절로 대기한 시간 합계",
+    'throttle_rate': "실행 종료 시점 요청 속도 (초당 요청 수)",
+    'daemon_cycle_seconds': "데몬 크롤링 사이클 소요 시간",
+    'daemon_cycles': "데몬 크롤링 사이클 수 (결과별)",
+    'daemon_changes': "데몬 사이클 중 출력 파일을 다시 쓴 횟수",
+    'run_duration_seconds': "실행 전체 소요 시간",
+    'run_timestamp_seconds': "실행 종료 시각 (Unix time)",
+    'reservations': "저장한 예약 정보 수",
+    'facilities': "저장한 예식장 수",
+}
+
+Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict) -> Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _num(value: float) -> str:
+    # 큰 카운터나 Unix time 이 지수 표기로 잘리지 않도록 정수는 그대로, 실수는 repr 로 출력
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> List[int]:
+        total = 0
+        result = []
+        for c in self.counts:
+            total += c
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 상한으로 근사한 분위수"""
+        if not self.count:
+            return None
+        target = q * self.count
+        for bound, cumulative in zip(BUCKETS, self.cumulative()):
+            if cumulative >= target:
+                return bound
+        return self.max
+
+
+class Metrics:
+    """카운터, 게이지, 히스토그램 모음"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[Key, float] = {}
+        self.gauges: Dict[Key, float] = {}
+        self.histograms: Dict[Key, Histogram] = {}
+        self.started = time.monotonic()
+        self.started_at = datetime.now().isoformat()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_total(self, name: str, value: float, **labels):
+        """다른 곳에서 누적한 값을 카운터로 기록 (여러 번 내보내도 중복 집계되지 않음)"""
+        with self._lock:
+            self.counters[_key(name, labels)] = value
+
+    def set(self, name: str, value: float, **labels):
+        with self._lock:
+            self.gauges[_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def span(self, name: str, **labels):
+        """with 블록 소요 시간을 name_seconds 히스토그램에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(f"{name}_seconds", time.perf_counter() - started, **labels)
+
+    def finish(self):
+        """실행 종료 시점 게이지 기록"""
+        self.set('run_duration_seconds', time.monotonic() - self.started)
+        self.set('run_timestamp_seconds', time.time())
+
+    def report(self) -> Dict:
+        """JSON 실행 리포트"""
+        def labelled(key: Key) -> Dict:
+            return {'name': key[0], 'labels': dict(key[1])}
+
+        with self._lock:
+            return {
+                'startedAt': self.started_at,
+                'counters': [dict(labelled(k), value=v) for k, v in sorted(self.counters.items())],
+                'gauges': [dict(labelled(k), value=v) for k, v in sorted(self.gauges.items())],
+                'histograms': [
+                    dict(labelled(k), count=h.count, sum=round(h.sum, 6), max=round(h.max, 6),
+                         mean=round(h.sum / h.count, 6) if h.count else None,
+                         p50=h.quantile(0.5), p95=h.quantile(0.95),
+                         buckets=dict(zip((str(b) for b in BUCKETS), h.cumulative())))
+                    for k, h in sorted(self.histograms.items())
+                ],
+            }
+
+    def prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines: List[str] = []
+        described = set()
+
+        def describe(name: str, kind: str, suffix: str = ""):
+            if name in described:
+                return
+            described.add(name)
+            if name in HELP:
+                lines.append(f"# HELP {PREFIX}{name}{suffix} {HELP[name]}")
+            lines.append(f"# TYPE {PREFIX}{name}{suffix} {kind}")
+
+        def fmt(labels, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+            pairs = tuple(labels) + extra
+            if not pairs:
+                return ""
+            escaped = (v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+            return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+        with self._lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                describe(name, 'counter', '_total')
+                lines.append(f"{PREFIX}{name}_total{fmt(labels)} {_num(value)}")
+            for (name, labels), value in sorted(self.gauges.items()):
+                describe(name, 'gauge')
+                lines.append(f"{PREFIX}{name}{fmt(labels)} {_num(value)}")
+            for (name, labels), h in sorted(self.histograms.items()):
+                describe(name, 'histogram')
+                for bound, cumulative in zip(BUCKETS, h.cumulative()):
+                    lines.append(f"{PREFIX}{name}_bucket{fmt(labels, (('le', f'{bound:g}'),))} {cumulative}")
+                lines.append(f"{PREFIX}{name}_bucket{fmt(labels, (('le', '+Inf'),))} {h.count}")
+                lines.append(f"{PREFIX}{name}_sum{fmt(labels)} {h.sum:.6f}")
+                lines.append(f"{PREFIX}{name}_count{fmt(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: str):
+        _write_atomic(Path(path), json.dumps(self.report(), ensure_ascii=False, indent=2))
+
+    def write_prometheus(self, path: str):
+        _write_atomic(Path(path), self.prometheus())
+
+    def summary(self) -> str:
+        """단계별 소요 시간 요약"""
+        phases = [(dict(labels).get('phase'), h.sum) for (name, labels), h in self.histograms.items()
+                  if name == 'phase_seconds']
+        return "단계별 소요 시간: " + ", ".join(f"{phase} {seconds:.1f}초" for phase, seconds in phases)
+
+
+def _write_atomic(path: Path, text: str):
+    # textfile collector 가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""월별 샤드 출력 (manifest.json + reservations/YYYY-MM.json)
+
+manifest.json 에는 예식장 목록, lastCrawledAt, 월별 샤드 목록만 들어간다.
+각 월 샤드는 예식장마다 하나의 문자열로 슬롯 상태를 인코딩한다.
+
+    {"month": "2026-04", "days": 30, "slots": ["L", "D"],
+     "statuses": ["confirmed", "available"],
+     "facilities": {"4187": "0.1...."}}
+
+문자열의 (day - 1) * len(slots) + slot_index 위치 문자가 statuses 의 인덱스이고,
+'.' 은 해당 슬롯에 예약 정보가 없다는 뜻이다. 같은 슬롯이 여러 번 나오면 하나로
+합쳐지고, 상태가 다르면 confirmed 가 우선한다.
+"""
+
+import calendar
+import json
+import logging
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SHARD_FORMAT = "slots-v1"
+BASE_SLOTS = ['L', 'D']
+STATUSES = ['confirmed', 'available']
+EMPTY = '.'
+
+
+def slot_order(slot: str):
+    if slot in BASE_SLOTS:
+        return (0, BASE_SLOTS.index(slot))
+    # SLOT_3, SLOT_4 ... 는 번호 순서로 뒤에 붙임
+    suffix = slot.rsplit('_', 1)[-1]
+    return (1, int(suffix) if suffix.isdigit() else 0, slot)
+
+
+def encode_month(month: str, reservations: List[Dict]) -> Dict:
+    """한 달치 예약 정보를 슬롯 인코딩 샤드로 변환 (month: 'YYYY-MM')"""
+    year, mon = (int(v) for v in month.split('-'))
+    days = calendar.monthrange(year, mon)[1]
+    slots = sorted({r['time_slot'] for r in reservations} | set(BASE_SLOTS), key=slot_order)
+    slot_index = {slot: i for i, slot in enumerate(slots)}
+    status_code = {status: str(i) for i, status in enumerate(STATUSES)}
+
+    cells: Dict[str, List[str]] = {}
+    for r in reservations:
+        row = cells.get(r['facility_number'])
+        if row is None:
+            row = cells[r['facility_number']] = [EMPTY] * (days * len(slots))
+        day = int(r['reservation_date'][8:10])
+        pos = (day - 1) * len(slots) + slot_index[r['time_slot']]
+        code = status_code[r['status']]
+        # 같은 슬롯이 중복되면 confirmed(0) 우선
+        if row[pos] == EMPTY or code < row[pos]:
+            row[pos] = code
+
+    return {
+        'month': month,
+        'days': days,
+        'slots': slots,
+        'statuses': STATUSES,
+        'facilities': {number: ''.join(row) for number, row in cells.items()},
+    }
+
+
+def encode_matrix_month(matrix, month: str) -> Dict:
+    """상태 행렬(availability.AvailabilityMatrix)의 한 달을 encode_month 와 같은 샤드로 변환
+
+    행렬의 슬롯 축 중 그 달에 예약 정보가 있는 슬롯만 넣고, 예약 정보가 없는 예식장은 뺀다.
+    """
+    # availability 가 이 모듈의 BASE_SLOTS/slot_order 를 쓰므로 여기서 가져옴
+    from availability import NONE, STATUSES as CODE_STATUSES
+
+    year, mon = (int(v) for v in month.split('-'))
+    days = calendar.monthrange(year, mon)[1]
+    width = len(matrix.slots)
+    # 행렬 축에서 이 달의 날짜 범위 [first, last), 축 밖의 날은 앞뒤를 빈 칸으로 채움
+    offset = (date(year, mon, 1) - matrix.start).days
+    first, last = max(offset, 0), min(offset + days, matrix.days)
+    table = bytearray(range(256))
+    table[NONE] = ord(EMPTY)
+    for code, status in CODE_STATUSES.items():
+        table[code] = ord(str(STATUSES.index(status)))
+
+    segments = {}
+    used = set(BASE_SLOTS)
+    if first < last:
+        for row, number in enumerate(matrix.facilities):
+            base = row * matrix.stride
+            segment = matrix.cells[base + first * width:base + last * width]
+            if segment.count(NONE) == len(segment):
+                continue
+            segments[number] = segment
+            used.update(slot for i, slot in enumerate(matrix.slots) if slot not in used and any(segment[i::width]))
+
+    slots = sorted(used, key=slot_order)
+    before = EMPTY * ((first - offset) * len(slots))
+    after = EMPTY * ((offset + days - max(last, first)) * len(slots))
+    facilities = {}
+    for number, segment in segments.items():
+        if slots == matrix.slots:
+            cells = segment.translate(table).decode('ascii')
+        else:
+            # 행렬 슬롯 축에는 BASE_SLOTS 가 항상 있으므로 이 달의 슬롯 열만 골라 날짜별로 이어 붙임
+            columns = [segment[matrix.slot_index[slot]::width].translate(table).decode('ascii') for slot in slots]
+            cells = ''.join(''.join(day) for day in zip(*columns))
+        facilities[number] = before + cells + after
+
+    return {
+        'month': month,
+        'days': days,
+        'slots': slots,
+        'statuses': STATUSES,
+        'facilities': facilities,
+    }
+
+
+def decode_month(shard: Dict) -> List[Dict]:
+    """슬롯 인코딩 샤드를 data.json 의 reservations 형식으로 변환"""
+    reservations = []
+    slots = shard['slots']
+    statuses = shard['statuses']
+    for facility_number, row in shard['facilities'].items():
+        for pos, code in enumerate(row):
+            if code == EMPTY:
+                continue
+            day, slot_idx = divmod(pos, len(slots))
+            reservations.append({
+                'facility_number': facility_number,
+                'reservation_date': f"{shard['month']}-{day + 1:02d}",
+                'time_slot': slots[slot_idx],
+                'status': statuses[int(code)],
+            })
+    return reservations
+
+
+def _write_atomic(path: Path, data: bytes):
+    """임시 파일에 쓴 뒤 교체"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_month_shards(output_dir: str, facilities: List[Dict], matrix, crawled_at: str) -> Path:
+    """상태 행렬(availability.AvailabilityMatrix)로 manifest.json 과 월별 샤드 파일 저장, manifest 경로 반환
+
+    reservations 는 샤드에 들어간 슬롯 수다 (중복 슬롯은 하나로 셈).
+    """
+    root = Path(output_dir)
+    shard_dir = root / "reservations"
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    months = []
+    year, mon = matrix.start.year, matrix.start.month
+    end = matrix.start + timedelta(days=matrix.days - 1)
+    while (year, mon) <= (end.year, end.month):
+        month = f"{year}-{mon:02d}"
+        year, mon = (year, mon + 1) if mon < 12 else (year + 1, 1)
+        shard = encode_matrix_month(matrix, month)
+        if not shard['facilities']:
+            continue
+        data = json.dumps(shard, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        _write_atomic(shard_dir / f"{month}.json", data)
+        months.append({
+            'month': month,
+            'path': f"reservations/{month}.json",
+            'reservations': sum(len(row) - row.count(EMPTY) for row in shard['facilities'].values()),
+            'bytes': len(data),
+        })
+
+    # 이번 실행에 없는 달의 이전 샤드와 이전 버전이 함께 쓰던 .gz/.br 사본 삭제
+    current = {f"{m['month']}.json" for m in months}
+    for stale in shard_dir.glob("*.json*"):
+        if stale.name not in current:
+            stale.unlink()
+
+    manifest = {
+        'format': SHARD_FORMAT,
+        'lastCrawledAt': crawled_at,
+        'facilities': facilities,
+        'months': months,
+    }
+    manifest_path = root / "manifest.json"
+    _write_atomic(manifest_path, json.dumps(manifest, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    for suffix in ('.gz', '.br'):
+        manifest_path.with_name(manifest_path.name + suffix).unlink(missing_ok=True)
+    return manifest_path
+
+
+def read_month_shards(output_dir: str, months: Optional[List[str]] = None) -> Dict:
+    """샤드 출력을 data.json 형식으로 다시 읽음 (months 를 주면 해당 달만)"""
+    root = Path(output_dir)
+    with open(root / "manifest.json", 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    reservations = []
+    for entry in manifest['months']:
+        if months and entry['month'] not in months:
+            continue
+        with open(root / entry['path'], 'r', encoding='utf-8') as f:
+            reservations.extend(decode_month(json.load(f)))
+
+    return {
+        'lastCrawledAt': manifest['lastCrawledAt'],
+        'facilities': manifest['facilities'],
+        'reservations': reservations,
+    }
+
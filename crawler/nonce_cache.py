@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class NonceCache:
+    """facility_number 단위 _wpnonce 캐시
+
+    예식장 페이지를 열어야만 얻을 수 있는 캘린더용 _wpnonce 를 TTL 동안 재사용한다.
+    path 를 주면 JSON 파일에 저장해서 실행 간에도 재사용하고, 주지 않으면 한 번의
+    실행 안에서만 재사용한다. 이전 실행에서 가져온 값은 이번 실행에서 캘린더를 한 번
+    성공적으로 가져오기 전까지 검증되지 않은 값으로 취급한다.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_hours: float = 12):
+        self.path = Path(path) if path else None
+        self.ttl = timedelta(hours=ttl_hours)
+        self.entries: Dict[str, Dict] = {}
+        # 이번 실행에서 새로 가져왔거나 캘린더 요청으로 확인된 예식장
+        self.verified: Set[str] = set()
+        self.hits = 0
+        self.fetches = 0
+        self.refreshes = 0
+        self.load()
+
+    def load(self):
+        """캐시 파일 읽기 (없거나 손상되었으면 빈 캐시로 시작)"""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+            logger.info(f"wpnonce 캐시 로드: {len(self.entries)}건 ({self.path})")
+        except (OSError, ValueError) as e:
+            logger.warning(f"wpnonce 캐시를 읽을 수 없어 새로 시작합니다: {e}")
+            self.entries = {}
+
+    def save(self):
+        """캐시 파일 저장 (만료된 항목 제외, 임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        entries = {number: entry for number, entry in self.entries.items() if not self._expired(entry)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entries': entries}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def _expired(self, entry: Dict) -> bool:
+        try:
+            fetched_at = datetime.fromisoformat(entry['fetched_at'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return datetime.now() - fetched_at >= self.ttl
+
+    def get(self, facility_number: str) -> Optional[str]:
+        """만료되지 않은 nonce 반환, 없으면 None"""
+        entry = self.entries.get(facility_number)
+        if not entry or self._expired(entry):
+            return None
+        self.hits += 1
+        return entry['nonce']
+
+    def put(self, facility_number: str, nonce: str, refresh: bool = False):
+        """예식장 페이지에서 새로 가져온 nonce 저장"""
+        self.entries[facility_number] = {'nonce': nonce, 'fetched_at': datetime.now().isoformat()}
+        self.verified.add(facility_number)
+        if refresh:
+            self.refreshes += 1
+        else:
+            self.fetches += 1
+
+    def confirm(self, facility_number: str):
+        """캐시된 nonce 로 캘린더를 가져왔음을 기록"""
+        self.verified.add(facility_number)
+
+    def start_run(self):
+        """상주 실행에서 새 사이클 시작 (지난 사이클에 확인된 값도 다시 확인될 때까지 검증되지 않은 값으로 취급)"""
+        self.verified.clear()
+
+    def is_verified(self, facility_number: str) -> bool:
+        return facility_number in self.verified
+
+    def summary(self) -> str:
+        """재사용/조회 횟수 요약"""
+        return (f"wpnonce 캐시: 재사용 {self.hits}건, 새로 조회 {self.fetches}건, "
+                f"캘린더 실패로 재조회 {self.refreshes}건")
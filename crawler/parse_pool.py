@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""캘린더 파싱 워커 풀
+
+페치한 HTML 을 스레드/프로세스 풀에 넘겨 파싱하고, 그동안 페치 쪽은 다음 달을 요청한다.
+파싱을 기다리는 HTML 은 max_pending 개로 제한해서 파싱이 페치보다 느려도 메모리가
+예식장 수나 크롤링 범위에 비례해 늘지 않는다.
+
+    pool = ParsePool('lxml', workers=4, executor='process')
+    future = pool.submit(html, facility_number, year, month)  # 자리가 없으면 대기
+    reservations = future.result()
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+import fast_parser
+
+
+def completed(value) -> Future:
+    """이미 결과가 있는 Future"""
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
+def parse_calendar_job(parser: str, html: str, facility_number: str, year: int, month: int) -> Tuple[List[Dict], float]:
+    """워커에서 실행하는 캘린더 파싱 (예약 정보, 소요 시간)"""
+    started = time.perf_counter()
+    if parser == "lxml":
+        reservations = fast_parser.parse_calendar_html(html, facility_number, year, month)
+    else:
+        # crawler 가 이 모듈을 import 하므로 워커에서 처음 필요할 때 가져옴
+        from crawler import WeddingHallCrawler
+        reservations = WeddingHallCrawler.parse_calendar(BeautifulSoup(html, 'lxml'), facility_number, year, month)
+    return reservations, time.perf_counter() - started
+
+
+class ParsePool:
+    """캘린더 파싱 워커 풀 (thread: 네트워크 대기와 겹침, process: CPU 파싱도 병렬)"""
+
+    def __init__(self, parser: str = "bs4", workers: int = 2, executor: str = "thread",
+                 max_pending: Optional[int] = None, metrics=None):
+        self.parser = parser
+        self.workers = workers
+        self.max_pending = max_pending or workers * 4
+        self.metrics = metrics
+        if executor == "process":
+            # 페처/브라우저 스레드가 있는 프로세스를 fork 하지 않도록 spawn 사용
+            self.executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+        else:
+            self.executor = ThreadPoolExecutor(workers, thread_name_prefix='parse')
+        self.executor_kind = executor
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+
+    def submit(self, html: str, facility_number: str, year: int, month: int) -> Future:
+        """파싱 작업 제출 (파싱을 기다리는 HTML 이 max_pending 개면 자리가 날 때까지 대기)"""
+        self._slots.acquire()
+        try:
+            job = self.executor.submit(parse_calendar_job, self.parser, html, facility_number, year, month)
+        except BaseException:
+            self._slots.release()
+            raise
+        future: Future = Future()
+
+        def done(job: Future):
+            self._slots.release()
+            try:
+                reservations, seconds = job.result()
+            except BaseException as e:
+                future.set_exception(e)
+                return
+            if self.metrics:
+                self.metrics.observe('parse_seconds', seconds, kind='calendar', parser=self.parser)
+            future.set_result(reservations)
+
+        job.add_done_callback(done)
+        return future
+
+    def close(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
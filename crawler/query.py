@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""크롤링 결과 조회 (상태 행렬 + 예식장 속성 인덱스)
+
+data.json(또는 월별 샤드)을 한 번 읽어 AvailabilityMatrix 와 지역/장소 유형/수용 인원
+인덱스를 만든 뒤, 조회마다 전체 예약 목록을 다시 훑지 않고 조건에 맞는 예식장 행의 날짜
+구간(요일 조건이 있으면 해당 요일 칸)만 확인한다.
+
+    index = AvailabilityIndex.load("../frontend/public/data.json")
+    index.slots(start="2026-11-01", end="2026-12-31", weekdays=[5], districts=["마포구"])
+    index.next_open("4187")
+    index.free_facilities("2026-11-14", min_capacity=150)
+
+    python query.py slots --from 2026-11-01 --to 2026-12-31 --weekday 토 --district 마포구
+    python query.py next 4187
+    python query.py free 2026-11-14 --min-capacity 150
+"""
+
+import argparse
+import json
+import logging
+import re
+import sys
+import time
+from bisect import bisect_left
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set
+
+from availability import AVAILABLE, STATUS_CODES, STATUSES, AvailabilityMatrix
+from month_shards import read_month_shards
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = {
+    'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6,
+    '월': 0, '화': 1, '수': 2, '목': 3, '금': 4, '토': 5, '일': 6,
+}
+WEEKDAY_NAMES = '월화수목금토일'
+
+CAPACITY_PATTERN = re.compile(r'\d+')
+
+
+def parse_capacity(capacity: str) -> int:
+    """'150명' 같은 수용 인원 문자열의 숫자 (범위면 큰 값, 없으면 0)"""
+    numbers = [int(n) for n in CAPACITY_PATTERN.findall(capacity or '')]
+    return max(numbers) if numbers else 0
+
+
+def _as_date(value) -> Optional[date]:
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+class AvailabilityIndex:
+    """크롤링 결과 조회용 인덱스"""
+
+    def __init__(self, data: Dict):
+        self.crawled_at = data.get('lastCrawledAt')
+        facilities = data.get('facilities', [])
+        self.matrix = AvailabilityMatrix.from_reservations(
+            data.get('reservations', []), facilities=[f['facility_number'] for f in facilities])
+        # 행렬 행 순서대로 예식장 정보 (목록에 없는 예식장은 번호만)
+        by_number = {f['facility_number']: f for f in facilities}
+        self.facilities = [by_number.get(number, {'facility_number': number}) for number in self.matrix.facilities]
+
+        self.by_district: Dict[str, Set[int]] = {}
+        self.by_location_type: Dict[str, Set[int]] = {}
+        for i, facility in enumerate(self.facilities):
+            self.by_district.setdefault(facility.get('district', ''), set()).add(i)
+            self.by_location_type.setdefault(facility.get('location_type', ''), set()).add(i)
+        self.capacities = [parse_capacity(f.get('capacity', '')) for f in self.facilities]
+        # 수용 인원 오름차순 행 번호 (min_capacity 조건은 이분 탐색)
+        self._by_capacity = sorted(range(len(self.facilities)), key=self.capacities.__getitem__)
+        self._sorted_capacities = [self.capacities[i] for i in self._by_capacity]
+
+    @classmethod
+    def load(cls, json_path: Optional[str] = None, shard_dir: Optional[str] = None) -> "AvailabilityIndex":
+        """data.json 또는 월별 샤드 디렉토리에서 읽기 (shard_dir 우선)"""
+        started = time.perf_counter()
+        if shard_dir:
+            data = read_month_shards(shard_dir)
+        else:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        index = cls(data)
+        logger.info(f"조회 인덱스 생성: 예식장 {len(index.facilities)}곳, 슬롯 {len(index.matrix)}건, "
+                    f"{index.matrix.start} ~ {index.matrix.date_of(index.matrix.days - 1)} "
+                    f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+        return index
+
+    def facility_rows(self, districts: Optional[Iterable[str]] = None,
+                      location_types: Optional[Iterable[str]] = None,
+                      min_capacity: Optional[int] = None,
+                      facilities: Optional[Iterable[str]] = None) -> List[int]:
+        """조건에 맞는 예식장 행 번호 (행렬 순서)"""
+        rows: Optional[Set[int]] = None
+
+        def narrow(candidates: Set[int]):
+            nonlocal rows
+            rows = candidates if rows is None else rows & candidates
+
+        if facilities is not None:
+            narrow({self.matrix.facility_index[n] for n in facilities if n in self.matrix.facility_index})
+        if districts is not None:
+            narrow(set().union(*(self.by_district.get(d, set()) for d in districts)))
+        if location_types is not None:
+            narrow(set().union(*(self.by_location_type.get(t, set()) for t in location_types)))
+        if min_capacity is not None:
+            narrow(set(self._by_capacity[bisect_left(self._sorted_capacities, min_capacity):]))
+        return sorted(rows) if rows is not None else list(range(len(self.facilities)))
+
+    def _day_range(self, start, end) -> range:
+        """[start, end] 날짜를 행렬 날짜 인덱스 범위로 (행렬 밖은 잘라냄)"""
+        matrix = self.matrix
+        first = (_as_date(start) - matrix.start).days if start else 0
+        last = (_as_date(end) - matrix.start).days if end else matrix.days - 1
+        return range(max(first, 0), min(last, matrix.days - 1) + 1)
+
+    def _slot_positions(self, slots: Optional[Iterable[str]]) -> Optional[Set[int]]:
+        if slots is None:
+            return None
+        return {self.matrix.slot_index[s] for s in slots if s in self.matrix.slot_index}
+
+    def _result(self, row: int, day: int, slot: int, code: int) -> Dict:
+        facility = self.facilities[row]
+        return {
+            'facility_number': facility['facility_number'],
+            'facility_name': facility.get('facility_name', ''),
+            'district': facility.get('district', ''),
+            'reservation_date': self.matrix.date_of(day).isoformat(),
+            'time_slot': self.matrix.slots[slot],
+            'status': STATUSES[code],
+        }
+
+    def slots(self, start=None, end=None, status: str = 'available',
+              weekdays: Optional[Iterable[int]] = None, slots: Optional[Iterable[str]] = None,
+              districts: Optional[Iterable[str]] = None, location_types: Optional[Iterable[str]] = None,
+              min_capacity: Optional[int] = None, facilities: Optional[Iterable[str]] = None) -> List[Dict]:
+        """조건에 맞는 슬롯 목록 (날짜 → 예식장 → 슬롯 순)
+
+        weekdays 는 date.weekday() 값 (월 0 ~ 일 6), start/end 는 양끝 포함.
+        """
+        matrix = self.matrix
+        code = STATUS_CODES[status]
+        days = self._day_range(start, end)
+        slot_positions = self._slot_positions(slots)
+        weekday_set = set(weekdays) if weekdays is not None else None
+        if not days or slot_positions == set() or weekday_set == set():
+            return []
+
+        width = len(matrix.slots)
+        cells = matrix.cells
+        rows = self.facility_rows(districts, location_types, min_capacity, facilities)
+        found = []
+        if weekday_set is not None:
+            # 요일 조건이 있으면 해당 요일의 칸만 직접 확인
+            first_weekday = matrix.start.weekday()
+            wanted = [day for day in days if (first_weekday + day) % 7 in weekday_set]
+            for row in rows:
+                base = row * matrix.stride
+                for day in wanted:
+                    offset = base + day * width
+                    for slot, value in enumerate(cells[offset:offset + width]):
+                        if value == code and (slot_positions is None or slot in slot_positions):
+                            found.append((day, row, slot))
+        else:
+            for row in rows:
+                base = row * matrix.stride
+                end_pos = base + days.stop * width
+                # 예식장 행의 날짜 구간에서 해당 상태 칸만 건너뛰며 찾음
+                pos = cells.find(code, base + days.start * width, end_pos)
+                while pos >= 0:
+                    day, slot = divmod(pos - base, width)
+                    if slot_positions is None or slot in slot_positions:
+                        found.append((day, row, slot))
+                    pos = cells.find(code, pos + 1, end_pos)
+        found.sort()
+        return [self._result(row, day, slot, code) for day, row, slot in found]
+
+    def next_open(self, facility_number: str, after=None, slots: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """after(기본 오늘) 이후 가장 빠른 예약 가능 슬롯 (없으면 None)"""
+        matrix = self.matrix
+        row = matrix.facility_index.get(facility_number)
+        if row is None:
+            return None
+        days = self._day_range(after or date.today(), None)
+        slot_positions = self._slot_positions(slots)
+        if not days or slot_positions == set():
+            return None
+        width = len(matrix.slots)
+        base = row * matrix.stride
+        end_pos = base + days.stop * width
+        pos = matrix.cells.find(AVAILABLE, base + days.start * width, end_pos)
+        while pos >= 0:
+            day, slot = divmod(pos - base, width)
+            if slot_positions is None or slot in slot_positions:
+                return self._result(row, day, slot, AVAILABLE)
+            pos = matrix.cells.find(AVAILABLE, pos + 1, end_pos)
+        return None
+
+    def free_facilities(self, on, slots: Optional[Iterable[str]] = None,
+                        districts: Optional[Iterable[str]] = None, location_types: Optional[Iterable[str]] = None,
+                        min_capacity: Optional[int] = None) -> List[Dict]:
+        """on 날짜에 예약 가능한 슬롯이 있는 예식장 (예식장 정보 + available_slots)"""
+        matrix = self.matrix
+        days = self._day_range(on, on)
+        slot_positions = self._slot_positions(slots)
+        if not days or slot_positions == set():
+            return []
+        width = len(matrix.slots)
+        offset = days.start * width
+        results = []
+        for row in self.facility_rows(districts, location_types, min_capacity):
+            start = row * matrix.stride + offset
+            open_slots = [matrix.slots[s] for s, code in enumerate(matrix.cells[start:start + width])
+                          if code == AVAILABLE and (slot_positions is None or s in slot_positions)]
+            if open_slots:
+                results.append(dict(self.facilities[row], available_slots=open_slots))
+        return results
+
+
+def parse_weekdays(values: Optional[List[str]]) -> Optional[List[int]]:
+    """'토', 'sat', '5', '토,일' 같은 요일 인자를 weekday 값으로"""
+    if not values:
+        return None
+    weekdays = []
+    for value in values:
+        for part in value.split(','):
+            part = part.strip().lower()
+            if part in WEEKDAYS:
+                weekdays.append(WEEKDAYS[part])
+            elif part.isdigit() and int(part) < 7:
+                weekdays.append(int(part))
+            else:
+                raise argparse.ArgumentTypeError(f"알 수 없는 요일: {part}")
+    return weekdays
+
+
+def parse_date(value: str) -> date:
+    """YYYY-MM-DD 날짜 인자 (argparse type)"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식이 잘못되었습니다 (YYYY-MM-DD): {value}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="크롤링 결과 조회")
+    parser.add_argument("--json-path", default="../frontend/public/data.json", help="data.json 경로")
+    parser.add_argument("--shard-dir", default=None, help="월별 샤드 디렉토리 (지정하면 data.json 대신 사용)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_filters(command, facility_filters: bool = True):
+        command.add_argument("--slot", action="append", help="시간대 (L, D, 여러 번 지정 가능)")
+        if facility_filters:
+            command.add_argument("--district", action="append", help="지역구 (여러 번 지정 가능)")
+            command.add_argument("--location-type", action="append", help="장소 유형 (여러 번 지정 가능)")
+            command.add_argument("--min-capacity", type=int, default=None, help="최소 수용 인원")
+
+    slots = commands.add_parser("slots", help="조건에 맞는 슬롯 목록")
+    slots.add_argument("--from", dest="start", type=parse_date, default=None, help="시작 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    slots.add_argument("--to", dest="end", type=parse_date, default=None, help="끝 날짜 (YYYY-MM-DD, 포함)")
+    slots.add_argument("--weekday", action="append", help="요일 (토, 일, sat 또는 토,일)")
+    slots.add_argument("--status", choices=["available", "confirmed"], default="available")
+    slots.add_argument("--facility", action="append", help="예식장 번호 (여러 번 지정 가능)")
+    add_filters(slots)
+
+    next_open = commands.add_parser("next", help="예식장의 가장 빠른 예약 가능 슬롯")
+    next_open.add_argument("facility_number")
+    next_open.add_argument("--after", type=parse_date, default=None, help="이 날짜부터 찾기 (기본: 오늘)")
+    add_filters(next_open, facility_filters=False)
+
+    free = commands.add_parser("free", help="해당 날짜에 예약 가능한 예식장")
+    free.add_argument("date", type=parse_date, help="날짜 (YYYY-MM-DD)")
+    add_filters(free)
+
+    args = parser.parse_args()
+    if args.command == "slots":
+        try:
+            args.weekday = parse_weekdays(args.weekday)
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    index = AvailabilityIndex.load(args.json_path, args.shard_dir)
+
+    started = time.perf_counter()
+    if args.command == "slots":
+        result = index.slots(start=args.start or date.today(), end=args.end, status=args.status,
+                             weekdays=args.weekday, slots=args.slot, districts=args.district,
+                             location_types=args.location_type, min_capacity=args.min_capacity,
+                             facilities=args.facility)
+    elif args.command == "next":
+        result = index.next_open(args.facility_number, after=args.after, slots=args.slot)
+    else:
+        result = index.free_facilities(args.date, slots=args.slot, districts=args.district,
+                                       location_types=args.location_type, min_capacity=args.min_capacity)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    elif args.command == "slots":
+        for r in result:
+            weekday = WEEKDAY_NAMES[date.fromisoformat(r['reservation_date']).weekday()]
+            print(f"{r['reservation_date']}({weekday}) {r['time_slot']} {r['status']} "
+                  f"{r['district']} {r['facility_name']} (ID: {r['facility_number']})")
+    elif args.command == "next":
+        if result:
+            print(f"{result['reservation_date']} {result['time_slot']} {result['facility_name']} "
+                  f"(ID: {result['facility_number']})")
+        else:
+            print(f"예식장 {args.facility_number}: 예약 가능한 슬롯이 없습니다")
+    else:
+        for f in result:
+            print(f"ID: {f['facility_number']}, 지역: {f.get('district', '')}, 이름: {f.get('facility_name', '')}, "
+                  f"인원: {f.get('capacity', '')}, 가능 시간대: {','.join(f['available_slots'])}")
+    count = len(result) if isinstance(result, list) else int(result is not None)
+    logger.info(f"조회 결과 {count}건 ({elapsed:.3f}ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""SQLite 저장소
+
+reservations 는 (facility_number, reservation_date, time_slot) 당 현재 상태 한 행,
+reservation_history 는 슬롯 상태가 처음 관찰되거나 바뀌거나 사라질 때마다 한 행씩
+추가되는 이력이다. 한 번의 실행 결과는 crawl_runs 한 행과 함께 하나의 트랜잭션으로 저장된다.
+크롤링한 예식장과 날짜 범위 안에서 이번 결과에 없는 슬롯은 reservations 에서 지우고
+이력에 status 'disappeared' 로 남긴다.
+"""
+
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from availability import STATUSES, AvailabilityMatrix
+
+# 슬롯이 사라졌을 때 이력에 남기는 상태 (changelog 의 disappeared 와 같은 의미)
+DISAPPEARED = 'disappeared'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS facilities (
+    facility_number TEXT PRIMARY KEY,
+    district TEXT,
+    facility_name TEXT,
+    location_type TEXT,
+    capacity TEXT,
+    price TEXT,
+    url TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS reservations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    facility_number TEXT NOT NULL,
+    reservation_date DATE NOT NULL,
+    time_slot TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(facility_number, reservation_date, time_slot)
+);
+
+-- 날짜 범위 조회용 커버링 인덱스
+CREATE INDEX IF NOT EXISTS idx_reservations_date
+    ON reservations (reservation_date, status, facility_number, time_slot);
+-- 예식장별 조회용 커버링 인덱스
+CREATE INDEX IF NOT EXISTS idx_reservations_facility
+    ON reservations (facility_number, reservation_date, time_slot, status);
+
+CREATE TABLE IF NOT EXISTS crawl_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    crawled_at TIMESTAMP NOT NULL,
+    facilities INTEGER NOT NULL,
+    reservations INTEGER NOT NULL,
+    changed INTEGER NOT NULL
+);
+
+-- 상태가 처음 관찰되거나 바뀌거나 사라질 때만 추가되는 이력 (수정/삭제 없음)
+CREATE TABLE IF NOT EXISTS reservation_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES crawl_runs(id),
+    facility_number TEXT NOT NULL,
+    reservation_date DATE NOT NULL,
+    time_slot TEXT NOT NULL,
+    status TEXT NOT NULL,
+    observed_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_history_slot
+    ON reservation_history (facility_number, reservation_date, time_slot, observed_at);
+"""
+
+
+class SQLiteStore:
+    """SQLite 저장소 (WAL 모드, 일괄 upsert, 상태 이력)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def save_run(self, facilities: List[Dict], reservations: Union[Iterable[Dict], AvailabilityMatrix],
+                 crawled_at: Optional[str] = None, date_range: Optional[Tuple[str, str]] = None) -> int:
+        """한 번의 크롤링 결과를 하나의 트랜잭션으로 저장, 상태가 바뀌거나 사라진 슬롯 수 반환
+
+        reservations 는 예약 정보 이터러블이나 이미 만든 상태 행렬이다. date_range(시작일, 종료일,
+        양 끝 포함)를 주면 facilities 의 예식장 중 그 범위에서 이번 결과에 없는 슬롯을 사라진 것으로
+        처리한다. 주지 않거나 facilities 가 비어 있으면 upsert 만 한다.
+        """
+        crawled_at = crawled_at or datetime.now().isoformat()
+        # 같은 슬롯이 여러 번 나오면 하나로 합침 (confirmed 우선), 행은 행렬에서 한 건씩 꺼내 넣음
+        matrix = reservations if isinstance(reservations, AvailabilityMatrix) else AvailabilityMatrix.collect(reservations)
+        rows = ((f, d, s, STATUSES[code]) for (f, d, s), code in matrix)
+
+        with self.conn:
+            cur = self.conn.cursor()
+            if facilities:
+                cur.executemany("""
+                    INSERT INTO facilities (facility_number, district, facility_name, location_type, capacity, price, url)
+                    VALUES (:facility_number, :district, :facility_name, :location_type, :capacity, :price, :url)
+                    ON CONFLICT(facility_number) DO UPDATE SET
+                        district = excluded.district,
+                        facility_name = excluded.facility_name,
+                        location_type = excluded.location_type,
+                        capacity = excluded.capacity,
+                        price = excluded.price,
+                        url = excluded.url,
+                        updated_at = CURRENT_TIMESTAMP
+                """, facilities)
+
+            cur.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS incoming (
+                    facility_number TEXT NOT NULL,
+                    reservation_date DATE NOT NULL,
+                    time_slot TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    PRIMARY KEY (facility_number, reservation_date, time_slot)
+                )
+            """)
+            cur.execute("DELETE FROM incoming")
+            cur.executemany("INSERT INTO incoming VALUES (?, ?, ?, ?)", rows)
+
+            cur.execute("INSERT INTO crawl_runs (crawled_at, facilities, reservations, changed) VALUES (?, ?, ?, 0)",
+                        (crawled_at, len(facilities), len(matrix)))
+            run_id = cur.lastrowid
+
+            # 새 슬롯이거나 상태가 바뀐 슬롯만 이력에 추가
+            cur.execute("""
+                INSERT INTO reservation_history (run_id, facility_number, reservation_date, time_slot, status, observed_at)
+                SELECT ?, i.facility_number, i.reservation_date, i.time_slot, i.status, ?
+                FROM incoming i
+                LEFT JOIN reservations r
+                    ON r.facility_number = i.facility_number
+                   AND r.reservation_date = i.reservation_date
+                   AND r.time_slot = i.time_slot
+                WHERE r.status IS NULL OR r.status != i.status
+            """, (run_id, crawled_at))
+            changed = cur.rowcount
+            if date_range and facilities:
+                changed += self._remove_missing(cur, run_id, facilities, date_range, crawled_at)
+            cur.execute("UPDATE crawl_runs SET changed = ? WHERE id = ?", (changed, run_id))
+
+            cur.execute("""
+                INSERT INTO reservations (facility_number, reservation_date, time_slot, status)
+                SELECT facility_number, reservation_date, time_slot, status FROM incoming WHERE true
+                ON CONFLICT(facility_number, reservation_date, time_slot) DO UPDATE SET
+                    status = excluded.status,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE reservations.status != excluded.status
+            """)
+            cur.execute("DELETE FROM incoming")
+
+        return changed
+
+    @staticmethod
+    def _remove_missing(cur: sqlite3.Cursor, run_id: int, facilities: List[Dict],
+                        date_range: Tuple[str, str], crawled_at: str) -> int:
+        """크롤링 범위 안에서 incoming 에 없는 슬롯을 이력에 남기고 삭제, 사라진 슬롯 수 반환"""
+        cur.execute("CREATE TEMP TABLE IF NOT EXISTS run_facilities (facility_number TEXT PRIMARY KEY)")
+        cur.execute("DELETE FROM run_facilities")
+        cur.executemany("INSERT OR IGNORE INTO run_facilities VALUES (?)",
+                        [(f['facility_number'],) for f in facilities])
+        missing = """
+            FROM reservations r
+            WHERE r.reservation_date BETWEEN ? AND ?
+              AND r.facility_number IN (SELECT facility_number FROM run_facilities)
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.facility_number = r.facility_number
+                    AND i.reservation_date = r.reservation_date
+                    AND i.time_slot = r.time_slot
+              )
+        """
+        cur.execute(f"""
+            INSERT INTO reservation_history (run_id, facility_number, reservation_date, time_slot, status, observed_at)
+            SELECT ?, r.facility_number, r.reservation_date, r.time_slot, ?, ? {missing}
+        """, (run_id, DISAPPEARED, crawled_at, *date_range))
+        removed = cur.rowcount
+        cur.execute(f"DELETE FROM reservations WHERE id IN (SELECT r.id {missing})", date_range)
+        cur.execute("DELETE FROM run_facilities")
+        return removed
+
+    def reservations_between(self, start_date: str, end_date: str, status: Optional[str] = None) -> List[Dict]:
+        """날짜 범위(양 끝 포함)의 예약 정보 조회"""
+        query = """
+            SELECT facility_number, reservation_date, time_slot, status FROM reservations
+            WHERE reservation_date BETWEEN ? AND ?
+        """
+        params = [start_date, end_date]
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        query += " ORDER BY reservation_date, facility_number, time_slot"
+        return self._dicts(query, params)
+
+    def facility_reservations(self, facility_number: str, start_date: Optional[str] = None,
+                              end_date: Optional[str] = None) -> List[Dict]:
+        """예식장별 예약 정보 조회"""
+        query = """
+            SELECT facility_number, reservation_date, time_slot, status FROM reservations
+            WHERE facility_number = ? AND reservation_date BETWEEN ? AND ?
+            ORDER BY reservation_date, time_slot
+        """
+        return self._dicts(query, [facility_number, start_date or '0000-00-00', end_date or '9999-99-99'])
+
+    def status_history(self, facility_number: str, reservation_date: str, time_slot: str) -> List[Dict]:
+        """특정 슬롯의 상태 변경 이력"""
+        query = """
+            SELECT status, observed_at FROM reservation_history
+            WHERE facility_number = ? AND reservation_date = ? AND time_slot = ?
+            ORDER BY observed_at
+        """
+        return self._dicts(query, [facility_number, reservation_date, time_slot])
+
+    def _dicts(self, query: str, params) -> List[Dict]:
+        cur = self.conn.execute(query, params)
+        columns = [c[0] for c in cur.description]
+        return [dict(zip(columns, row)) for row in cur.fetchall()]
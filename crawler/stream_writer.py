@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+from json.encoder import encode_basestring
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+
+class NdjsonReservations:
+    """NDJSON 파일의 예약 정보를 순회할 때마다 파일에서 다시 읽는 이터러블 (목록을 메모리에 두지 않음)"""
+
+    def __init__(self, path: Path, count: int):
+        self.path = path
+        self.count = count
+
+    def __iter__(self) -> Iterator[Dict]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class NdjsonWriter:
+    """예약 정보를 한 줄에 하나씩 바로 쓰는 NDJSON 스풀
+
+    예식장 하나를 끝낼 때마다 write() 로 임시 파일에 이어 쓰고, finish() 로 쓰기를 마치면
+    임시 파일을 다시 읽는 NdjsonReservations 를 돌려준다. 출력을 모두 저장한 뒤 commit() 하면
+    path 로 교체하고, path 가 없으면(--ndjson-path 미지정) 임시 파일을 지운다. 중간에 실패하면
+    abort() 로 임시 파일을 지워 이전 파일을 유지한다.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self.tmp_path: Optional[Path] = None
+        self._file: Optional[TextIO] = None
+        self.count = 0
+
+    def _open(self):
+        if self._file is None:
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.tmp_path = self.path.with_name(self.path.name + '.tmp')
+                self._file = open(self.tmp_path, 'w', encoding='utf-8')
+            else:
+                fd, name = tempfile.mkstemp(prefix='reservations-', suffix='.ndjson')
+                self.tmp_path = Path(name)
+                self._file = os.fdopen(fd, 'w', encoding='utf-8')
+            self.count = 0
+
+    def write(self, reservations: List[Dict]):
+        self._open()
+        for r in reservations:
+            self._file.write(json.dumps(r, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+        self.count += len(reservations)
+
+    def finish(self) -> NdjsonReservations:
+        """쓰기를 마치고 지금까지 쓴 예약 정보를 읽는 이터러블 반환 (commit/abort 전까지 유효)"""
+        self._open()
+        self._file.close()
+        self._file = None
+        return NdjsonReservations(self.tmp_path, self.count)
+
+    def commit(self):
+        """임시 파일을 최종 경로로 교체 (path 가 없으면 삭제)"""
+        if self._file is not None or self.tmp_path is None:
+            self.finish()
+        if self.path:
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.remove(self.tmp_path)
+        self.tmp_path = None
+
+    def abort(self):
+        """커밋하지 않은 임시 파일 삭제"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.tmp_path is None:
+            return
+        try:
+            os.remove(self.tmp_path)
+        except FileNotFoundError:
+            pass
+        self.tmp_path = None
+
+
+# data.json 의 예약 정보 한 건 (json.dump(indent=2) 에서 배열 요소가 놓이는 깊이로 들여씀)
+_SNAPSHOT_ITEM = json.JSONEncoder(ensure_ascii=False, indent=2)
+_COMPACT = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def write_array(f: TextIO, items: Iterable, encode: Callable[[object], str], indent: Optional[str] = None) -> int:
+    """JSON 배열을 '[', 요소마다 encode(item) (쉼표로 구분), ']' 순서로 한 건씩 씀, 쓴 건수 반환
+
+    indent 는 json.dump(indent=2) 출력에서 배열이 놓인 줄의 들여쓰기이고, None 이면 한 줄로 쓴다.
+    요소 안의 줄바꿈 들여쓰기는 encode 가 맞춘다.
+    """
+    separator = ',' if indent is None else ',\n' + indent + '  '
+    count = 0
+    f.write('[')
+    for item in items:
+        if count == 0 and indent is not None:
+            f.write('\n' + indent + '  ')
+        elif count:
+            f.write(separator)
+        f.write(encode(item))
+        count += 1
+    if count and indent is not None:
+        f.write('\n' + indent)
+    f.write(']')
+    return count
+
+
+def _snapshot_item(item: Dict) -> str:
+    # 값이 모두 문자열인 dict (예약 정보 한 건) 는 indent 인코더(순수 Python) 대신 직접 이어 붙임
+    if item and all(type(k) is str and type(v) is str for k, v in item.items()):
+        return '{\n      ' + ',\n      '.join(
+            encode_basestring(k) + ': ' + encode_basestring(v) for k, v in item.items()) + '\n    }'
+    return _SNAPSHOT_ITEM.encode(item).replace('\n', '\n    ')
+
+
+def dump_snapshot(f: TextIO, crawled_at: str, facilities: List[Dict], reservations: Iterable[Dict]) -> int:
+    """data.json 을 json.dump(indent=2) 와 같은 형식으로 쓰되 예약 정보는 한 건씩 인코딩, 쓴 건수 반환"""
+    header = json.dumps({"lastCrawledAt": crawled_at, "facilities": facilities}, ensure_ascii=False, indent=2)
+    f.write(header[:-2] + ',\n  "reservations": ')
+    count = write_array(f, reservations, _snapshot_item, indent='  ')
+    f.write('\n}')
+    return count
+
+
+def dump_compact(f: TextIO, data: Dict, key: str, items: Iterable) -> int:
+    """data 를 한 줄 JSON 으로 쓰고 마지막 키 key 에 items 배열을 한 건씩 씀, 쓴 건수 반환"""
+    header = _COMPACT.encode(data)
+    f.write(header[:-1] + (',' if data else '') + _COMPACT.encode(key) + ':')
+    count = write_array(f, items, _COMPACT.encode)
+    f.write('}')
+    return count
+
+
+class SnapshotReader:
+    """JSON 객체 파일(data.json)의 reservations 배열을 한 건씩 읽는 이터러블 (파일 전체를 읽어 들이지 않음)
+
+    순회할 때마다 파일을 처음부터 읽고, reservations 외의 최상위 키는 읽은 만큼 header 에
+    담긴다 (dump_snapshot 은 reservations 를 마지막에 쓰므로 순회를 시작하면 바로 채워짐).
+    형식이 잘못되었으면 ValueError (json.JSONDecodeError) 를 낸다.
+    """
+
+    def __init__(self, path: Path, key: str = 'reservations', chunk_size: int = 1 << 16):
+        self.path = Path(path)
+        self.key = key
+        self.chunk_size = chunk_size
+        self.header: Dict = {}
+        self._decoder = json.JSONDecoder()
+
+    def __iter__(self) -> Iterator[Dict]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self._file = f
+            self._buffer = ''
+            self._pos = 0
+            self._eof = False
+            self._expect('{')
+            if self._peek() == '}':
+                return
+            while True:
+                key = self._value()
+                self._expect(':')
+                if key == self.key:
+                    yield from self._array()
+                else:
+                    self.header[key] = self._value()
+                if self._expect(',}') == '}':
+                    return
+
+    def _fill(self) -> bool:
+        """버퍼에 더 읽어 붙임 (이미 쓴 앞부분은 버림), 파일 끝이면 False"""
+        if self._eof:
+            return False
+        chunk = self._file.read(max(self.chunk_size, len(self._buffer) - self._pos))
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        self._eof = not chunk
+        return bool(chunk)
+
+    def _peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (파일 끝이면 빈 문자열)"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos:self._pos + 1]
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # 버퍼 끝에서 끝난 숫자 등은 뒤가 잘렸을 수 있으므로 더 읽어서 확인
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    def _array(self) -> Iterator:
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""순수 함수 단위 테스트 공용 설정과 합성 데이터 (네트워크 없이 실행)
+
+    cd crawler && python -m pytest tests -q
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+SLOTS = ['L', 'D', 'SLOT_3']
+DISTRICTS = ['마포구', '중구', '강동구']
+LOCATION_TYPES = ['야외(공원)', '실내']
+
+
+def make_facilities(count):
+    return [{'facility_number': str(1000 + i), 'facility_name': f'예식장 {i}',
+             'district': DISTRICTS[i % len(DISTRICTS)], 'location_type': LOCATION_TYPES[i % 2],
+             'capacity': f'{50 * (i % 5 + 1)}명'} for i in range(count)]
+
+
+def make_reservations(rng, facilities, start, days, density=0.4):
+    """슬롯마다 한 건 이하 (키가 겹치지 않음), facility → 날짜 → 슬롯 순"""
+    reservations = []
+    for facility in facilities:
+        for offset in range(days):
+            day = (start + timedelta(days=offset)).isoformat()
+            for slot in SLOTS:
+                if rng.random() < density:
+                    reservations.append({'facility_number': facility['facility_number'], 'reservation_date': day,
+                                         'time_slot': slot, 'status': rng.choice(['available', 'confirmed'])})
+    return reservations
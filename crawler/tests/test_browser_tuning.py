@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""페이지 재생성 기준 (렌더러 메모리 우선, 잴 수 없으면 이동 횟수)"""
+
+import os
+
+import browser_tuning
+
+MB = 1024 * 1024
+
+
+def test_recycle_reason_prefers_memory():
+    # 메모리를 잴 수 있으면 이동 횟수와 관계없이 메모리로만 판단
+    assert browser_tuning.recycle_reason(500, 50, 100 * MB, 512 * MB) is None
+    assert browser_tuning.recycle_reason(1, 50, 600 * MB, 512 * MB) == 'memory'
+    # 잴 수 없거나 한도가 0 이면 이동 횟수
+    assert browser_tuning.recycle_reason(50, 50, None, 512 * MB) == 'navigations'
+    assert browser_tuning.recycle_reason(50, 50, 600 * MB, 0) == 'navigations'
+    assert browser_tuning.recycle_reason(49, 50, None, 512 * MB) is None
+    assert browser_tuning.recycle_reason(500, 0, None, 512 * MB) is None
+
+
+def test_renderer_memory_sums_renderer_processes():
+    pid = os.getpid()
+    rss = browser_tuning.process_rss(pid)
+    assert rss and rss > 0
+    info = {'processInfo': [{'type': 'browser', 'id': pid, 'cpuTime': 0},
+                            {'type': 'renderer', 'id': pid, 'cpuTime': 0},
+                            {'type': 'renderer', 'id': 2 ** 22 + 1, 'cpuTime': 0}]}
+    # 읽을 수 없는 pid(이미 끝난 프로세스)는 빼고 렌더러만 더함
+    assert browser_tuning.renderer_pids(info) == [pid, 2 ** 22 + 1]
+    assert browser_tuning.renderer_memory(info) >= rss // 2
+    assert browser_tuning.renderer_memory({'processInfo': [{'type': 'renderer', 'id': 2 ** 22 + 1}]}) is None
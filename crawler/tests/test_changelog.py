@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""변경분 계산을 집합 차 기준 구현과 비교"""
+
+import json
+import random
+from datetime import date
+
+import pytest
+
+from availability import AvailabilityMatrix
+from changelog import diff_reservations, index_reservations, load_snapshot_matrix
+from conftest import make_facilities, make_reservations
+from stream_writer import dump_snapshot
+
+
+def naive_diff(previous, current):
+    before, after = index_reservations(previous), index_reservations(current)
+    return {
+        'opened': sorted(k for k, s in after.items() if s == 'available' and before.get(k) != 'available'),
+        'confirmed': sorted(k for k, s in after.items() if s == 'confirmed' and before.get(k) != 'confirmed'),
+        'disappeared': sorted(k for k in before if k not in after),
+    }
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_diff_matches_set_diff(seed):
+    rng = random.Random(seed)
+    facilities = make_facilities(6)
+    previous = make_reservations(rng, facilities[:5], date(2026, 11, 1), 40)
+    # 범위가 어긋나고 예식장 구성이 다른 새 스냅샷
+    current = make_reservations(rng, facilities[1:], date(2026, 11, 10), 40)
+    assert diff_reservations(previous, current) == naive_diff(previous, current)
+
+
+def test_diff_duplicates_and_empty():
+    r = {'facility_number': '1', 'reservation_date': '2026-11-01', 'time_slot': 'L', 'status': 'available'}
+    duplicated = [r, dict(r, status='confirmed')]
+    assert diff_reservations([r], duplicated) == naive_diff([r], duplicated)
+    assert diff_reservations([r], []) == naive_diff([r], [])
+    assert diff_reservations([], [r]) == naive_diff([], [r])
+
+
+def test_streamed_snapshot_diff(tmp_path):
+    rng = random.Random(11)
+    facilities = make_facilities(8)
+    previous = make_reservations(rng, facilities[:7], date(2026, 10, 20), 60)
+    current = make_reservations(rng, facilities[2:], date(2026, 11, 1), 60)
+    path = tmp_path / 'data.json'
+    with open(path, 'w', encoding='utf-8') as f:
+        dump_snapshot(f, '2026-10-17T00:00:00', facilities, iter(previous))
+    # json.dump(indent=2) 와 같은 바이트
+    assert path.read_text(encoding='utf-8') == json.dumps(
+        {'lastCrawledAt': '2026-10-17T00:00:00', 'facilities': facilities, 'reservations': previous},
+        ensure_ascii=False, indent=2)
+
+    header, before = load_snapshot_matrix(path)
+    assert header == {'lastCrawledAt': '2026-10-17T00:00:00', 'facilities': facilities}
+    after = AvailabilityMatrix.collect(iter(current), batch_size=50)
+    assert after.diff(before) == naive_diff(previous, current)
+
+    path.write_text('{"reservations": [', encoding='utf-8')
+    assert load_snapshot_matrix(path) is None
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""부분 결과 병합 (단일 실행과 같은 결과, 빠지거나 겹친 조각 거부)"""
+
+import random
+from datetime import date
+
+import pytest
+
+import crawl_shards
+from conftest import make_facilities, make_reservations
+
+
+def make_partials(facilities, reservations, shard_count):
+    partials = []
+    for shard_index in range(shard_count):
+        crawled = [f['facility_number'] for f in crawl_shards.select_shard(facilities, shard_index, shard_count)]
+        partials.append({
+            'format': crawl_shards.PARTIAL_FORMAT, 'shardIndex': shard_index, 'shardCount': shard_count,
+            'crawledAt': f'2026-10-17T0{shard_index}:00:00', 'facilities': facilities,
+            'crawledFacilities': crawled,
+            'reservations': [r for r in reservations if r['facility_number'] in crawled],
+        })
+    return partials
+
+
+def test_merge_partials_matches_single_run():
+    facilities = make_facilities(20)
+    reservations = make_reservations(random.Random(7), facilities, date(2026, 11, 1), 10)
+    partials = make_partials(facilities, reservations, 4)
+    merged = crawl_shards.merge_partials(list(reversed(partials)))
+    assert merged == (facilities, reservations, '2026-10-17T03:00:00')
+
+
+def test_merge_partials_rejects_overlap_and_gaps():
+    facilities = make_facilities(20)
+    partials = make_partials(facilities, [], 4)
+    with pytest.raises(crawl_shards.MergeError, match='두 번 이상'):
+        crawl_shards.merge_partials(partials + [partials[1]])
+    with pytest.raises(crawl_shards.MergeError, match='빠진 조각'):
+        crawl_shards.merge_partials(partials[:2] + partials[3:])
+    with pytest.raises(crawl_shards.MergeError, match='shardCount'):
+        crawl_shards.merge_partials(partials[:3] + make_partials(facilities, [], 5)[3:4])
+    with pytest.raises(crawl_shards.MergeError):
+        crawl_shards.merge_partials([])
+
+    # 조각이 다 있어도 자기 예식장을 크롤링하지 않았으면 실패
+    partials[2] = dict(partials[2], crawledFacilities=partials[2]['crawledFacilities'][1:])
+    with pytest.raises(crawl_shards.MergeError, match='크롤링되지 않았습니다'):
+        crawl_shards.merge_partials(partials)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""월별 샤드 인코딩/디코딩 왕복"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from availability import AvailabilityMatrix
+from changelog import index_reservations
+from conftest import make_facilities, make_reservations
+from month_shards import decode_month, encode_matrix_month, encode_month
+
+
+@pytest.mark.parametrize('month', ['2026-02', '2026-11', '2028-02'])
+def test_month_shard_round_trip(month):
+    rng = random.Random(month)
+    facilities = make_facilities(5)
+    year, mon = (int(v) for v in month.split('-'))
+    start = date(year, mon, 1)
+    days = ((start + timedelta(days=32)).replace(day=1) - start).days
+    reservations = make_reservations(rng, facilities, start, days)
+    # 같은 슬롯 중복은 confirmed 우선으로 합쳐짐
+    duplicates = [dict(r, status='confirmed') for r in rng.sample(reservations, 10)]
+
+    decoded = decode_month(encode_month(month, reservations + duplicates))
+    assert index_reservations(decoded) == index_reservations(reservations + duplicates)
+    assert len(decoded) == len(index_reservations(reservations))
+
+
+def test_month_shard_empty():
+    assert decode_month(encode_month('2026-11', [])) == []
+
+
+def test_matrix_month_matches_list_encoding():
+    rng = random.Random(5)
+    facilities = make_facilities(6)
+    reservations = make_reservations(rng, facilities, date(2026, 10, 20), 80, density=0.2)
+    # SLOT_3 이 없는 달은 샤드 슬롯에서도 빠짐
+    reservations = [r for r in reservations if r['time_slot'] != 'SLOT_3' or r['reservation_date'] < '2026-11-01']
+    matrix = AvailabilityMatrix.collect(reservations, facilities=[f['facility_number'] for f in facilities])
+    for month in ['2026-09', '2026-10', '2026-11', '2026-12', '2027-01']:
+        in_month = [r for r in reservations if r['reservation_date'].startswith(month)]
+        assert encode_matrix_month(matrix, month) == encode_month(month, in_month)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""AvailabilityIndex 조회를 리스트 컴프리헨션 기준 구현과 비교"""
+
+import argparse
+import random
+from datetime import date
+
+import pytest
+
+from conftest import SLOTS, make_facilities, make_reservations
+from query import AvailabilityIndex, parse_date
+
+
+@pytest.fixture(scope='module')
+def snapshot():
+    rng = random.Random(42)
+    facilities = make_facilities(12)
+    reservations = make_reservations(rng, facilities, date(2026, 11, 1), 60)
+    return facilities, reservations, AvailabilityIndex({'facilities': facilities, 'reservations': reservations})
+
+
+@pytest.mark.parametrize('filters', [
+    {},
+    {'status': 'confirmed'},
+    {'start': '2026-11-15', 'end': '2026-12-05'},
+    {'weekdays': [5, 6], 'slots': ['L']},
+    {'districts': ['마포구'], 'min_capacity': 150},
+    {'location_types': ['실내'], 'facilities': ['1001', '1003', '9999'], 'weekdays': [0]},
+    {'start': '2025-01-01', 'end': '2025-12-31'},
+])
+
+
+def test_slots_match_list_comprehension(snapshot, filters):
+    facilities, reservations, index = snapshot
+    by_number = {f['facility_number']: f for f in facilities}
+    order = {f['facility_number']: i for i, f in enumerate(facilities)}
+    status = filters.get('status', 'available')
+
+    def wanted(r):
+        facility = by_number[r['facility_number']]
+        day = date.fromisoformat(r['reservation_date'])
+        return (r['status'] == status
+                and ('start' not in filters or r['reservation_date'] >= filters['start'])
+                and ('end' not in filters or r['reservation_date'] <= filters['end'])
+                and ('weekdays' not in filters or day.weekday() in filters['weekdays'])
+                and ('slots' not in filters or r['time_slot'] in filters['slots'])
+                and ('districts' not in filters or facility['district'] in filters['districts'])
+                and ('location_types' not in filters or facility['location_type'] in filters['location_types'])
+                and ('min_capacity' not in filters or int(facility['capacity'][:-1]) >= filters['min_capacity'])
+                and ('facilities' not in filters or r['facility_number'] in filters['facilities']))
+
+    expected = sorted((r for r in reservations if wanted(r)),
+                      key=lambda r: (r['reservation_date'], order[r['facility_number']], SLOTS.index(r['time_slot'])))
+    found = index.slots(**filters)
+    assert [(r['facility_number'], r['reservation_date'], r['time_slot'], r['status']) for r in found] == \
+        [(r['facility_number'], r['reservation_date'], r['time_slot'], r['status']) for r in expected]
+
+
+def test_next_open_and_free_facilities(snapshot):
+    facilities, reservations, index = snapshot
+    available = [r for r in reservations if r['status'] == 'available']
+    for facility in facilities:
+        number = facility['facility_number']
+        candidates = [r for r in available if r['facility_number'] == number and r['reservation_date'] >= '2026-11-20']
+        first = min(candidates, key=lambda r: (r['reservation_date'], SLOTS.index(r['time_slot'])), default=None)
+        found = index.next_open(number, after='2026-11-20')
+        assert (found and (found['reservation_date'], found['time_slot'])) == \
+            (first and (first['reservation_date'], first['time_slot']))
+
+    on = '2026-11-21'
+    expected = {}
+    for r in available:
+        if r['reservation_date'] == on:
+            expected.setdefault(r['facility_number'], []).append(r['time_slot'])
+    assert {f['facility_number']: f['available_slots'] for f in index.free_facilities(on)} == expected
+
+
+def test_parse_date_rejects_invalid_dates():
+    assert parse_date('2026-11-14') == date(2026, 11, 14)
+    for value in ('2026-13-01', '2026/11/14', 'nope'):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_date(value)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveThrottle:
+    """토큰 버킷 + AIMD 요청 속도 조절기 (스레드 안전, 동기/async 공용)
+
+    초당 rate 개씩 채워지는 버킷에서 요청마다 토큰 하나를 쓴다. 응답이 정상이고
+    latency_target 보다 빠르면 rate 에 increase 를 더하고(additive increase),
+    429/5xx, 타임아웃, latency_target 을 넘는 응답이면 rate 에 decrease 를 곱한다
+    (multiplicative decrease). 감소는 cooldown 초에 한 번만 적용해서 동시에 실패한
+    요청들이 rate 를 한꺼번에 바닥까지 떨어뜨리지 않게 한다.
+
+    HTTP 페처, 동기 브라우저, async 페이지 풀이 같은 인스턴스를 공유한다.
+    """
+
+    def __init__(self, rate: float = 1.0, min_rate: float = 0.2, max_rate: float = 8.0, burst: int = 2,
+                 increase: float = 0.25, decrease: float = 0.5, latency_target: float = 3.0,
+                 cooldown: float = 2.0, backoff_base: float = 1.0, backoff_max: float = 30.0,
+                 seed: Optional[int] = None):
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        self.burst = max(1, burst)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = Counter()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._last_decrease = float('-inf')
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 초 반환 (토큰이 모자라면 음수로 빌려 씀)"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = max(-self._tokens / self.rate, self._paused_until - now, 0.0)
+            self.stats['requests'] += 1
+            self.stats['wait_seconds'] += wait
+            return wait
+
+    def acquire(self):
+        """요청 전에 호출 (필요하면 현재 스레드를 재움)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """요청 전에 호출 (async 버전)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record(self, latency: float, status: Optional[int] = None):
+        """응답 결과 반영 (status 를 모르면 None)"""
+        if status == 429 or (status is not None and status >= 500):
+            self._decrease(f'status_{status}')
+        elif status is not None and status >= 400:
+            # 404/403 등은 서버 부하와 무관하므로 속도를 바꾸지 않음
+            return
+        elif latency > self.latency_target:
+            self._decrease('slow')
+        else:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_failure(self, reason: str = 'error'):
+        """타임아웃, 연결 실패 등 응답을 받지 못한 요청 반영"""
+        self._decrease(reason)
+
+    def pause(self, seconds: float):
+        """Retry-After 등으로 지정된 시간 동안 모든 요청을 멈춤"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _decrease(self, reason: str):
+        with self._lock:
+            self.stats[reason] += 1
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """재시도 전 대기 초 (지수 백오프 + 지터, Retry-After 가 있으면 그 이상)"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        with self._lock:
+            delay = self._rng.uniform(delay / 2, delay)
+        if retry_after:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+    def summary(self) -> str:
+        """요청 수, 대기 시간, 감속 원인 요약"""
+        reasons = ", ".join(f"{k} {v}" for k, v in sorted(self.stats.items())
+                            if k not in ('requests', 'wait_seconds'))
+        return (f"속도 조절: 요청 {self.stats['requests']}건, 대기 합계 {self.stats['wait_seconds']:.1f}초, "
+                f"현재 {self.rate:.2f}건/초" + (f", 감속 원인: {reasons}" if reasons else ""))
@@ -1,11 +1,11 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 import { addMonths, subMonths, format } from 'date-fns';
 import Calendar from './components/Calendar';
 import HallFilter from './components/HallFilter';
 import DateFilter from './components/DateFilter';
 import ReservationModal from './components/ReservationModal';
-import { fetchData } from './api';
-import type { Facility, Reservation } from './types';
+import { fetchAggregates, fetchData, fetchManifest, fetchMonthReservations } from './api';
+import type { Aggregates, Facility, Manifest, Reservation } from './types';
 
 function App() {
   const [currentDate, setCurrentDate] = useState(new Date());
@@ -17,6 +17,13 @@ function App() {
   const [error, setError] = useState<string | null>(null);
   const [showFilter, setShowFilter] = useState(false);
 
+  // 월별 샤드 모드: manifest 가 있으면 보이는 달만 필요할 때 불러옴
+  const [manifest, setManifest] = useState<Manifest | null>(null);
+  const loadedMonthsRef = useRef<Set<string>>(new Set());
+
+  // 날짜별 예약 수 집계 (있으면 캘린더 요약 수를 예약 목록 순회 없이 표시)
+  const [aggregates, setAggregates] = useState<Aggregates | null>(null);
+
   // 날짜 범위 필터 상태
   const [dateRange, setDateRange] = useState<{ start: Date | null; end: Date | null }>({
     start: null,
@@ -37,8 +44,23 @@ function App() {
       setLoading(true);
       setError(null);
 
+      const [shardManifest, dayAggregates] = await Promise.all([fetchManifest(), fetchAggregates()]);
+      if (shardManifest) {
+        // 같은 크롤링에서 만든 집계만 사용
+        setAggregates(dayAggregates?.lastCrawledAt === shardManifest.lastCrawledAt ? dayAggregates : null);
+        loadedMonthsRef.current = new Set();
+        setReservations([]);
+        setManifest(shardManifest);
+        setFacilities(shardManifest.facilities);
+        setLastCrawledAt(shardManifest.lastCrawledAt);
+        setSelectedFacilities(shardManifest.facilities.map(f => f.facility_number));
+        return;
+      }
+
       const data = await fetchData();
 
+      setManifest(null);
+      setAggregates(dayAggregates?.lastCrawledAt === data.lastCrawledAt ? dayAggregates : null);
       setFacilities(data.facilities);
       setReservations(data.reservations);
       setLastCrawledAt(data.lastCrawledAt);
@@ -53,6 +75,35 @@ function App() {
     }
   };
 
+  // 현재 달과 앞뒤 달(캘린더에 함께 보이는 날짜) 샤드 불러오기
+  useEffect(() => {
+    if (!manifest) return;
+
+    const wanted = [subMonths(currentDate, 1), currentDate, addMonths(currentDate, 1)]
+      .map(date => format(date, 'yyyy-MM'));
+    const entries = manifest.months.filter(
+      entry => wanted.includes(entry.month) && !loadedMonthsRef.current.has(entry.month)
+    );
+    if (entries.length === 0) return;
+
+    // 새로고침(loadData)으로 Set 이 바뀌면 이전 요청 결과는 버림
+    const loaded = loadedMonthsRef.current;
+    entries.forEach(entry => loaded.add(entry.month));
+    Promise.all(entries.map(fetchMonthReservations))
+      .then(results => {
+        if (loaded !== loadedMonthsRef.current) return;
+        setReservations(prev => prev.concat(...results));
+      })
+      .catch(err => {
+        entries.forEach(entry => loaded.delete(entry.month));
+        console.error('Error loading month data:', err);
+      });
+  }, [manifest, currentDate]);
+
+  const totalReservations = manifest
+    ? manifest.months.reduce((sum, entry) => sum + entry.reservations, 0)
+    : reservations.length;
+
   const handlePreviousMonth = useCallback(() => {
     setCurrentDate(prev => subMonths(prev, 1));
   }, []);
@@ -183,7 +234,7 @@ function App() {
                 </div>
                 <div className="flex justify-between">
                   <span className="text-gray-600">전체 예약</span>
-                  <span className="font-semibold">{reservations.length}건</span>
+                  <span className="font-semibold">{totalReservations}건</span>
                 </div>
                 <div className="flex justify-between">
                   <span className="text-gray-600">선택된 예식장</span>
@@ -231,6 +282,7 @@ function App() {
               <Calendar
                 currentDate={currentDate}
                 reservations={reservations}
+                aggregates={aggregates}
                 facilities={facilities}
                 selectedFacilities={selectedFacilities}
                 dateRange={dateRange}
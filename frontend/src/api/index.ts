@@ -1,4 +1,4 @@
-import type { DataResponse } from '../types';
+import type { Aggregates, DataResponse, Manifest, MonthShard, MonthShardEntry, Reservation } from '../types';
 
 export const fetchData = async (): Promise<DataResponse> => {
   const response = await fetch(import.meta.env.BASE_URL + 'data.json');
@@ -7,3 +7,60 @@ export const fetchData = async (): Promise<DataResponse> => {
   }
   return response.json();
 };
+
+// 월별 샤드 manifest (없으면 null → data.json 사용)
+export const fetchManifest = async (): Promise<Manifest | null> => {
+  try {
+    const response = await fetch(import.meta.env.BASE_URL + 'data/manifest.json');
+    if (!response.ok) {
+      return null;
+    }
+    return (await response.json()) as Manifest;
+  } catch {
+    return null;
+  }
+};
+
+// 날짜/지역구/예식장별 집계 (없으면 null → 예약 목록에서 직접 계산)
+export const fetchAggregates = async (): Promise<Aggregates | null> => {
+  try {
+    const response = await fetch(import.meta.env.BASE_URL + 'aggregates.json');
+    if (!response.ok) {
+      return null;
+    }
+    return (await response.json()) as Aggregates;
+  } catch {
+    return null;
+  }
+};
+
+// 슬롯 인코딩 샤드를 Reservation 배열로 변환
+export const decodeMonthShard = (shard: MonthShard): Reservation[] => {
+  const reservations: Reservation[] = [];
+  const slotCount = shard.slots.length;
+
+  Object.entries(shard.facilities).forEach(([facilityNumber, row]) => {
+    for (let pos = 0; pos < row.length; pos++) {
+      const code = row[pos];
+      if (code === '.') continue;
+
+      const day = Math.floor(pos / slotCount) + 1;
+      reservations.push({
+        facility_number: facilityNumber,
+        reservation_date: `${shard.month}-${String(day).padStart(2, '0')}`,
+        time_slot: shard.slots[pos % slotCount],
+        status: shard.statuses[Number(code)],
+      });
+    }
+  });
+
+  return reservations;
+};
+
+export const fetchMonthReservations = async (entry: MonthShardEntry): Promise<Reservation[]> => {
+  const response = await fetch(import.meta.env.BASE_URL + 'data/' + entry.path);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch ${entry.month}`);
+  }
+  return decodeMonthShard(await response.json());
+};
@@ -13,11 +13,12 @@ import {
   isBefore,
   isAfter
 } from 'date-fns';
-import type { Reservation, Facility } from '../types';
+import type { Aggregates, Reservation, Facility } from '../types';
 
 interface CalendarProps {
   currentDate: Date;
   reservations: Reservation[];
+  aggregates: Aggregates | null;
   facilities: Facility[];
   selectedFacilities: string[];
   dateRange: { start: Date | null; end: Date | null };
@@ -32,9 +33,17 @@ const STATUS_COLORS: Record<string, string> = {
 
 const WEEK_DAYS = ['일', '월', '화', '수', '목', '금', '토'] as const;
 
+interface DayCounts {
+  confirmed: number;
+  available: number;
+}
+
+const sum = (values: number[]) => values.reduce((total, value) => total + value, 0);
+
 export default memo(function Calendar({
   currentDate,
   reservations,
+  aggregates,
   facilities,
   selectedFacilities,
   dateRange,
@@ -80,6 +89,52 @@ export default memo(function Calendar({
     return map;
   }, [reservations, selectedFacilitiesSet]);
 
+  // 선택이 지역구 단위(전체 선택 포함)이면 그 지역구 목록, 아니면 null
+  const selectedDistricts = useMemo(() => {
+    if (!aggregates) return null;
+    if (selectedFacilitiesSet.size === 0) return Object.keys(aggregates.districts);
+
+    const selectedByDistrict = new Map<string, number>();
+    for (const facility of facilities) {
+      if (selectedFacilitiesSet.has(facility.facility_number)) {
+        selectedByDistrict.set(facility.district, (selectedByDistrict.get(facility.district) ?? 0) + 1);
+      }
+    }
+    const districts = Array.from(selectedByDistrict.keys());
+    const whole = districts.every(
+      district => aggregates.districts[district]?.facilities === selectedByDistrict.get(district)
+    );
+    return whole ? districts : null;
+  }, [aggregates, facilities, selectedFacilitiesSet]);
+
+  // 날짜별 예약완료/예약가능 수
+  // 지역구 단위 선택이면 집계를 더하고(보이지 않은 달의 샤드 없이도 표시),
+  // 아니면 reservationsByDate 를 한 번만 훑어 계산
+  const countsByDate = useMemo(() => {
+    const map = new Map<string, DayCounts>();
+    if (aggregates && selectedDistricts) {
+      for (const district of selectedDistricts) {
+        Object.entries(aggregates.districts[district]?.days ?? {}).forEach(([dateKey, counts]) => {
+          const existing = map.get(dateKey) ?? { confirmed: 0, available: 0 };
+          existing.confirmed += sum(counts.confirmed);
+          existing.available += sum(counts.available);
+          map.set(dateKey, existing);
+        });
+      }
+      return map;
+    }
+
+    reservationsByDate.forEach((dayReservations, dateKey) => {
+      const counts = { confirmed: 0, available: 0 };
+      for (const reservation of dayReservations) {
+        if (reservation.status === 'confirmed') counts.confirmed++;
+        else if (reservation.status === 'available') counts.available++;
+      }
+      map.set(dateKey, counts);
+    });
+    return map;
+  }, [aggregates, selectedDistricts, reservationsByDate]);
+
   // 날짜가 필터 범위 내에 있는지 확인
   const isDateInRange = useCallback((date: Date) => {
     if (!dateRange.start && !dateRange.end) return true;
@@ -144,11 +199,12 @@ export default memo(function Calendar({
           const isTodayDay = isToday(day);
           const groupedReservations = groupReservationsByFacility(dayReservations);
           const inRange = isDateInRange(day);
-          const hasReservations = dayReservations.length > 0;
 
-          // 예약 상태별 카운트
-          const confirmedCount = dayReservations.filter(r => r.status === 'confirmed').length;
-          const availableCount = dayReservations.filter(r => r.status === 'available').length;
+          // 예약 상태별 카운트 (O(1) 조회)
+          const dayCounts = countsByDate.get(format(day, 'yyyy-MM-dd'));
+          const confirmedCount = dayCounts?.confirmed ?? 0;
+          const availableCount = dayCounts?.available ?? 0;
+          const hasReservations = dayReservations.length > 0 || confirmedCount + availableCount > 0;
 
           return (
             <div
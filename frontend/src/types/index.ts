@@ -21,6 +21,55 @@ export interface DataResponse {
   reservations: Reservation[];
 }
 
+// 월별 샤드 출력 (crawler --output sharded)
+export interface MonthShardEntry {
+  month: string;
+  path: string;
+  reservations: number;
+  bytes: number;
+}
+
+export interface Manifest {
+  format: string;
+  lastCrawledAt: string;
+  facilities: Facility[];
+  months: MonthShardEntry[];
+}
+
+export interface MonthShard {
+  month: string;
+  days: number;
+  slots: string[];
+  statuses: string[];
+  facilities: Record<string, string>;
+}
+
+// 날짜/지역구/예식장별 집계 (crawler --aggregates-path), 슬롯별 수는 slots 순서
+export interface SlotCounts {
+  confirmed: number[];
+  available: number[];
+}
+
+export interface DistrictAggregate extends SlotCounts {
+  facilities: number;
+  firstAvailable: string | null;
+  days: Record<string, SlotCounts>;
+}
+
+export interface FacilityAggregate extends SlotCounts {
+  firstAvailable: string | null;
+  firstAvailableBySlot: Record<string, string | null>;
+}
+
+export interface Aggregates {
+  format: string;
+  lastCrawledAt: string;
+  slots: string[];
+  days: Record<string, SlotCounts>;
+  districts: Record<string, DistrictAggregate>;
+  facilities: Record<string, FacilityAggregate>;
+}
+
 export interface CalendarDay {
   date: Date;
   reservations: Reservation[];